@@ -1,5 +1,6 @@
 from .timer.timer_app import TimerApp
 
 def main():
-	timer_app = TimerApp()
+	options = TimerApp.parse_arguments()
+	timer_app = TimerApp(options)
 	timer_app.run()
@@ -0,0 +1,198 @@
+from .clock_utils import TickScheduler
+from .display_utils import UserDisplay
+from .render_utils import FrameRenderer
+from .settings import TimerConfig
+from .system_utils import SystemUtils, TerminalUtils
+from .timer_utils import FrameTable, TimerLoop
+from .timezone_utils import ZoneClock
+import asyncio
+import os
+import signal
+import sys
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+"""
+Event-loop runtime for the Visual Countdown Timer.
+
+This module provides the AsyncTimerRuntime class, which runs the countdown display,
+keyboard input and signal handling on a single asyncio event loop. Hotkeys change
+the target minute, switch between 12-hour and 24-hour display, pause or quit,
+without restarting the timer.
+"""
+
+class AsyncTimerRuntime:
+    """
+    Runs the countdown timer on an asyncio event loop, with live hotkeys.
+
+    The process only wakes up when there is work to do: at the next wall-clock second
+    boundary (planned by TickScheduler), when a key is pressed, or when a signal arrives.
+    Hotkeys redraw the display immediately and never move the tick schedule.
+
+    Attributes:
+        countdown_minutes (int): Target minute past each hour (0-59)
+        hour_format (int): Time display format (12 or 24 hour)
+        paused (bool): Whether the display is paused.
+
+    Example:
+        >>> AsyncTimerRuntime(25, 12).run()  # Starts the countdown to X:25, with hotkeys
+    """
+
+    KEYS_TARGET_LATER = ('+', '=')
+    KEYS_TARGET_EARLIER = ('-', '_')
+    KEYS_TOGGLE_HOUR_FORMAT = ('h', 'H')
+    KEYS_PAUSE = ('p', 'P', ' ')
+    KEYS_QUIT = ('q', 'Q')
+
+    HOTKEY_HINT = '[+/-] target minute  [h] 12/24h  [p] pause  [q] quit'
+    PAUSED_TEXT = 'Paused. Press "p" to resume.'
+
+    def __init__(self, countdown_minutes: int, hour_format: int, zone_clocks: list = ()):
+        """
+        Initialize the runtime.
+
+        Args:
+            countdown_minutes (int): Target minute past each hour (0-59)
+            hour_format (int): Time display format (12 or 24 hour)
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+        """
+        self.countdown_minutes = countdown_minutes
+        self.hour_format = hour_format
+        self.zone_clocks = zone_clocks
+        self.paused = False
+        self._renderer = FrameRenderer()
+        self._scheduler = TickScheduler()
+        self._stopped = None
+        self._resumed = None
+
+    def run(self):
+        """Runs the timer until the user quits or the process receives SIGINT or SIGTERM."""
+        asyncio.run(self._main())
+        print(
+            SystemUtils.wrap_text(
+                TerminalUtils.EXIT_MESSAGE
+            )
+        )
+
+    async def _main(self):
+        """Sets up keyboard and signal handling, then runs the tick loop until stopped."""
+        loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, self._stopped.set)
+
+        keyboard_fd = sys.stdin.fileno()
+        saved_terminal_settings = self._enter_cbreak_mode(keyboard_fd)
+        if saved_terminal_settings is not None:
+            loop.add_reader(keyboard_fd, self._on_keyboard_input, keyboard_fd)
+
+        FrameTable.build()
+        self._draw()
+        tick_task = asyncio.create_task(self._tick_loop())
+        try:
+            await self._stopped.wait()
+        finally:
+            tick_task.cancel()
+            if saved_terminal_settings is not None:
+                loop.remove_reader(keyboard_fd)
+                termios.tcsetattr(keyboard_fd, termios.TCSADRAIN, saved_terminal_settings)
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signal_number)
+
+    async def _tick_loop(self):
+        """Redraws the display at every tick, sleeping in between. Idles while paused."""
+        while True:
+            await self._resumed.wait()
+            await asyncio.sleep(self._scheduler.seconds_until_next_tick())
+            if self.paused or not self._scheduler.tick_due():
+                continue
+            self._draw()
+            self._scheduler.complete_tick()
+
+    def _draw(self):
+        """Renders and draws the current frame, with the hotkey hint or pause notice below it."""
+        frame_text = TimerLoop.render_frame(
+            self.countdown_minutes,
+            self.hour_format,
+            ZoneClock.local().now(),
+            zone_clocks=self.zone_clocks
+        )
+        status_text = self.PAUSED_TEXT if self.paused else self.HOTKEY_HINT
+        self._renderer.draw(
+            frame_text + '\n' +
+            SystemUtils.wrap_text(
+                f"{UserDisplay.INDENTED_HORIZONTAL_LINE}\n{UserDisplay.INDENT}{status_text}",
+                extra_linebreaks_desired = False
+            )
+        )
+
+    def _on_keyboard_input(self, keyboard_fd: int):
+        """
+        Handles the keys available on the keyboard file descriptor.
+
+        Args:
+            keyboard_fd (int): The file descriptor to read keys from.
+        """
+        keys = os.read(keyboard_fd, 64).decode(errors='ignore')
+        if not keys:
+            # End of input: stop listening, but keep the countdown running.
+            asyncio.get_running_loop().remove_reader(keyboard_fd)
+            return
+        for key in keys:
+            self.handle_key(key)
+
+    def handle_key(self, key: str):
+        """
+        Applies one hotkey and redraws the display if anything changed.
+
+        Args:
+            key (str): The key that was pressed.
+        """
+        if key in self.KEYS_QUIT:
+            self._stopped.set()
+            return
+        if key in self.KEYS_TARGET_LATER + self.KEYS_TARGET_EARLIER and not isinstance(self.countdown_minutes, int):
+            # Schedules are not a single minute that can be moved.
+            return
+        if key in self.KEYS_TARGET_LATER:
+            self.countdown_minutes = (self.countdown_minutes + 1) % (TimerConfig.MAX_MINUTES + 1)
+        elif key in self.KEYS_TARGET_EARLIER:
+            self.countdown_minutes = (self.countdown_minutes - 1) % (TimerConfig.MAX_MINUTES + 1)
+        elif key in self.KEYS_TOGGLE_HOUR_FORMAT:
+            self.hour_format = 24 if self.hour_format == 12 else 12
+        elif key in self.KEYS_PAUSE:
+            self.paused = not self.paused
+            if self.paused:
+                self._resumed.clear()
+            else:
+                self._scheduler.reset()
+                self._resumed.set()
+        else:
+            return
+        self._draw()
+
+    @staticmethod
+    def _enter_cbreak_mode(keyboard_fd: int):
+        """
+        Switches the terminal to cbreak mode, so single key presses can be read without Enter.
+
+        Ctrl+C still sends SIGINT in cbreak mode.
+
+        Args:
+            keyboard_fd (int): The file descriptor of the keyboard.
+        Returns:
+            saved_terminal_settings (list): The previous terminal settings, or None if the
+                input is not a terminal (or the platform has no termios).
+        """
+        if termios is None or not os.isatty(keyboard_fd):
+            return None
+        saved_terminal_settings = termios.tcgetattr(keyboard_fd)
+        tty.setcbreak(keyboard_fd)
+        return saved_terminal_settings
@@ -0,0 +1,99 @@
+from .settings import DisplaySettings
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+"""
+Vectorized time calculations for the Visual Countdown Timer.
+
+This module provides the BatchCalculate class, which performs the same calculations as
+timer_utils.Calculate and display_utils.ProgressBar on whole NumPy arrays of timestamps
+at once, for reporting and capacity planning over millions of (timestamp, target minute)
+pairs. NumPy is an optional dependency, needed only by this module.
+"""
+
+class BatchCalculate:
+    """
+    Handles time calculations on arrays of integer epoch timestamps.
+
+    Results match the scalar functions exactly for timestamps in a timezone with a fixed
+    UTC offset (the same kind of timezone `datetime.now().astimezone()` produces):
+        next_countdown_occurrences() matches Calculate.next_countdown_occurrence()
+        remaining_seconds() matches Calculate.remaining_seconds()
+        progress_bar_widths() matches ProgressBar._text_width()
+    """
+
+    SECONDS_PER_HOUR = 3600
+    SECONDS_PER_MINUTE = 60
+
+    @staticmethod
+    def _require_numpy():
+        """Raises an ImportError explaining how to enable batch calculations if NumPy is missing."""
+        if numpy is None:
+            raise ImportError(
+                "Batch calculations require NumPy. Install it with: pip install numpy"
+            )
+
+    @classmethod
+    def next_countdown_occurrences(cls, timestamps, target_minutes, utc_offset_seconds: int = 0):
+        """
+        Returns, for each timestamp, the next epoch time where the local minute equals its target minute.
+
+        Args:
+            timestamps (array-like): Epoch timestamps in whole seconds.
+            target_minutes (array-like or int): Target minutes after the hour (0-59), one per
+                timestamp or a single value for all of them.
+            utc_offset_seconds (int): The UTC offset of the local timezone, in seconds.
+        Returns:
+            next_occurrences (numpy.ndarray): int64 epoch timestamps of the next occurrences.
+        """
+        cls._require_numpy()
+        timestamps = numpy.asarray(timestamps, dtype=numpy.int64)
+        target_minutes = numpy.asarray(target_minutes, dtype=numpy.int64)
+
+        local_timestamps = timestamps + utc_offset_seconds
+        seconds_into_hour = local_timestamps % cls.SECONDS_PER_HOUR
+        current_minutes = seconds_into_hour // cls.SECONDS_PER_MINUTE
+        start_of_hour = local_timestamps - seconds_into_hour
+
+        next_occurrences = start_of_hour + target_minutes * cls.SECONDS_PER_MINUTE
+        next_occurrences += numpy.where(current_minutes < target_minutes, 0, cls.SECONDS_PER_HOUR)
+        return next_occurrences - utc_offset_seconds
+
+    @classmethod
+    def remaining_seconds(cls, end_times, timestamps):
+        """
+        Calculates total remaining seconds until each end time.
+
+        Args:
+            end_times (array-like): Target end times as epoch timestamps in whole seconds.
+            timestamps (array-like): Current times as epoch timestamps in whole seconds.
+        Returns:
+            remaining_seconds (numpy.ndarray): int64 total remaining seconds.
+        """
+        cls._require_numpy()
+        return numpy.asarray(end_times, dtype=numpy.int64) - numpy.asarray(timestamps, dtype=numpy.int64)
+
+    @classmethod
+    def progress_bar_widths(cls, remaining_seconds):
+        """
+        Calculates the full and empty portions of the progress bar for each remaining time.
+
+        Uses integer arithmetic only: minutes are rounded up, then halved with Python's
+        round-half-to-even rule, so the widths are identical to ProgressBar._text_width().
+
+        Args:
+            remaining_seconds (array-like): Total remaining seconds.
+        Returns:
+            width_remaining (numpy.ndarray): int64 widths of the full portion of the progress bar.
+            width_elapsed (numpy.ndarray): int64 widths of the empty portion of the progress bar.
+        """
+        cls._require_numpy()
+        remaining_seconds = numpy.asarray(remaining_seconds, dtype=numpy.int64)
+        minutes_rounded_up = -(-remaining_seconds // cls.SECONDS_PER_MINUTE)
+        half_minutes, is_odd = numpy.divmod(minutes_rounded_up, 2)
+        width_remaining = half_minutes + (is_odd & (half_minutes % 2))
+        width_elapsed = DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL - width_remaining
+        return width_remaining, width_elapsed
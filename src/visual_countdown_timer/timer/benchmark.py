@@ -0,0 +1,819 @@
+from datetime import datetime, timedelta, timezone
+from .batch_calculate import BatchCalculate
+from .broadcast_server import FrameBroadcaster
+from .render_utils import FrameRenderer
+from .schedule_utils import Schedule
+from .shared_frame import SharedFramePublisher, SharedFrameViewer
+from .display_utils import UserDisplay
+from .system_utils import SystemUtils
+from .timer_utils import Calculate, Format, FrameTable, ProgressBar, TimerLoop
+from .timezone_utils import ZoneClock
+from .timing_wheel import CountdownWheel
+import argparse
+import json
+import os
+import platform
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+"""
+Headless benchmarks for the Visual Countdown Timer.
+
+This module drives the timer's per-tick work over synthetic timestamps, without
+sleeping or touching the terminal, and reports throughput, per-stage latency
+percentiles and the peak memory traced per frame. Results can be saved as JSON
+baselines and later runs compared against them, as long as both ran the same suite
+with the same parameters.
+
+Usage:
+    python -m visual_countdown_timer.bench --frames 20000 --save baseline.json
+    python -m visual_countdown_timer.bench --compare baseline.json --threshold 10
+"""
+
+class BenchmarkStats:
+    """Summarizes latency samples collected by a benchmark suite."""
+
+    @staticmethod
+    def percentile(sorted_samples: list, fraction: float) -> int:
+        """
+        Returns a percentile of already sorted samples, using the nearest-rank method.
+
+        Args:
+            sorted_samples (list): Latency samples in ascending order.
+            fraction (float): The percentile to return, between 0 and 1.
+        Returns:
+            sample (int): The sample at that percentile.
+        """
+        rank = max(round(fraction * len(sorted_samples)) - 1, 0)
+        return sorted_samples[min(rank, len(sorted_samples) - 1)]
+
+    @classmethod
+    def summarize(cls, samples_ns: list) -> dict:
+        """
+        Summarizes the latency samples of one stage.
+
+        Args:
+            samples_ns (list): Latency samples in nanoseconds.
+        Returns:
+            summary (dict): The sample count, p50, p99 and mean latency, and operations per second.
+        """
+        sorted_samples = sorted(samples_ns)
+        mean_ns = sum(sorted_samples) / len(sorted_samples)
+        return {
+            'count': len(sorted_samples),
+            'p50_ns': cls.percentile(sorted_samples, 0.50),
+            'p99_ns': cls.percentile(sorted_samples, 0.99),
+            'mean_ns': round(mean_ns, 1),
+            'ops_per_sec': round(1_000_000_000 / mean_ns, 1) if mean_ns else None,
+        }
+
+
+class RenderBenchmark:
+    """
+    Benchmarks the per-tick rendering pipeline used by TimerLoop.run.
+
+    Each synthetic frame goes through the same stages as a real tick: calculating the
+    countdown target, formatting the date and times, formatting the time in other
+    timezones (through their ZoneClocks), rendering the remaining time and progress bar,
+    assembling the display and wrapping it to the terminal width.
+    """
+
+    NAME = 'render'
+    STAGES = ('calculate', 'format', 'zones', 'fragments', 'display', 'wrap')
+    PARAMETERS = ('target_minute', 'hour_format', 'no_frame_table', 'zones')
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """Adds the options specific to this suite."""
+        parser.add_argument('--target-minute', type=int, default=25,
+                            help='Minute past the hour to count down to (default: 25).')
+        parser.add_argument('--hour-format', type=int, choices=(12, 24), default=12,
+                            help='Hour display format (default: 12).')
+        parser.add_argument('--no-frame-table', action='store_true',
+                            help='Render the remaining time and progress bar directly, '
+                                 'without the precomputed FrameTable.')
+        parser.add_argument('--zones', default='America/New_York,Asia/Kolkata',
+                            help='Comma-separated timezones to show the time in, or an empty string for '
+                                 'none (default: America/New_York,Asia/Kolkata).')
+
+    @classmethod
+    def run(cls, options: argparse.Namespace) -> dict:
+        """
+        Renders `options.frames` synthetic frames and times each stage.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Latency samples in nanoseconds, keyed by stage name ('total' included).
+        """
+        samples = {stage: [] for stage in cls.STAGES + ('total',)}
+        zone_clocks = cls.zone_clocks(options)
+        FrameTable.build()
+        for datetime_now in cls.timestamps(options.frames):
+            stage_times = cls._render_frame(datetime_now, options, zone_clocks)
+            for stage, elapsed_ns in zip(cls.STAGES, stage_times):
+                samples[stage].append(elapsed_ns)
+            samples['total'].append(sum(stage_times))
+        return samples
+
+    @classmethod
+    def peak_traced_bytes_per_frame(cls, options: argparse.Namespace) -> float:
+        """
+        Measures how far tracemalloc's traced memory peaks above its level before each frame, averaged over frames.
+
+        This is the most memory a frame holds at once, not the number or total size of
+        its allocations: memory freed during the frame and reused does not add to it.
+        Runs separately from the timed pass, because tracing allocations slows every stage down.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            bytes_per_frame (float): The mean peak of traced bytes per frame.
+        """
+        frames = min(options.frames, 1000)
+        total_peak_bytes = 0
+        zone_clocks = cls.zone_clocks(options)
+        FrameTable.build()
+        tracemalloc.start()
+        try:
+            for datetime_now in cls.timestamps(frames):
+                tracemalloc.reset_peak()
+                baseline_bytes = tracemalloc.get_traced_memory()[0]
+                cls._render_frame(datetime_now, options, zone_clocks)
+                total_peak_bytes += tracemalloc.get_traced_memory()[1] - baseline_bytes
+        finally:
+            tracemalloc.stop()
+        return total_peak_bytes / frames
+
+    @staticmethod
+    def zone_clocks(options: argparse.Namespace) -> list:
+        """
+        Creates the ZoneClock of each timezone in `options.zones`.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            zone_clocks (list): One ZoneClock per timezone, in the order given.
+        """
+        return [ZoneClock(zone_name.strip()) for zone_name in options.zones.split(',') if zone_name.strip()]
+
+    @staticmethod
+    def timestamps(frames: int):
+        """
+        Yields one synthetic timestamp per second, starting from a fixed instant.
+
+        Args:
+            frames (int): The number of timestamps to yield.
+        """
+        start = datetime(2024, 1, 1, 9, 0, 0, 250_000, tzinfo=timezone.utc).astimezone()
+        one_second = timedelta(seconds=1)
+        for frame in range(frames):
+            yield start + frame * one_second
+
+    @staticmethod
+    def _render_frame(datetime_now: datetime, options: argparse.Namespace, zone_clocks: list) -> tuple:
+        """
+        Renders one frame the way TimerLoop.run does, timing each stage.
+
+        Args:
+            datetime_now (datetime): The synthetic current time.
+            options (argparse.Namespace): The parsed command-line options.
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+        Returns:
+            stage_times (tuple): The nanoseconds spent in each stage, in STAGES order.
+        """
+        clock = time.perf_counter_ns
+        start_ns = clock()
+
+        end_of_current_loop = Calculate.next_countdown_occurrence(options.target_minute, datetime_now)
+        total_seconds = Calculate.remaining_seconds(end_of_current_loop, datetime_now)
+        calculated_ns = clock()
+
+        current_date = Format.date(datetime_now)
+        current_time = Format.time(datetime_now, options.hour_format)
+        target_time = Format.target_time(end_of_current_loop, datetime_now, options.hour_format)
+        formatted_ns = clock()
+
+        zone_times = Format.zone_times(zone_clocks, datetime_now, options.hour_format)
+        zones_ns = clock()
+
+        if options.no_frame_table:
+            remaining_minutes, remaining_seconds = divmod(total_seconds, 60)
+            remaining_time = Format.remaining_time(remaining_minutes, remaining_seconds)
+            progress_bar_text = ProgressBar.render(total_seconds)
+        else:
+            remaining_time, progress_bar_text = FrameTable.lookup(total_seconds)
+        fragments_ns = clock()
+
+        timer_display_text = UserDisplay.show_timer_display(
+            current_date,
+            current_time,
+            target_time,
+            remaining_time,
+            progress_bar_text,
+            zone_times
+        )
+        displayed_ns = clock()
+
+        SystemUtils.wrap_text(timer_display_text)
+        wrapped_ns = clock()
+
+        return (
+            calculated_ns - start_ns,
+            formatted_ns - calculated_ns,
+            zones_ns - formatted_ns,
+            fragments_ns - zones_ns,
+            displayed_ns - fragments_ns,
+            wrapped_ns - displayed_ns,
+        )
+
+
+class WheelBenchmark:
+    """
+    Benchmarks CountdownWheel.advance with increasing numbers of targets.
+
+    Each run adds the given number of targets, spread over every minute of the hour,
+    then advances the wheel one second per tick. The p50 latency covers ticks where no
+    target fires and should stay flat as the number of targets grows.
+    """
+
+    NAME = 'wheel'
+    PARAMETERS = ('targets',)
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """Adds the options specific to this suite."""
+        parser.add_argument('--targets', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                            help='Numbers of wheel targets to benchmark (default: 1000 10000 100000).')
+
+    @staticmethod
+    def run(options: argparse.Namespace) -> dict:
+        """
+        Advances a wheel `options.frames` times for each number of targets.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Latency samples in nanoseconds, keyed by 'advance[n=<targets>]'.
+        """
+        def on_target_reached(target, occurrence):
+            pass
+
+        samples = {}
+        for target_count in options.targets:
+            timestamps = RenderBenchmark.timestamps(options.frames + 1)
+            wheel = CountdownWheel(next(timestamps))
+            for index in range(target_count):
+                wheel.add(index % 60, on_target_reached)
+
+            stage_samples = samples[f'advance[n={target_count}]'] = []
+            for datetime_now in timestamps:
+                start_ns = time.perf_counter_ns()
+                wheel.advance(datetime_now)
+                stage_samples.append(time.perf_counter_ns() - start_ns)
+        return samples
+
+
+class BatchBenchmark:
+    """
+    Compares the scalar Calculate/ProgressBar functions with their BatchCalculate equivalents.
+
+    Both sides compute the next occurrence, remaining seconds and progress-bar widths for
+    `options.frames` (timestamp, target minute) pairs. Samples are nanoseconds per pair,
+    so ops/sec is pairs per second.
+    """
+
+    NAME = 'batch'
+    PARAMETERS = ()
+    REPEATS = 5
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """This suite has no options of its own."""
+
+    @classmethod
+    def run(cls, options: argparse.Namespace) -> dict:
+        """
+        Times both implementations over the same pairs, REPEATS times each.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Nanoseconds per pair, keyed by 'scalar' and 'batch'.
+        """
+        BatchCalculate._require_numpy()
+        utc_offset_seconds = int(datetime.now().astimezone().utcoffset().total_seconds())
+        local_timezone = timezone(timedelta(seconds=utc_offset_seconds))
+        start = int(next(RenderBenchmark.timestamps(1)).timestamp())
+        timestamps = [start + 7 * pair for pair in range(options.frames)]
+        target_minutes = [pair % 60 for pair in range(options.frames)]
+        datetimes = [datetime.fromtimestamp(timestamp, local_timezone) for timestamp in timestamps]
+
+        samples = {'scalar': [], 'batch': []}
+        for _ in range(cls.REPEATS):
+            start_ns = time.perf_counter_ns()
+            for target_minute, datetime_now in zip(target_minutes, datetimes):
+                end_time = Calculate.next_countdown_occurrence(target_minute, datetime_now)
+                ProgressBar._text_width(Calculate.remaining_seconds(end_time, datetime_now))
+            samples['scalar'].append((time.perf_counter_ns() - start_ns) / options.frames)
+
+            start_ns = time.perf_counter_ns()
+            end_times = BatchCalculate.next_countdown_occurrences(timestamps, target_minutes, utc_offset_seconds)
+            BatchCalculate.progress_bar_widths(BatchCalculate.remaining_seconds(end_times, timestamps))
+            samples['batch'].append((time.perf_counter_ns() - start_ns) / options.frames)
+        return samples
+
+
+class BroadcastBenchmark:
+    """
+    Load-tests FrameBroadcaster with many local Unix socket clients.
+
+    Every tick renders one frame and publishes it to all clients. The samples cover the
+    server side only (rendering, encoding and writing to every client), so the mean
+    latency divided by the one-second tick interval is the share of a core the server
+    needs. Clients are drained between ticks, outside the timed section.
+
+    Every client takes two file descriptors, one for each end of its connection. The
+    open file limit is raised as far as the hard limit allows, and if the clients still
+    do not fit, fewer are connected and a warning says so.
+    """
+
+    NAME = 'broadcast'
+    PARAMETERS = ('target_minute', 'hour_format', 'clients')
+    FILE_DESCRIPTORS_PER_CLIENT = 2
+    FILE_DESCRIPTOR_HEADROOM = 64
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """Adds the options specific to this suite."""
+        parser.add_argument('--clients', type=int, default=1_000,
+                            help='Number of local broadcast clients (default: 1000).')
+
+    @classmethod
+    def client_limit(cls, requested_clients: int) -> int:
+        """
+        Raises the open file limit for the clients, and returns how many of them fit under it.
+
+        Args:
+            requested_clients (int): The number of clients to connect.
+        Returns:
+            clients (int): `requested_clients`, or fewer if the hard open file limit is too low.
+        """
+        if resource is None:
+            return requested_clients
+        needed = requested_clients * cls.FILE_DESCRIPTORS_PER_CLIENT + cls.FILE_DESCRIPTOR_HEADROOM
+        soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft_limit != resource.RLIM_INFINITY and soft_limit < needed:
+            soft_limit = needed if hard_limit == resource.RLIM_INFINITY else min(needed, hard_limit)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft_limit, hard_limit))
+        if soft_limit == resource.RLIM_INFINITY or soft_limit >= needed:
+            return requested_clients
+        return max((soft_limit - cls.FILE_DESCRIPTOR_HEADROOM) // cls.FILE_DESCRIPTORS_PER_CLIENT, 1)
+
+    @classmethod
+    def run(cls, options: argparse.Namespace) -> dict:
+        """
+        Publishes `options.frames` frames to `options.clients` connected clients.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Latency samples in nanoseconds, keyed by 'tick[clients=<clients>]',
+                with the number of clients actually connected.
+        """
+        client_count = cls.client_limit(options.clients)
+        if client_count < options.clients:
+            print(
+                f"Warning: the open file limit only allows {client_count} of the {options.clients} "
+                "clients; raise it with 'ulimit -n' to run them all."
+            )
+        samples = []
+        with tempfile.TemporaryDirectory() as socket_directory:
+            broadcaster = FrameBroadcaster(f"unix:{os.path.join(socket_directory, 'bench.sock')}")
+            clients = []
+            try:
+                for _ in range(client_count):
+                    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    client.connect(broadcaster.address.partition(':')[2])
+                    client.setblocking(False)
+                    clients.append(client)
+                while len(broadcaster) < client_count:
+                    broadcaster.poll(0.1)
+
+                FrameTable.build()
+                for datetime_now in RenderBenchmark.timestamps(options.frames):
+                    start_ns = time.perf_counter_ns()
+                    broadcaster.publish(
+                        TimerLoop.render_frame(options.target_minute, options.hour_format, datetime_now)
+                    )
+                    broadcaster.poll(0)
+                    samples.append(time.perf_counter_ns() - start_ns)
+                    for client in clients:
+                        try:
+                            client.recv(65536)
+                        except BlockingIOError:
+                            pass
+            finally:
+                for client in clients:
+                    client.close()
+                broadcaster.close()
+        return {f'tick[clients={client_count}]': samples}
+
+
+class SmoothBenchmark:
+    """
+    Measures the CPU cost of the smooth display mode at a given frame rate.
+
+    Frames are rendered for synthetic timestamps spaced 1/FPS seconds apart and drawn
+    by a FrameRenderer into a pseudo-terminal, so the differential redraw path is used.
+    The share of a core is the mean frame time multiplied by the frame rate.
+    """
+
+    NAME = 'smooth'
+    PARAMETERS = ('target_minute', 'hour_format', 'fps', 'milliseconds')
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """Adds the options specific to this suite."""
+        parser.add_argument('--fps', type=int, default=30,
+                            help='Frame rate of the smooth display mode (default: 30).')
+        parser.add_argument('--milliseconds', action='store_true',
+                            help='Show the remaining seconds to the millisecond.')
+
+    @staticmethod
+    def run(options: argparse.Namespace) -> dict:
+        """
+        Renders and draws `options.frames` smooth-mode frames.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Latency samples in nanoseconds, keyed by 'frame[fps=<fps>]'.
+        """
+        samples = []
+        terminal_fd, viewer_fd = os.openpty()
+        os.set_blocking(terminal_fd, False)
+        renderer = FrameRenderer(viewer_fd)
+        start = next(RenderBenchmark.timestamps(1))
+        frame_interval = timedelta(seconds=1) / options.fps
+        FrameTable.build()
+        try:
+            for frame in range(options.frames):
+                datetime_now = start + frame * frame_interval
+                start_ns = time.perf_counter_ns()
+                renderer.draw(
+                    TimerLoop.render_smooth_frame(
+                        options.target_minute, options.hour_format, datetime_now, options.milliseconds
+                    )
+                )
+                samples.append(time.perf_counter_ns() - start_ns)
+                try:
+                    os.read(terminal_fd, 65536)
+                except BlockingIOError:
+                    pass
+        finally:
+            os.close(viewer_fd)
+            os.close(terminal_fd)
+        return {f'frame[fps={options.fps}]': samples}
+
+    @staticmethod
+    def derived_metrics(stages: dict, options: argparse.Namespace) -> dict:
+        """
+        Converts the mean frame time into the share of one core used at the chosen frame rate.
+
+        Args:
+            stages (dict): The per-stage summaries.
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            metrics (dict): The core usage in percent.
+        """
+        mean_ns = stages[f'frame[fps={options.fps}]']['mean_ns']
+        return {'core_percent': round(mean_ns * options.fps / 10_000_000, 3)}
+
+
+class ScheduleBenchmark:
+    """
+    Measures how long finding the next occurrence of a compiled schedule takes.
+
+    Dense schedules fire many times a week and are looked up in the sorted minutes of
+    the week; sparse ones depend on the day of the month and use the per-year day
+    bitsets. The timestamps walk backwards in time, so the occurrence a schedule
+    remembers from the previous call never applies and every call does the full lookup.
+    The plain minute-past-the-hour calculation is measured for comparison.
+    """
+
+    NAME = 'schedule'
+    PARAMETERS = ('target_minute',)
+    DENSE_SCHEDULES = ('* * * * *', '*/15 * * * *', '0,30 9-17 * * mon-fri')
+    SPARSE_SCHEDULES = ('0 9 1 * *', '0 0 1 1 *', '0 0 29 2 *')
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """This suite has no options of its own."""
+
+    @classmethod
+    def run(cls, options: argparse.Namespace) -> dict:
+        """
+        Looks up the next occurrence `options.frames` times for each schedule.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Latency samples in nanoseconds, keyed by 'hourly' and by
+                'dense[<expression>]' or 'sparse[<expression>]'.
+        """
+        start = next(RenderBenchmark.timestamps(1))
+        datetimes = [start - timedelta(minutes=7 * frame) for frame in range(options.frames)]
+
+        samples = {'hourly': []}
+        for datetime_now in datetimes:
+            start_ns = time.perf_counter_ns()
+            Calculate.next_countdown_occurrence(options.target_minute, datetime_now)
+            samples['hourly'].append(time.perf_counter_ns() - start_ns)
+
+        for kind, expressions in (('dense', cls.DENSE_SCHEDULES), ('sparse', cls.SPARSE_SCHEDULES)):
+            for expression in expressions:
+                schedule = Schedule(expression)
+                stage_samples = samples[f'{kind}[{expression}]'] = []
+                for datetime_now in datetimes:
+                    start_ns = time.perf_counter_ns()
+                    schedule.next_occurrence(datetime_now)
+                    stage_samples.append(time.perf_counter_ns() - start_ns)
+        return samples
+
+
+class SharedFrameBenchmark:
+    """
+    Compares one timer publishing to shared memory with independent timers, for N viewers.
+
+    'independent' is the work of N separate TimerLoop processes in one tick: N frames
+    rendered and drawn. 'shared' is the work of one publisher and N attached viewers in
+    one tick: one frame rendered and published, then N frames read and drawn. Both are
+    run in this process and drawn into a pseudo-terminal, so the samples are the total
+    CPU time per tick across all processes.
+    """
+
+    NAME = 'shared'
+    PARAMETERS = ('target_minute', 'hour_format', 'viewers')
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser):
+        """Adds the options specific to this suite."""
+        parser.add_argument('--viewers', type=int, default=8,
+                            help='Number of terminals showing the timer (default: 8).')
+
+    @staticmethod
+    def run(options: argparse.Namespace) -> dict:
+        """
+        Runs `options.frames` ticks both ways.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            stages (dict): Latency samples in nanoseconds, keyed by 'independent[n=<viewers>]'
+                and 'shared[n=<viewers>]'.
+        """
+        terminal_fd, viewer_fd = os.openpty()
+        os.set_blocking(terminal_fd, False)
+        renderers = [FrameRenderer(viewer_fd) for _ in range(options.viewers)]
+        publisher = SharedFramePublisher(f'visual_countdown_timer_bench_{os.getpid()}')
+        viewers = [SharedFrameViewer(publisher.name) for _ in range(options.viewers)]
+        samples = {f'independent[n={options.viewers}]': [], f'shared[n={options.viewers}]': []}
+        FrameTable.build()
+        try:
+            for datetime_now in RenderBenchmark.timestamps(options.frames):
+                start_ns = time.perf_counter_ns()
+                for renderer in renderers:
+                    renderer.draw(TimerLoop.render_frame(options.target_minute, options.hour_format, datetime_now))
+                samples[f'independent[n={options.viewers}]'].append(time.perf_counter_ns() - start_ns)
+                SharedFrameBenchmark._drain(terminal_fd)
+
+                start_ns = time.perf_counter_ns()
+                publisher.draw(TimerLoop.render_frame(options.target_minute, options.hour_format, datetime_now))
+                for viewer, renderer in zip(viewers, renderers):
+                    frame_text = viewer.read_frame()
+                    if frame_text is not None:
+                        renderer.draw(frame_text)
+                samples[f'shared[n={options.viewers}]'].append(time.perf_counter_ns() - start_ns)
+                SharedFrameBenchmark._drain(terminal_fd)
+        finally:
+            for viewer in viewers:
+                viewer.close()
+            publisher.close()
+            os.close(viewer_fd)
+            os.close(terminal_fd)
+        return samples
+
+    @staticmethod
+    def _drain(terminal_fd: int):
+        """
+        Reads everything written to the pseudo-terminal, so drawing never blocks.
+
+        Args:
+            terminal_fd (int): The controlling side of the pseudo-terminal.
+        """
+        while True:
+            try:
+                os.read(terminal_fd, 65536)
+            except BlockingIOError:
+                return
+
+
+class BenchmarkRunner:
+    """Runs benchmark suites, prints their results and compares them with saved baselines."""
+
+    SUITES = {
+        RenderBenchmark.NAME: RenderBenchmark,
+        WheelBenchmark.NAME: WheelBenchmark,
+        SmoothBenchmark.NAME: SmoothBenchmark,
+        BatchBenchmark.NAME: BatchBenchmark,
+        BroadcastBenchmark.NAME: BroadcastBenchmark,
+        ScheduleBenchmark.NAME: ScheduleBenchmark,
+        SharedFrameBenchmark.NAME: SharedFrameBenchmark,
+    }
+
+    @classmethod
+    def parse_arguments(cls, argv: list = None) -> argparse.Namespace:
+        """
+        Parses the command-line options.
+
+        Args:
+            argv (list): The arguments to parse. Defaults to sys.argv.
+        Returns:
+            options (argparse.Namespace): The parsed options.
+        """
+        parser = argparse.ArgumentParser(
+            prog='python -m visual_countdown_timer.bench',
+            description='Headless benchmarks for the Visual Countdown Timer.'
+        )
+        parser.add_argument('--suite', choices=sorted(cls.SUITES), default=RenderBenchmark.NAME,
+                            help='Benchmark suite to run (default: render).')
+        parser.add_argument('--frames', type=int, default=10_000,
+                            help='Number of synthetic frames or ticks to run (default: 10000).')
+        parser.add_argument('--save', metavar='PATH',
+                            help='Save the results as a JSON baseline.')
+        parser.add_argument('--compare', metavar='PATH',
+                            help='Compare the results with a saved JSON baseline.')
+        parser.add_argument('--threshold', type=float, default=10.0,
+                            help='Percent slowdown against the baseline that counts as a '
+                                 'regression (default: 10).')
+        for suite in cls.SUITES.values():
+            suite.add_arguments(parser)
+        return parser.parse_args(argv)
+
+    @classmethod
+    def run(cls, options: argparse.Namespace) -> dict:
+        """
+        Runs the selected suite and summarizes its results.
+
+        Args:
+            options (argparse.Namespace): The parsed command-line options.
+        Returns:
+            results (dict): The suite name, its parameters, the environment and per-stage summaries.
+        """
+        suite = cls.SUITES[options.suite]
+        samples = suite.run(options)
+        results = {
+            'suite': options.suite,
+            'frames': options.frames,
+            'python': platform.python_version(),
+            'parameters': {name: getattr(options, name) for name in suite.PARAMETERS},
+            'stages': {stage: BenchmarkStats.summarize(stage_samples)
+                       for stage, stage_samples in samples.items() if stage_samples},
+        }
+        if hasattr(suite, 'peak_traced_bytes_per_frame'):
+            results['peak_traced_bytes_per_frame'] = round(suite.peak_traced_bytes_per_frame(options), 1)
+        if hasattr(suite, 'derived_metrics'):
+            results['derived'] = suite.derived_metrics(results['stages'], options)
+        return results
+
+    @staticmethod
+    def report(results: dict):
+        """Prints the results as a table."""
+        print(f"Suite: {results['suite']} ({results['frames']} frames, Python {results['python']})")
+        stage_width = max([24] + [len(stage) + 2 for stage in results['stages']])
+        print(f"{'stage':<{stage_width}}{'p50 (us)':>12}{'p99 (us)':>12}{'mean (us)':>12}{'ops/sec':>14}")
+        for stage, summary in results['stages'].items():
+            print(
+                f"{stage:<{stage_width}}"
+                f"{summary['p50_ns'] / 1000:>12.2f}"
+                f"{summary['p99_ns'] / 1000:>12.2f}"
+                f"{summary['mean_ns'] / 1000:>12.2f}"
+                f"{summary['ops_per_sec'] or 0:>14,.0f}"
+            )
+        if 'peak_traced_bytes_per_frame' in results:
+            print(f"Peak traced memory per frame: {results['peak_traced_bytes_per_frame']:,.0f} bytes")
+        for name, value in results.get('derived', {}).items():
+            print(f"{name}: {value}")
+
+    @staticmethod
+    def regressions(results: dict, baseline: dict, threshold_percent: float) -> list:
+        """
+        Finds the stages whose median latency got slower than the baseline by more than the threshold.
+
+        Args:
+            results (dict): The results of this run.
+            baseline (dict): The results loaded from a saved baseline.
+            threshold_percent (float): The allowed slowdown, in percent.
+        Returns:
+            regressions (list): One message per regressed stage. Empty if nothing regressed.
+        """
+        regressions = []
+        for stage, summary in results['stages'].items():
+            baseline_summary = baseline.get('stages', {}).get(stage)
+            if not baseline_summary or not baseline_summary['p50_ns']:
+                continue
+            change_percent = (summary['p50_ns'] / baseline_summary['p50_ns'] - 1) * 100
+            if change_percent > threshold_percent:
+                regressions.append(
+                    f"{stage}: p50 {baseline_summary['p50_ns']} ns -> {summary['p50_ns']} ns "
+                    f"(+{change_percent:.1f}%)"
+                )
+        return regressions
+
+    @staticmethod
+    def baseline_mismatches(results: dict, baseline: dict) -> list:
+        """
+        Finds the differences in suite and parameters that make a baseline incomparable with this run.
+
+        The number of frames may differ, since it only changes how many samples each stage has.
+
+        Args:
+            results (dict): The results of this run.
+            baseline (dict): The results loaded from a saved baseline.
+        Returns:
+            mismatches (list): One message per difference. Empty if the runs can be compared.
+        """
+        if baseline.get('suite') != results['suite']:
+            return [f"suite: {baseline.get('suite')!r} in the baseline, {results['suite']!r} now"]
+        if 'parameters' not in baseline:
+            return ['the baseline does not record its parameters; save it again']
+        return [
+            f"{name}: {baseline['parameters'].get(name)!r} in the baseline, {value!r} now"
+            for name, value in results['parameters'].items()
+            if baseline['parameters'].get(name) != value
+        ]
+
+    @staticmethod
+    def missing_stages(results: dict, baseline: dict) -> list:
+        """
+        Finds the stages of this run that the baseline has no median latency for, so cannot be compared.
+
+        Args:
+            results (dict): The results of this run.
+            baseline (dict): The results loaded from a saved baseline.
+        Returns:
+            missing_stages (list): The names of the stages that were not compared.
+        """
+        baseline_stages = baseline.get('stages', {})
+        return [
+            stage for stage in results['stages']
+            if not baseline_stages.get(stage) or not baseline_stages[stage]['p50_ns']
+        ]
+
+
+def main(argv: list = None):
+    """
+    Runs the benchmark command line.
+
+    Exits with status 1 if a regression was found, and with status 2 if the baseline was
+    recorded with another suite or other parameters.
+    """
+    options = BenchmarkRunner.parse_arguments(argv)
+    results = BenchmarkRunner.run(options)
+    BenchmarkRunner.report(results)
+
+    if options.save:
+        with open(options.save, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Saved baseline to {options.save}")
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        mismatches = BenchmarkRunner.baseline_mismatches(results, baseline)
+        if mismatches:
+            print(f"Error: {options.compare} was recorded with a different suite or parameters, so it cannot be compared:")
+            for mismatch in mismatches:
+                print(f"  {mismatch}")
+            sys.exit(2)
+        missing_stages = BenchmarkRunner.missing_stages(results, baseline)
+        if missing_stages:
+            print(f"Warning: {options.compare} has no results for these stages, so they were not compared:")
+            for stage in missing_stages:
+                print(f"  {stage}")
+        regressions = BenchmarkRunner.regressions(results, baseline, options.threshold)
+        if regressions:
+            print(f"Regressions over {options.threshold}% against {options.compare}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"No regressions over {options.threshold}% against {options.compare}.")
@@ -0,0 +1,141 @@
+from .display_utils import UserDisplay
+from .settings import DisplaySettings
+
+"""
+Large-digit display for the Visual Countdown Timer.
+
+This module provides the BigDigits class, which draws the remaining time as block
+glyphs several rows tall, so the countdown can be read from across a room. Every glyph
+row is built once per size and kept in an atlas, so drawing the remaining time only
+joins prebuilt rows.
+"""
+
+class BigDigits:
+    """
+    Draws remaining times such as 24:59 with block glyphs.
+
+    Each glyph is drawn from a 3 by 5 pixel font, one row per pixel row and `scale`
+    columns per pixel. The largest scale (up to DisplaySettings.BIG_DIGIT_MAX_SCALE)
+    whose glyphs fit the terminal is used, and the rows of every glyph at that scale
+    are built once and kept in `_atlases`. The scale
+    chosen for each terminal width and shape of text ('MM:SS', 'H:MM:SS', ...) is kept
+    too, so rendering a remaining time is a few dictionary lookups and one join per row.
+
+    Example:
+        >>> print(BigDigits.remaining_time(24, 59))
+    """
+
+    GLYPH_ROWS = 5
+    PIXEL = '█'
+    # Every row of every digit has at least one pixel set, so no row of a rendered time
+    # is blank (SystemUtils.wrap_text drops blank lines).
+    FONT = {
+        '0': ('###', '# #', '# #', '# #', '###'),
+        '1': ('## ', ' # ', ' # ', ' # ', '###'),
+        '2': ('###', '  #', '###', '#  ', '###'),
+        '3': ('###', '  #', '###', '  #', '###'),
+        '4': ('# #', '# #', '###', '  #', '  #'),
+        '5': ('###', '#  ', '###', '  #', '###'),
+        '6': ('###', '#  ', '###', '# #', '###'),
+        '7': ('###', '  #', '  #', '  #', '  #'),
+        '8': ('###', '# #', '###', '# #', '###'),
+        '9': ('###', '# #', '###', '  #', '###'),
+        ':': (' ', '#', ' ', '#', ' '),
+    }
+
+    _atlases = {}
+    _scales = {}
+
+    @classmethod
+    def remaining_time(cls, remaining_minutes: int, remaining_seconds: int = None) -> str:
+        """
+        Draws the remaining time as MM:SS, or H:MM:SS when more than an hour is left.
+
+        Args:
+            remaining_minutes (int): The number of remaining minutes.
+            remaining_seconds (int): The number of remaining seconds (0-59), or None to
+                draw whole minutes only (MM, or H:MM).
+        Returns:
+            remaining_time (str): The glyph rows, separated by newlines, or None if the
+                glyphs do not fit the terminal at any scale.
+        """
+        if remaining_minutes > 60:
+            remaining_hours, remaining_minutes = divmod(remaining_minutes, 60)
+            text = f'{remaining_hours}:{remaining_minutes:02}'
+        else:
+            text = f'{remaining_minutes:02}'
+        if remaining_seconds is not None:
+            text += f':{remaining_seconds:02}'
+        return cls.render(text)
+
+    @classmethod
+    def render(cls, text: str) -> str:
+        """
+        Draws a string of digits and colons with block glyphs.
+
+        Args:
+            text (str): The digits and colons to draw.
+        Returns:
+            rendered_text (str): The glyph rows, separated by newlines, or None if the
+                glyphs do not fit the terminal at any scale.
+        """
+        terminal_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
+        shape_key = (terminal_width, DisplaySettings.BIG_DIGIT_MAX_SCALE, text.count(':'), len(text))
+        scale = cls._scales.get(shape_key)
+        if scale is None:
+            scale = cls._scales[shape_key] = cls._largest_scale(text, terminal_width)
+        if scale == 0:
+            return None
+        atlas = cls._atlases.get(scale)
+        if atlas is None:
+            atlas = cls._atlases[scale] = cls._build_atlas(scale)
+        glyphs = [atlas[character] for character in text]
+        separator = ' ' * scale
+        return '\n'.join(UserDisplay.INDENT + separator.join(row) for row in zip(*glyphs))
+
+    @classmethod
+    def width(cls, text: str, scale: int) -> int:
+        """
+        Calculates how many columns a string takes up when drawn, including the indent.
+
+        Args:
+            text (str): The digits and colons to draw.
+            scale (int): The width of one pixel, in columns.
+        Returns:
+            width (int): The width of the widest row.
+        """
+        pixels = sum(len(cls.FONT[character][0]) for character in text) + len(text) - 1
+        return DisplaySettings.INDENT_LENGTH + pixels * scale
+
+    @classmethod
+    def _largest_scale(cls, text: str, terminal_width: int) -> int:
+        """
+        Finds the largest scale at which a string fits the terminal.
+
+        Args:
+            text (str): The digits and colons to draw.
+            terminal_width (int): The width of the terminal.
+        Returns:
+            scale (int): The largest scale that fits, or 0 if none does.
+        """
+        for scale in range(DisplaySettings.BIG_DIGIT_MAX_SCALE, 0, -1):
+            if cls.width(text, scale) <= terminal_width:
+                return scale
+        return 0
+
+    @classmethod
+    def _build_atlas(cls, scale: int) -> dict:
+        """
+        Builds the rows of every glyph at one scale.
+
+        Args:
+            scale (int): The width of one pixel, in columns.
+        Returns:
+            atlas (dict): The GLYPH_ROWS rows of each glyph, keyed by character.
+        """
+        pixel = cls.PIXEL * scale
+        blank = ' ' * scale
+        return {
+            character: tuple(''.join(pixel if bit == '#' else blank for bit in row) for row in rows)
+            for character, rows in cls.FONT.items()
+        }
@@ -0,0 +1,400 @@
+from .clock_utils import TickScheduler
+from .render_utils import FrameRenderer
+from .settings import TimerConfig
+from .system_utils import SystemUtils
+from .timer_utils import FrameTable, TickPipeline
+import errno
+import os
+import selectors
+import socket
+import stat
+
+"""
+Frame broadcasting for the Visual Countdown Timer.
+
+This module provides the FrameBroadcaster class, which renders each frame once and
+sends it to any number of local clients, over a Unix socket or as Server-Sent Events
+on a localhost HTTP port. Slow clients have stale frames dropped instead of having
+them buffered without limit. When new connections cannot be accepted, for example
+because the process is out of file descriptors, the server stops listening for a tick
+instead of stopping.
+
+Clients can attach with, for example:
+    socat -u UNIX-CONNECT:/tmp/visual_countdown_timer.sock -
+    curl -N http://127.0.0.1:8765/
+"""
+
+class BroadcastClient:
+    """
+    The sending state of one connected client.
+
+    A client holds at most two frames: the one currently being written (`in_flight`)
+    and the newest frame waiting behind it (`pending`). When a new frame arrives while
+    one is already pending, the pending frame is stale and is dropped.
+
+    Attributes:
+        connection (socket.socket): The non-blocking client socket.
+        in_flight (memoryview): The unsent remainder of the frame being written, or None.
+        pending (bytes): The next frame to write once `in_flight` is done, or None.
+        awaiting_request (bool): Whether an HTTP client has not finished sending its request yet.
+        waiting_writable (bool): Whether the client is registered for write-readiness events.
+        frames_dropped (int): Number of frames dropped because the client fell behind.
+    """
+
+    __slots__ = (
+        'connection', 'in_flight', 'pending', 'awaiting_request', 'request_bytes',
+        'waiting_writable', 'frames_dropped',
+    )
+
+    def __init__(self, connection: socket.socket, awaiting_request: bool):
+        self.connection = connection
+        self.in_flight = None
+        self.pending = None
+        self.awaiting_request = awaiting_request
+        self.request_bytes = b''
+        self.waiting_writable = False
+        self.frames_dropped = 0
+
+
+class FrameBroadcaster:
+    """
+    Sends rendered timer frames to many local clients without blocking.
+
+    Supported addresses:
+        unix:PATH              Raw terminal frames over a Unix socket.
+        http:HOST:PORT         Server-Sent Events over HTTP, one 'frame' event per frame.
+        http:PORT              The same, on the loopback interface (127.0.0.1).
+
+    The HTTP server only listens beyond this computer when given a host that is not a
+    loopback address, such as http:0.0.0.0:8765. A Unix socket path is only replaced if
+    it is a stale socket, that no other server is listening on.
+
+    Attributes:
+        address (str): The address the server listens on.
+        is_http (bool): Whether clients are served Server-Sent Events over HTTP.
+        frames_dropped (int): Total number of frames dropped for slow clients.
+        accept_errors (int): Number of times accepting a new client failed.
+    """
+
+    MAX_REQUEST_BYTES = 8192
+    HTTP_RESPONSE_HEADER = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Content-Type: text/event-stream\r\n'
+        b'Cache-Control: no-cache\r\n'
+        b'Connection: keep-alive\r\n'
+        b'\r\n'
+    )
+
+    def __init__(self, address: str):
+        """
+        Starts listening on `address`.
+
+        Args:
+            address (str): 'unix:PATH', 'http:HOST:PORT' or 'http:PORT'.
+        Raises:
+            ValueError: If the address is not in one of the supported forms, or the Unix
+                socket path is in use or is not a socket.
+            OSError: If the address cannot be listened on.
+        """
+        self.address = address
+        self.frames_dropped = 0
+        self.accept_errors = 0
+        self._accepting = True
+        self._last_accept_errno = None
+        self._clients = {}
+        self._latest_frame = None
+        self._selector = selectors.DefaultSelector()
+        self._unix_path = None
+
+        scheme, _, location = address.partition(':')
+        if scheme == 'unix' and location:
+            self.is_http = False
+            self._unix_path = location
+            self._remove_stale_socket(location)
+            self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._listener.bind(location)
+        elif scheme == 'http' and location:
+            self.is_http = True
+            host, _, port = location.rpartition(':')
+            try:
+                port = int(port)
+            except ValueError:
+                raise ValueError(f"Invalid port in broadcast address: {address}")
+            # Only an explicit host listens beyond loopback; '[::1]' style IPv6 hosts are unwrapped.
+            host = host.strip('[]') or '127.0.0.1'
+            family = socket.AF_INET6 if ':' in host else socket.AF_INET
+            self._listener = socket.create_server((host, port), family=family)
+        else:
+            raise ValueError(f"Broadcast address must be 'unix:PATH', 'http:HOST:PORT' or 'http:PORT', not {address!r}")
+
+        self._listener.listen(TimerConfig.BROADCAST_LISTEN_BACKLOG)
+        self._listener.setblocking(False)
+        self._selector.register(self._listener, selectors.EVENT_READ)
+
+    @staticmethod
+    def _remove_stale_socket(path: str):
+        """
+        Removes a Unix socket left behind by a server that has stopped.
+
+        Args:
+            path (str): The socket path to listen on.
+        Raises:
+            ValueError: If something other than a socket is at `path`, or a server is
+                still listening on it.
+        """
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise ValueError(f"{path} already exists and is not a socket; refusing to replace it.")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise ValueError(f"Another server is already listening on {path}.")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def serve_forever(self, countdown_minutes, hour_format: int, zone_clocks: list = (), state_file=None):
+        """
+        Runs one tick of a TickPipeline per second and broadcasts each new frame, until interrupted.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            hour_format (int): Time display format (12 or 24 hour)
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+            state_file (StateFile): Optional state file to record every tick in.
+        """
+        pipeline = TickPipeline(countdown_minutes, hour_format, self, zone_clocks)
+        scheduler = TickScheduler(clock=pipeline.clock)
+        FrameTable.build()
+        try:
+            while True:
+                if scheduler.tick_due():
+                    self.resume_accepting()
+                    state = pipeline.tick()
+                    if state_file is not None:
+                        state_file.record_tick(pipeline.clock.time_ns(), scheduler.last_lateness_ns, state.frame_text)
+                    scheduler.complete_tick()
+                self.poll(scheduler.seconds_until_next_tick())
+        finally:
+            self.close()
+
+    def draw(self, frame_text: str, metrics=None):
+        """
+        Broadcasts a frame, so the server can be the sink of a TickPipeline.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+            metrics (TickMetrics): Unused; accepted for compatibility with OutputSink.
+        """
+        self.publish(frame_text)
+
+    def publish(self, frame_text: str):
+        """
+        Encodes a frame once and queues it for every connected client.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+        """
+        self._latest_frame = self._encode(frame_text)
+        for client in list(self._clients.values()):
+            if not client.awaiting_request:
+                self._enqueue(client, self._latest_frame)
+
+    def poll(self, timeout: float):
+        """
+        Waits up to `timeout` seconds for socket activity and handles it.
+
+        Accepts new clients, reads HTTP requests, detects disconnects, and continues
+        writing to clients that were not ready for their whole frame earlier.
+
+        Args:
+            timeout (float): The longest time to wait, in seconds.
+        """
+        for key, events in self._selector.select(timeout):
+            if key.fileobj is self._listener:
+                self._accept()
+                continue
+            client = self._clients.get(key.fd)
+            if client is None:
+                continue
+            if events & selectors.EVENT_READ:
+                self._read(client)
+            if events & selectors.EVENT_WRITE and key.fd in self._clients:
+                self._flush(client)
+
+    def resume_accepting(self):
+        """Polls the listening socket again, if that was paused after an error accepting a client."""
+        if not self._accepting:
+            self._selector.register(self._listener, selectors.EVENT_READ)
+            self._accepting = True
+
+    def close(self):
+        """Disconnects every client and stops listening."""
+        for client in list(self._clients.values()):
+            self._disconnect(client)
+        if self._accepting:
+            self._selector.unregister(self._listener)
+        self._listener.close()
+        self._selector.close()
+        if self._unix_path is not None and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+
+    def _encode(self, frame_text: str) -> bytes:
+        """
+        Encodes a frame for the wire.
+
+        Unix socket clients get a screen clear followed by the frame, so piping the socket
+        into a terminal shows the display in place. HTTP clients get one SSE 'frame' event.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+        Returns:
+            frame_bytes (bytes): The encoded frame.
+        """
+        if self.is_http:
+            data_lines = ''.join(f'data: {line}\n' for line in frame_text.split('\n'))
+            return f'event: frame\n{data_lines}\n'.encode()
+        return (FrameRenderer.CURSOR_HOME + FrameRenderer.CLEAR_SCREEN + frame_text + '\n').encode()
+
+    def _accept(self):
+        """
+        Accepts every client waiting on the listening socket.
+
+        A client that hung up before it was accepted is skipped. Any other error, such as
+        running out of file descriptors (EMFILE or ENFILE), would repeat on every poll, so
+        the listener is left alone until `resume_accepting` is called on the next tick.
+        """
+        while True:
+            try:
+                connection, _ = self._listener.accept()
+            except BlockingIOError:
+                return
+            except ConnectionAbortedError:
+                continue
+            except OSError as error:
+                self._pause_accepting(error)
+                return
+            self._last_accept_errno = None
+            connection.setblocking(False)
+            client = BroadcastClient(connection, awaiting_request=self.is_http)
+            self._clients[connection.fileno()] = client
+            self._selector.register(connection, selectors.EVENT_READ)
+            if not self.is_http and self._latest_frame is not None:
+                self._enqueue(client, self._latest_frame)
+
+    def _pause_accepting(self, error: OSError):
+        """
+        Stops polling the listening socket until `resume_accepting` is called.
+
+        The error is reported once, not on every tick it repeats for.
+
+        Args:
+            error (OSError): The error `accept()` failed with.
+        """
+        self.accept_errors += 1
+        self._selector.unregister(self._listener)
+        self._accepting = False
+        if error.errno != self._last_accept_errno:
+            self._last_accept_errno = error.errno
+            reason = errno.errorcode.get(error.errno, 'error')
+            print(
+                SystemUtils.wrap_text(
+                    f"\nWarning: could not accept a client on {self.address} ({reason}: {error.strerror}). "
+                    "Trying again on the next tick."
+                )
+            )
+
+    def _read(self, client: BroadcastClient):
+        """
+        Reads from a client: the HTTP request while one is expected, otherwise only to notice disconnects.
+
+        Args:
+            client (BroadcastClient): The client with data to read.
+        """
+        try:
+            received = client.connection.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            received = b''
+        if not received:
+            self._disconnect(client)
+            return
+        if not client.awaiting_request:
+            return
+
+        client.request_bytes += received
+        if b'\r\n\r\n' in client.request_bytes:
+            client.awaiting_request = False
+            client.request_bytes = b''
+            self._enqueue(client, self.HTTP_RESPONSE_HEADER)
+            if self._latest_frame is not None:
+                self._enqueue(client, self._latest_frame)
+        elif len(client.request_bytes) > self.MAX_REQUEST_BYTES:
+            self._disconnect(client)
+
+    def _enqueue(self, client: BroadcastClient, data: bytes):
+        """
+        Queues data for a client, dropping the previously pending frame if the client is behind.
+
+        Args:
+            client (BroadcastClient): The client to send to.
+            data (bytes): The encoded frame.
+        """
+        if client.in_flight is None:
+            client.in_flight = memoryview(data)
+            self._flush(client)
+        else:
+            if client.pending is not None:
+                client.frames_dropped += 1
+                self.frames_dropped += 1
+            client.pending = data
+
+    def _flush(self, client: BroadcastClient):
+        """
+        Writes as much queued data to a client as its socket accepts without blocking.
+
+        Args:
+            client (BroadcastClient): The client to write to.
+        """
+        while client.in_flight is not None:
+            try:
+                bytes_sent = client.connection.send(client.in_flight)
+            except BlockingIOError:
+                bytes_sent = 0
+            except OSError:
+                self._disconnect(client)
+                return
+            if bytes_sent < len(client.in_flight):
+                client.in_flight = client.in_flight[bytes_sent:]
+                if not client.waiting_writable:
+                    self._selector.modify(client.connection, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                    client.waiting_writable = True
+                return
+            client.in_flight = memoryview(client.pending) if client.pending is not None else None
+            client.pending = None
+        if client.waiting_writable:
+            self._selector.modify(client.connection, selectors.EVENT_READ)
+            client.waiting_writable = False
+
+    def _disconnect(self, client: BroadcastClient):
+        """
+        Forgets a client and closes its socket.
+
+        Args:
+            client (BroadcastClient): The client to disconnect.
+        """
+        self._clients.pop(client.connection.fileno(), None)
+        try:
+            self._selector.unregister(client.connection)
+        except (KeyError, ValueError):
+            pass
+        client.connection.close()
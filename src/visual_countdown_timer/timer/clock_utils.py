@@ -0,0 +1,342 @@
+from .settings import TimerConfig
+import ctypes
+import errno
+import os
+import sys
+import time
+
+"""
+Clocks and tick scheduling for the Visual Countdown Timer.
+
+This module provides the TickScheduler class, which decides when the timer loop
+should wake up. Deadlines are planned on the monotonic clock, so that render time
+never turns into drift, and are realigned to wall-clock second boundaries, so that
+the display changes when the clock on the wall does.
+
+The time is read, and waited for, through a clock object: SystemClock uses the real
+clocks, and VirtualClock keeps its own time, which jumps ahead whenever it is slept on,
+so the timer can be run through hours of ticks in moments.
+"""
+
+class WallClockAlarm:
+    """
+    Sleeps until a wall-clock time, waking early if the wall clock is set.
+
+    Uses a Linux timerfd on CLOCK_REALTIME, armed with an absolute deadline and
+    TFD_TIMER_CANCEL_ON_SET: the kernel wakes the sleeper when the deadline passes, or
+    as soon as the wall clock is stepped (NTP steps, manual changes, resume from
+    suspend). A long sleep therefore needs no periodic wakeups to notice clock jumps.
+
+    Example:
+        >>> alarm = WallClockAlarm.open()
+        >>> alarm.sleep_until(time.time_ns() + 60_000_000_000)
+    """
+
+    CLOCK_REALTIME = 0
+    TFD_CLOEXEC = 0o2000000
+    TFD_TIMER_ABSTIME = 1
+    TFD_TIMER_CANCEL_ON_SET = 2
+
+    class _Itimerspec(ctypes.Structure):
+        # Two struct timespec values, each (tv_sec, tv_nsec).
+        _fields_ = [('it_interval', ctypes.c_long * 2), ('it_value', ctypes.c_long * 2)]
+
+    def __init__(self, libc: ctypes.CDLL, file_descriptor: int):
+        """
+        Initialize the alarm. Use `open()` to create one.
+
+        Args:
+            libc (ctypes.CDLL): The C library providing timerfd_settime.
+            file_descriptor (int): The timerfd to arm and wait on.
+        """
+        self._libc = libc
+        self.file_descriptor = file_descriptor
+
+    @classmethod
+    def open(cls) -> 'WallClockAlarm':
+        """
+        Creates an alarm, if the system supports it.
+
+        Returns:
+            alarm (WallClockAlarm): The alarm, or None on systems without timerfd.
+        """
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            file_descriptor = libc.timerfd_create(cls.CLOCK_REALTIME, cls.TFD_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if file_descriptor < 0:
+            return None
+        return cls(libc, file_descriptor)
+
+    def sleep_until(self, wall_deadline_ns: int):
+        """
+        Sleeps until the wall clock reaches a deadline, or until the wall clock is set.
+
+        Args:
+            wall_deadline_ns (int): The wall-clock time to wake at, in nanoseconds since the epoch.
+        """
+        timer = self._Itimerspec()
+        timer.it_value[0], timer.it_value[1] = divmod(max(wall_deadline_ns, 1), 1_000_000_000)
+        flags = self.TFD_TIMER_ABSTIME | self.TFD_TIMER_CANCEL_ON_SET
+        if self._libc.timerfd_settime(self.file_descriptor, flags, ctypes.byref(timer), None) < 0:
+            error_number = ctypes.get_errno()
+            if error_number != errno.ECANCELED:
+                raise OSError(error_number, os.strerror(error_number))
+            return
+        try:
+            os.read(self.file_descriptor, 8)
+        except OSError as error:
+            if error.errno != errno.ECANCELED:
+                raise
+
+    def close(self):
+        """Closes the timerfd."""
+        os.close(self.file_descriptor)
+
+
+class SystemClock:
+    """
+    The system's wall and monotonic clocks.
+
+    Sleeps longer than one tick interval are taken on a WallClockAlarm, where the
+    system has one, so they end early when the wall clock is set and the caller can
+    react to the jump straight away. Shorter sleeps notice a jump when they end anyway.
+
+    Example:
+        >>> scheduler = TickScheduler(clock=SystemClock())
+    """
+
+    time_ns = staticmethod(time.time_ns)
+    monotonic_ns = staticmethod(time.monotonic_ns)
+
+    _alarm = None
+    _alarm_opened = False
+
+    def sleep(self, seconds: float):
+        """
+        Sleeps, waking early if the wall clock is set during a sleep longer than one tick.
+
+        Args:
+            seconds (float): How long to sleep for.
+        """
+        sleep_ns = round(seconds * 1_000_000_000)
+        if sleep_ns > TimerConfig.TICK_INTERVAL_NS:
+            if not self._alarm_opened:
+                self._alarm = WallClockAlarm.open()
+                self._alarm_opened = True
+            if self._alarm is not None:
+                self._alarm.sleep_until(self.time_ns() + sleep_ns)
+                return
+        time.sleep(seconds)
+
+    def time(self) -> float:
+        """
+        Returns the wall-clock time.
+
+        Returns:
+            timestamp (float): Seconds since the epoch.
+        """
+        return self.time_ns() / 1_000_000_000
+
+
+class VirtualClock(SystemClock):
+    """
+    A simulated clock that only moves when it is slept on or advanced.
+
+    Sleeping returns immediately, after moving the wall and monotonic clocks forward by
+    the time slept, so a loop driven by this clock runs as fast as it can render while
+    seeing the times it would have seen in real time. Like a real sleep, a simulated one
+    wakes up slightly late, by `wakeup_latency_ns`, so that ticks land just after second
+    boundaries rather than exactly on them.
+
+    Example:
+        >>> clock = VirtualClock(datetime(2026, 3, 28).astimezone().timestamp())
+        >>> clock.sleep(3600)
+        >>> clock.time_ns() - clock.start_time_ns
+        3600000100000
+    """
+
+    def __init__(self, start_timestamp: float, wakeup_latency_ns: int = TimerConfig.SIMULATED_WAKEUP_LATENCY_NS):
+        """
+        Initialize the clock.
+
+        Args:
+            start_timestamp (float): The wall-clock time to start at, in seconds since the epoch.
+            wakeup_latency_ns (int): How late each simulated sleep wakes up, in nanoseconds.
+        """
+        self.start_time_ns = round(start_timestamp * 1_000_000_000)
+        self.wakeup_latency_ns = wakeup_latency_ns
+        self._elapsed_ns = 0
+
+    def time_ns(self) -> int:
+        """Returns the simulated wall-clock time, in nanoseconds since the epoch."""
+        return self.start_time_ns + self._elapsed_ns
+
+    def monotonic_ns(self) -> int:
+        """Returns the simulated monotonic time, in nanoseconds since the clock was created."""
+        return self._elapsed_ns
+
+    def sleep(self, seconds: float):
+        """
+        Moves the clock forward instead of sleeping.
+
+        Args:
+            seconds (float): How long to sleep for.
+        """
+        self.advance(max(round(seconds * 1_000_000_000) + self.wakeup_latency_ns, 1))
+
+    def advance(self, nanoseconds: int):
+        """
+        Moves the clock forward.
+
+        Args:
+            nanoseconds (int): How far to move it.
+        """
+        self._elapsed_ns += nanoseconds
+
+
+class TickScheduler:
+    """
+    Schedules loop iterations on wall-clock interval boundaries using the monotonic clock.
+
+    Each deadline is the monotonic time at which the wall clock will next cross an
+    interval boundary. After every wakeup, the offset between the wall clock and the
+    monotonic clock is compared with the previous one. A change larger than
+    TimerConfig.CLOCK_JUMP_THRESHOLD_NS (from NTP steps, suspend/resume, manual clock
+    changes) is counted as a clock jump, and the next deadline is planned from scratch.
+
+    Attributes:
+        interval_ns (int): Length of one tick in nanoseconds.
+        ticks (int): Number of ticks completed.
+        missed_ticks (int): Number of ticks skipped because a wakeup came more than one interval late.
+        late_ticks (int): Number of ticks that woke later than TimerConfig.LATE_TICK_THRESHOLD_NS.
+        clock_jumps (int): Number of wall-clock jumps detected.
+        max_jitter_ns (int): The largest wakeup lateness seen, in nanoseconds.
+        last_lateness_ns (int): The wakeup lateness of the most recent tick, in nanoseconds.
+        total_jitter_ns (int): The sum of all wakeup lateness, in nanoseconds.
+
+    Example:
+        >>> scheduler = TickScheduler()
+        >>> while True:
+        ...     draw_frame()
+        ...     scheduler.wait_for_next_tick()
+    """
+
+    def __init__(self, interval_ns: int = TimerConfig.TICK_INTERVAL_NS, clock: SystemClock = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            interval_ns (int): Length of one tick in nanoseconds. Defaults to one second.
+            clock (SystemClock): The clock to read and sleep on. Defaults to the system's clocks.
+        """
+        self.interval_ns = interval_ns
+        self.clock = clock if clock is not None else SystemClock()
+        self.ticks = 0
+        self.missed_ticks = 0
+        self.late_ticks = 0
+        self.clock_jumps = 0
+        self.max_jitter_ns = 0
+        self.total_jitter_ns = 0
+        self.last_lateness_ns = 0
+        self._deadline_ns = None
+        self._wall_offset_ns = None
+
+    @property
+    def mean_jitter_ns(self) -> float:
+        """The average wakeup lateness, in nanoseconds."""
+        return self.total_jitter_ns / self.ticks if self.ticks else 0.0
+
+    def wait_for_next_tick(self, ticks: int = 1):
+        """
+        Sleeps until the next wall-clock interval boundary, then records the tick.
+
+        Returns early, without waiting for the boundary, if the wall clock jumps
+        while sleeping, so the caller can recompute its countdown target immediately.
+        When several boundaries are skipped, the clock's sleep still ends as soon as the
+        wall clock is set (see SystemClock.sleep), so the jump is not noticed late.
+
+        Args:
+            ticks (int): How many interval boundaries ahead to wake up. Values above 1
+                skip the boundaries in between, for loops that know nothing will change.
+        """
+        if ticks > 1:
+            self.seconds_until_next_tick()
+            self._deadline_ns += (ticks - 1) * self.interval_ns
+        while not self.tick_due():
+            self.clock.sleep(self.seconds_until_next_tick())
+        self.complete_tick()
+
+    def seconds_until_next_tick(self) -> float:
+        """
+        Returns how long to sleep before the next tick is due.
+
+        Returns:
+            seconds (float): Seconds until the next deadline, never negative.
+        """
+        if self._deadline_ns is None:
+            self._plan_next_deadline()
+        remaining_ns = self._deadline_ns - self.clock.monotonic_ns()
+        return max(remaining_ns, 0) / 1_000_000_000
+
+    def tick_due(self) -> bool:
+        """
+        Checks whether the next tick should run now.
+
+        Returns:
+            bool: True if the deadline has passed or the wall clock has jumped.
+        """
+        if self._deadline_ns is None:
+            self._plan_next_deadline()
+        if self._wall_clock_jumped():
+            self.clock_jumps += 1
+            self._deadline_ns = self.clock.monotonic_ns()
+            return True
+        if self.clock.monotonic_ns() < self._deadline_ns:
+            return False
+
+        # The monotonic and wall clocks can disagree slightly, so make sure the wall
+        # clock is really past the boundary before reporting the tick as due. Intervals
+        # shorter than the tolerance, as in the smooth display mode, use half an interval.
+        until_wall_boundary_ns = self.interval_ns - self.clock.time_ns() % self.interval_ns
+        if until_wall_boundary_ns < min(TimerConfig.EARLY_WAKEUP_TOLERANCE_NS, self.interval_ns // 2):
+            self._deadline_ns = self.clock.monotonic_ns() + until_wall_boundary_ns
+            return False
+        return True
+
+    def complete_tick(self):
+        """Records the lateness of the tick that just ran and plans the next deadline."""
+        lateness_ns = max(self.clock.monotonic_ns() - self._deadline_ns, 0)
+        self.last_lateness_ns = lateness_ns
+        self.ticks += 1
+        self.total_jitter_ns += lateness_ns
+        self.max_jitter_ns = max(self.max_jitter_ns, lateness_ns)
+        if lateness_ns > TimerConfig.LATE_TICK_THRESHOLD_NS:
+            self.late_ticks += 1
+        self.missed_ticks += lateness_ns // self.interval_ns
+        self._plan_next_deadline()
+
+    def reset(self):
+        """Forgets the current deadline, for example after the loop was paused, without counting missed ticks."""
+        self._deadline_ns = None
+
+    def _plan_next_deadline(self):
+        """Sets the deadline to the monotonic time of the next wall-clock interval boundary."""
+        monotonic_now_ns = self.clock.monotonic_ns()
+        wall_now_ns = self.clock.time_ns()
+        self._wall_offset_ns = wall_now_ns - monotonic_now_ns
+        until_wall_boundary_ns = self.interval_ns - wall_now_ns % self.interval_ns
+        self._deadline_ns = monotonic_now_ns + until_wall_boundary_ns
+
+    def _wall_clock_jumped(self) -> bool:
+        """
+        Compares the current wall-to-monotonic clock offset with the one seen when planning.
+
+        Returns:
+            bool: True if the wall clock has moved by more than TimerConfig.CLOCK_JUMP_THRESHOLD_NS.
+        """
+        wall_offset_ns = self.clock.time_ns() - self.clock.monotonic_ns()
+        return abs(wall_offset_ns - self._wall_offset_ns) > TimerConfig.CLOCK_JUMP_THRESHOLD_NS
@@ -0,0 +1,454 @@
+from .clock_utils import SystemClock, TickScheduler
+from .display_utils import UserDisplay
+from .output_sinks import OutputSinks
+from .render_utils import FrameRenderer, OutputSink
+from .settings import DisplaySettings, TimerConfig
+from .system_utils import LRUCache
+from .timer_utils import Calculate, Format, FrameTable
+from .timezone_utils import ZoneClock
+from datetime import timedelta
+import sys
+import time
+
+"""
+Multi-timer dashboard for the Visual Countdown Timer.
+
+This module provides the Dashboard class, which shows a grid of countdowns (one per
+timer definition of a roster) in one terminal. Each cell is drawn from the same
+remaining-time and progress-bar fragments as the single timer, and only the lines of
+the cells that changed are rewritten each second, so a large dashboard costs little
+more per tick than a small one.
+"""
+
+class DashboardCell:
+    """
+    One timer of a dashboard, and what was last drawn for it.
+
+    Attributes:
+        definition (TimerDefinition): The timer shown in the cell.
+        label (str): The timer's label, or its position if it has none.
+        title (str): The first line of the cell: the label, cut or padded to the cell width.
+        body (list): The other lines last drawn in the cell, or None if it has not been drawn.
+    """
+
+    __slots__ = ('definition', 'label', 'title', 'body')
+
+    def __init__(self, definition, label: str):
+        self.definition = definition
+        self.label = label
+        self.title = label
+        self.body = None
+
+
+class CellBody:
+    """
+    The lines below the title of every cell with the same target and hour format.
+
+    Attributes:
+        sampled_at (datetime): The clock sample the lines are up to date with.
+        end_of_current_loop (datetime): The time being counted down to.
+        shows_weekday (bool): Whether the target line shows the weekday.
+        fragments (tuple): The FrameTable entry the remaining-time and progress-bar lines come from.
+        target_line (str): The line naming the target time.
+        lines (list): The target, remaining-time and progress-bar lines, padded to the cell width.
+    """
+
+    __slots__ = ('sampled_at', 'end_of_current_loop', 'shows_weekday', 'fragments', 'target_line', 'lines')
+
+    def __init__(self):
+        self.sampled_at = None
+        self.end_of_current_loop = None
+        self.shows_weekday = None
+        self.fragments = None
+        self.target_line = None
+        self.lines = None
+
+
+class DashboardRenderer(OutputSink):
+    """
+    Draws a dashboard on a terminal from region updates.
+
+    The Dashboard builds the cursor moves and text of the cells that changed itself, so
+    this sink writes each update as it is, with a single `os.write` call.
+    """
+
+    def __init__(self, file_descriptor: int = None):
+        """
+        Initialize the renderer.
+
+        Args:
+            file_descriptor (int): The file descriptor to draw to. Defaults to stdout.
+        """
+        super().__init__(sys.stdout.fileno() if file_descriptor is None else file_descriptor)
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Passes a region update through unchanged.
+
+        Args:
+            frame_text (str): The cursor moves and text of the regions that changed.
+        Returns:
+            update_text (str): The same text.
+        """
+        return frame_text
+
+
+class Dashboard:
+    """
+    Shows a grid of countdowns, each with its own target, label and hour format.
+
+    The grid has as many columns as fit the terminal width, and as many rows as fit its
+    height; timers that do not fit are counted below the grid. Each second, every cell's
+    lines are compared with the ones last drawn, and on a terminal only the changed lines
+    of the changed cells are rewritten, with the cursor moved to each one. Other sinks are
+    given the whole dashboard as one frame, whenever any cell changed.
+
+    The lines of a cell only depend on its target and hour format, so they are built once
+    for all the cells that share both, and a cell is unchanged when its lines are the very
+    same list as before. The work of one tick is limited to `tick_budget_ns` of the
+    thread's CPU time (`time.thread_time_ns()`): cells not reached within the budget keep
+    their old lines, and the next tick starts with them. The budget is checked once every
+    TimerConfig.DASHBOARD_BUDGET_CHECK_CELLS cells, so a tick can overrun it by the work
+    of up to that many cells less one.
+
+    Attributes:
+        cells (list): The DashboardCell of every timer, in roster order.
+        sink (OutputSink): Where the dashboard is drawn.
+        clock (SystemClock): The clock sampled at each tick.
+        local_clock (ZoneClock): The timezone the samples are shown in.
+        tick_budget_ns (int): The CPU time one tick may spend on cells, in nanoseconds.
+        columns (int): The number of columns in the grid.
+        visible_cells (int): The number of cells that fit the terminal.
+        cells_redrawn (int): Number of times a cell was rewritten.
+        cells_deferred (int): Number of cells left for the next tick because the budget ran out.
+
+    Example:
+        >>> dashboard = Dashboard(Roster('timers.csv').definitions(), Dashboard.open_sink('auto'))
+        >>> dashboard.run()
+    """
+
+    CELL_HEIGHT = 6
+    REMAINING_TIME_LINES = 3
+    ONE_HOUR = timedelta(hours=1)
+
+    def __init__(self, definitions, sink: OutputSink, clock: SystemClock = None, local_clock: ZoneClock = None,
+                 tick_budget_ns: int = TimerConfig.DASHBOARD_TICK_BUDGET_NS):
+        """
+        Initialize the dashboard.
+
+        Args:
+            definitions (Iterable): The TimerDefinitions to show, such as `Roster.definitions()`.
+            sink (OutputSink): Where to draw the dashboard. Use `open_sink()` to get one that
+                redraws single cells on a terminal.
+            clock (SystemClock): The clock to read and sleep on. Defaults to the system's clocks.
+            local_clock (ZoneClock): The timezone to show the samples in. Defaults to the local timezone.
+            tick_budget_ns (int): The CPU time one tick may spend on cells, in nanoseconds.
+        """
+        self.cells = [
+            DashboardCell(definition, definition.label or f'Timer {position}')
+            for position, definition in enumerate(definitions, start=1)
+        ]
+        self.sink = sink
+        self.clock = clock if clock is not None else SystemClock()
+        self.local_clock = local_clock if local_clock is not None else ZoneClock.local()
+        self.tick_budget_ns = tick_budget_ns
+        self.columns = 0
+        self.visible_cells = 0
+        self.cells_redrawn = 0
+        self.cells_deferred = 0
+        self._regions = isinstance(sink, DashboardRenderer)
+        self._geometry_key = None
+        self._cell_width = 0
+        self._header_lines = []
+        self._header_key = None
+        self._bodies = {}
+        # Fitted remaining-time and progress-bar lines, by FrameTable entry. Bounded, because
+        # targets more than an hour away render a new entry every second.
+        self._fragment_lines = LRUCache(FrameTable.MAX_SECONDS + 1)
+        self._next_cell = 0
+        self._frames_dropped = sink.frames_dropped
+
+    @staticmethod
+    def open_sink(target: str = 'auto') -> OutputSink:
+        """
+        Opens an output sink for a dashboard: a DashboardRenderer if the target is a terminal.
+
+        Args:
+            target (str): The sink to open, as for `OutputSinks.open()`.
+        Returns:
+            sink (OutputSink): The opened sink.
+        Raises:
+            ValueError: If the target is not one of the supported forms.
+        """
+        sink = OutputSinks.open(target)
+        if isinstance(sink, FrameRenderer) and sink.is_terminal:
+            return DashboardRenderer(sink.file_descriptor)
+        return sink
+
+    def run(self, until: float = None):
+        """
+        Redraws the dashboard every second.
+
+        Args:
+            until (float): Optional POSIX timestamp, by `clock`, to stop at. Defaults to running forever.
+        """
+        scheduler = TickScheduler(clock=self.clock)
+        FrameTable.build()
+        while until is None or self.clock.time() < until:
+            self.tick()
+            scheduler.wait_for_next_tick()
+
+    def tick(self, timestamp: float = None) -> int:
+        """
+        Updates the cells that changed, within the tick's CPU budget, and draws them.
+
+        Args:
+            timestamp (float): The POSIX timestamp to use instead of sampling `clock`.
+        Returns:
+            cells_redrawn (int): The number of cells rewritten in this tick.
+        """
+        deadline_ns = time.thread_time_ns() + self.tick_budget_ns
+        datetime_now = self.local_clock.now(self.clock.time() if timestamp is None else timestamp)
+        updates = []
+        redraw_all = self._update_geometry() or self.sink.frames_dropped != self._frames_dropped
+        if redraw_all:
+            for cell in self.cells:
+                cell.body = None
+            self._header_key = None
+            updates.append(FrameRenderer.CURSOR_HOME + FrameRenderer.CLEAR_SCREEN)
+        header_changed = self._update_header(datetime_now, updates)
+
+        # Visit the cells round-robin, so cells left over when the budget runs out go first next time.
+        visible_cells = self.visible_cells
+        position = self._next_cell if self._next_cell < visible_cells else 0
+        cells_visited = 0
+        cells_redrawn = 0
+        while cells_visited < visible_cells:
+            cell = self.cells[position]
+            body = self._body(cell.definition, datetime_now)
+            if body is not cell.body:
+                self._update_cell(position, cell, body, updates)
+                cells_redrawn += 1
+            cells_visited += 1
+            position = position + 1 if position + 1 < visible_cells else 0
+            if cells_visited % TimerConfig.DASHBOARD_BUDGET_CHECK_CELLS == 0 and time.thread_time_ns() > deadline_ns:
+                break
+        self._next_cell = position
+        self.cells_deferred += visible_cells - cells_visited
+        self.cells_redrawn += cells_redrawn
+
+        if self._regions and updates:
+            updates.append(f'\x1b[{self._bottom_row()};1H')
+            self.sink.draw(''.join(updates))
+        elif not self._regions and (header_changed or cells_redrawn):
+            self.sink.draw(self.frame_text())
+        self._frames_dropped = self.sink.frames_dropped
+        return cells_redrawn
+
+    def frame_text(self) -> str:
+        """
+        Builds the whole dashboard as it was last drawn, as one frame.
+
+        Returns:
+            frame_text (str): The header, the grid of cells and the count of hidden timers.
+        """
+        cell_width = self._cell_width
+        gap = ' ' * DisplaySettings.DASHBOARD_CELL_GAP
+        blank_body = [' ' * cell_width] * (self.CELL_HEIGHT - 1)
+        lines = list(self._header_lines)
+        for first_cell in range(0, self.visible_cells, self.columns):
+            row_cells = self.cells[first_cell:first_cell + self.columns]
+            lines.append('')
+            lines.append(gap.join(cell.title for cell in row_cells).rstrip())
+            for line_index in range(self.CELL_HEIGHT - 1):
+                lines.append(gap.join((cell.body or blank_body)[line_index] for cell in row_cells).rstrip())
+        hidden_cells = len(self.cells) - self.visible_cells
+        if hidden_cells:
+            lines.append('')
+            lines.append(self._hidden_cells_text(hidden_cells))
+        return '\n'.join(lines)
+
+    def _update_geometry(self) -> bool:
+        """
+        Fits the grid to the terminal, if its size or the number of timers changed.
+
+        Returns:
+            changed (bool): Whether the grid changed, so everything must be redrawn.
+        """
+        terminal_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
+        terminal_height = DisplaySettings.TERMINAL_WINDOW_HEIGHT
+        geometry_key = (terminal_width, terminal_height, len(self.cells), DisplaySettings.LINE_THICKNESS)
+        if geometry_key == self._geometry_key:
+            return False
+        self._geometry_key = geometry_key
+        self._bodies.clear()
+        self._fragment_lines.clear()
+        gap_width = DisplaySettings.DASHBOARD_CELL_GAP
+        self._cell_width = max(min(DisplaySettings.LINE_THICKNESS, terminal_width), 1)
+        self.columns = max((terminal_width + gap_width) // (self._cell_width + gap_width), 1)
+        # The header, then a blank line and the cell's lines for each grid row, then the hidden count.
+        header_height = len(UserDisplay.TITLE_BLOCK.split('\n')) + 2
+        grid_rows = max((terminal_height - header_height - 2) // (self.CELL_HEIGHT + 1), 1)
+        self.visible_cells = min(len(self.cells), self.columns * grid_rows)
+        for cell in self.cells:
+            cell.title = self._fit(cell.label)
+        return True
+
+    def _update_header(self, datetime_now, updates: list) -> bool:
+        """
+        Formats the title, date and time above the grid, and queues the lines that changed.
+
+        The time is shown in the hour format of the first timer.
+
+        Args:
+            datetime_now (datetime): The current date and time.
+            updates (list): The list to append region updates to.
+        Returns:
+            changed (bool): Whether the header changed.
+        """
+        hour_format = self.cells[0].definition.hour_format if self.cells else 24
+        header_key = (datetime_now.minute, datetime_now.hour, datetime_now.day, datetime_now.tzname(), hour_format)
+        if header_key == self._header_key:
+            return False
+        header_lines = [
+            line[:DisplaySettings.TERMINAL_WINDOW_WIDTH]
+            for line in UserDisplay.TITLE_BLOCK.split('\n') + [Format.date(datetime_now), Format.time(datetime_now, hour_format)]
+        ]
+        redraw_all = self._header_key is None
+        for row, line in enumerate(header_lines, start=1):
+            if redraw_all or line != self._header_lines[row - 1]:
+                updates.append(f'\x1b[{row};1H{line}{FrameRenderer.CLEAR_TO_END_OF_LINE}')
+        self._header_lines = header_lines
+        self._header_key = header_key
+        if redraw_all and len(self.cells) > self.visible_cells:
+            hidden_row = self._bottom_row() - 1
+            updates.append(f'\x1b[{hidden_row};1H{self._hidden_cells_text(len(self.cells) - self.visible_cells)}')
+        return True
+
+    def _body(self, definition, datetime_now) -> list:
+        """
+        Returns the lines below a cell's title, reusing the previous list when nothing changed.
+
+        Args:
+            definition (TimerDefinition): The timer shown in the cell.
+            datetime_now (datetime): The current date and time.
+        Returns:
+            body (list): The target, remaining-time and progress-bar lines, padded to the cell width.
+        """
+        body_key = (definition.countdown_minutes, definition.hour_format)
+        cell_body = self._bodies.get(body_key)
+        if cell_body is None:
+            cell_body = self._bodies[body_key] = CellBody()
+        if cell_body.sampled_at != datetime_now:
+            self._update_body(cell_body, definition, datetime_now)
+        return cell_body.lines
+
+    def _update_body(self, cell_body: 'CellBody', definition, datetime_now):
+        """
+        Brings the lines shared by every cell with the same target and hour format up to date.
+
+        The target is only recalculated once it has been reached (or the clock went back),
+        and its line is only formatted again when it changed. The remaining-time and
+        progress-bar lines are fitted once per FrameTable entry.
+
+        Args:
+            cell_body (CellBody): The shared lines.
+            definition (TimerDefinition): A timer with the body's target and hour format.
+            datetime_now (datetime): The current date and time.
+        """
+        end_of_current_loop = cell_body.end_of_current_loop
+        if not (
+            end_of_current_loop is not None
+            and datetime_now.tzinfo is cell_body.sampled_at.tzinfo
+            and cell_body.sampled_at <= datetime_now < end_of_current_loop
+        ):
+            end_of_current_loop = Calculate.next_countdown_occurrence(definition.countdown_minutes, datetime_now)
+        cell_body.sampled_at = datetime_now
+        fragments = FrameTable.lookup(Calculate.remaining_seconds(end_of_current_loop, datetime_now))
+        shows_weekday = end_of_current_loop - datetime_now > self.ONE_HOUR
+        target_changed = (
+            end_of_current_loop != cell_body.end_of_current_loop or shows_weekday != cell_body.shows_weekday
+        )
+        if not target_changed and fragments == cell_body.fragments:
+            return
+
+        if target_changed:
+            target_time = Format.target_time(end_of_current_loop, datetime_now, definition.hour_format)
+            cell_body.target_line = self._fit(f'{UserDisplay.INDENT}Until {target_time}:')
+            cell_body.end_of_current_loop = end_of_current_loop
+            cell_body.shows_weekday = shows_weekday
+        fragment_lines = self._fragment_lines.get(fragments)
+        if fragment_lines is None:
+            remaining_time, progress_bar_text = fragments
+            remaining_lines = remaining_time.split('\n')[:self.REMAINING_TIME_LINES]
+            fragment_lines = [self._fit(line) for line in remaining_lines]
+            fragment_lines += [self._fit('')] * (self.REMAINING_TIME_LINES - len(remaining_lines))
+            fragment_lines.append(self._fit(f'{UserDisplay.INDENT}{progress_bar_text}'))
+            self._fragment_lines.set(fragments, fragment_lines)
+        cell_body.fragments = fragments
+        cell_body.lines = [cell_body.target_line, *fragment_lines]
+
+    def _update_cell(self, position: int, cell: DashboardCell, body: list, updates: list):
+        """
+        Records a cell's new lines and, on a terminal, queues the lines that changed.
+
+        Args:
+            position (int): The index of the cell in the grid.
+            cell (DashboardCell): The cell.
+            body (list): The cell's new lines below its title.
+            updates (list): The list to append region updates to.
+        """
+        if self._regions:
+            # Each grid row starts with a blank line, then the title, then the body.
+            grid_row, grid_column = divmod(position, self.columns)
+            top_row = len(self._header_lines) + grid_row * (self.CELL_HEIGHT + 1) + 2
+            column = grid_column * (self._cell_width + DisplaySettings.DASHBOARD_CELL_GAP) + 1
+            previous_body = cell.body
+            if previous_body is None:
+                updates.append(f'\x1b[{top_row};{column}H{cell.title}')
+                for line_index, line in enumerate(body, start=1):
+                    updates.append(f'\x1b[{top_row + line_index};{column}H{line}')
+            else:
+                # Only the changed end of each changed line is rewritten, as in FrameRenderer.
+                for line_index, (line, previous_line) in enumerate(zip(body, previous_body), start=1):
+                    if line != previous_line:
+                        offset = FrameRenderer._first_difference(line, previous_line)
+                        updates.append(f'\x1b[{top_row + line_index};{column + offset}H{line[offset:]}')
+        cell.body = body
+
+    def _bottom_row(self) -> int:
+        """
+        Finds the terminal row below the dashboard, where the cursor is left.
+
+        Returns:
+            row (int): The one-based row number.
+        """
+        grid_rows = -(-self.visible_cells // self.columns)
+        bottom_row = len(self._header_lines) + grid_rows * (self.CELL_HEIGHT + 1) + 1
+        if len(self.cells) > self.visible_cells:
+            bottom_row += 2
+        return bottom_row
+
+    def _fit(self, line: str) -> str:
+        """
+        Cuts or pads a line to exactly the cell width.
+
+        Args:
+            line (str): The line.
+        Returns:
+            fitted_line (str): The line, cut or padded with spaces.
+        """
+        return line[:self._cell_width].ljust(self._cell_width)
+
+    @staticmethod
+    def _hidden_cells_text(hidden_cells: int) -> str:
+        """
+        Describes the timers that do not fit the terminal.
+
+        Args:
+            hidden_cells (int): The number of timers not shown.
+        Returns:
+            hidden_cells_text (str): The line shown below the grid.
+        """
+        timers = 'timer does' if hidden_cells == 1 else 'timers do'
+        return f'{UserDisplay.INDENT}{hidden_cells} more {timers} not fit; enlarge the terminal to see them.'
@@ -56,7 +56,8 @@ class ProgressBar:
         """
 
         minutes_rounded_up = cls._minutes_rounded_up(remaining_time_in_seconds)
-        width_remaining = round(minutes_rounded_up / 2)
+        # Schedules can be more than an hour away; the bar stays full until the last hour.
+        width_remaining = min(round(minutes_rounded_up / 2), DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL)
         width_elapsed = DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL - width_remaining
         return width_remaining, width_elapsed
     
@@ -78,6 +79,53 @@ class ProgressBar:
         text_elapsed = '.' * width_elapsed
         return text_remaining, text_elapsed
 
+class SmoothProgressBar:
+    """
+    Handles creation of a high-resolution progress bar for the smooth display mode.
+
+    Each cell of the bar is split into eighths, drawn with Unicode eighth-block glyphs,
+    so the bar moves every few seconds instead of every two minutes. Every possible bar
+    is precomputed, so rendering one is a single list lookup.
+    """
+
+    FULL_BLOCK = '█'
+    PARTIAL_BLOCKS = ('', '▏', '▎', '▍', '▌', '▋', '▊', '▉')
+    EIGHTHS_PER_CELL = 8
+    MICROSECONDS_PER_HOUR = 3_600_000_000
+
+    _bars = []
+    _bar_width = None
+
+    @classmethod
+    def render(cls, remaining_time_in_microseconds: int) -> str:
+        """
+        Generates a visual progress bar representing remaining time, accurate to an eighth of a cell.
+
+        Args:
+            remaining_time_in_microseconds (int): The total remaining time in microseconds.
+
+        Returns:
+            text_complete (str): Visual progress bar with block and '.' characters
+        """
+        if cls._bar_width != DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL:
+            cls._build()
+        total_eighths = len(cls._bars) - 1
+        eighths_remaining = -(-remaining_time_in_microseconds * total_eighths // cls.MICROSECONDS_PER_HOUR)
+        return cls._bars[min(max(eighths_remaining, 0), total_eighths)]
+
+    @classmethod
+    def _build(cls):
+        """Precomputes the bar for every possible number of remaining eighths."""
+        bar_width = DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL
+        bars = []
+        for eighths_remaining in range(bar_width * cls.EIGHTHS_PER_CELL + 1):
+            full_cells, partial_eighths = divmod(eighths_remaining, cls.EIGHTHS_PER_CELL)
+            text_remaining = cls.FULL_BLOCK * full_cells + cls.PARTIAL_BLOCKS[partial_eighths]
+            text_elapsed = '.' * (bar_width - len(text_remaining))
+            bars.append(f'[{text_remaining}{text_elapsed}]')
+        cls._bars = bars
+        cls._bar_width = bar_width
+
 class UserDisplay:
     """Handles displaying information to the user."""
     
@@ -91,7 +139,8 @@ class UserDisplay:
     TIMER_INTRO_TEXT = (
         'Welcome to Visual Countdown Timer!\n' +
         'This timer counts down to a set number of minutes past each hour. ' +
-        'For example, if you enter \"25\", it will count down to 1:25, 2:25, etc.\n'
+        'For example, if you enter \"25\", it will count down to 1:25, 2:25, etc. ' +
+        'You can also enter a cron-style schedule, such as \"0,30 9-17 * * mon-fri\".\n'
     )
 
     TITLE_BLOCK = (
@@ -103,13 +152,14 @@ class UserDisplay:
 
     @staticmethod
     def show_timer_display(current_date, current_time, target_time, remaining_time, 
-                          progress_bar_text):
-        """Displays the main timer interface."""
+                          progress_bar_text, zone_times=''):
+        """Displays the main timer interface, with the time in any other zones below the local time."""
 
         timer_display_text = (
             f"{UserDisplay.TITLE_BLOCK}\n" +
             f"{current_date}\n" +
             f"{current_time}\n" +
+            (f"{zone_times}\n" if zone_times else '') +
             f"{UserDisplay.INDENTED_HORIZONTAL_LINE}\n" +
             f"{UserDisplay.INDENT}Countdown until {target_time}:\n" +
             f"{UserDisplay.INDENTED_HORIZONTAL_LINE}\n" +
@@ -0,0 +1,216 @@
+from .settings import TimerConfig
+import bisect
+import os
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+"""
+Per-tick instrumentation for the Visual Countdown Timer.
+
+This module provides fixed-size latency histograms and the TickMetrics class, which
+times each stage of a tick, records scheduling lateness and process context switches,
+and exports everything in the Prometheus text format.
+"""
+
+class Histogram:
+    """
+    A latency histogram with fixed bucket boundaries.
+
+    Memory use never grows: observing a value only increments one bucket counter.
+
+    Attributes:
+        bounds_ns (tuple): Upper bounds of the buckets in nanoseconds, in ascending order.
+        counts (list): Number of observations per bucket, plus a final overflow bucket.
+        sum_ns (int): Sum of all observed values, in nanoseconds.
+        count (int): Number of observations.
+    """
+
+    __slots__ = ('bounds_ns', 'counts', 'sum_ns', 'count')
+
+    def __init__(self, bounds_ns: tuple = TimerConfig.METRICS_BUCKET_BOUNDS_NS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds_ns (tuple): Upper bounds of the buckets in nanoseconds, in ascending order.
+        """
+        self.bounds_ns = bounds_ns
+        self.counts = [0] * (len(bounds_ns) + 1)
+        self.sum_ns = 0
+        self.count = 0
+
+    def observe(self, value_ns: int):
+        """
+        Records one value.
+
+        Args:
+            value_ns (int): The value to record, in nanoseconds.
+        """
+        self.counts[bisect.bisect_left(self.bounds_ns, value_ns)] += 1
+        self.sum_ns += value_ns
+        self.count += 1
+
+
+class TickMetrics:
+    """
+    Collects per-tick timings and exports them as a Prometheus text-format file.
+
+    Stages are timed with laps: start_lap() marks the start of a tick, and each call to
+    lap(stage) records the time since the previous mark under that stage's name.
+
+    Attributes:
+        export_path (str): The file the metrics are written to.
+        stages (dict): One Histogram per stage name.
+        lateness (Histogram): Scheduling lateness of each tick.
+        ticks (int): Number of ticks recorded.
+
+    Example:
+        >>> metrics = TickMetrics('/tmp/visual_countdown_timer.prom')
+        >>> TimerLoop.run(25, 12, metrics=metrics)
+    """
+
+    METRIC_PREFIX = 'visual_countdown_timer'
+
+    def __init__(self, export_path: str, export_interval_ticks: int = TimerConfig.METRICS_EXPORT_INTERVAL_TICKS):
+        """
+        Initialize empty metrics.
+
+        Args:
+            export_path (str): The file to write the metrics to.
+            export_interval_ticks (int): Write the file every this many ticks.
+        """
+        self.export_path = export_path
+        self.export_interval_ticks = export_interval_ticks
+        self.stages = {}
+        self.lateness = Histogram()
+        self.ticks = 0
+        self._lap_start_ns = 0
+        self._scheduler = None
+        self._pipeline = None
+        self._notifier = None
+
+    def start_lap(self):
+        """Marks the start of the next stage."""
+        self._lap_start_ns = time.perf_counter_ns()
+
+    def lap(self, stage: str):
+        """
+        Records the time since the last mark under `stage`, and starts the next stage.
+
+        Args:
+            stage (str): The name of the stage that just finished.
+        """
+        now_ns = time.perf_counter_ns()
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Histogram()
+        histogram.observe(now_ns - self._lap_start_ns)
+        self._lap_start_ns = now_ns
+
+    def end_tick(self, scheduler, pipeline=None, notifier=None):
+        """
+        Records the scheduling lateness of the tick that just completed, exporting if due.
+
+        Args:
+            scheduler (TickScheduler): The scheduler that woke the loop for this tick.
+            pipeline (TickPipeline): Optional pipeline whose stage run and skip counts to export.
+            notifier (Notifier): Optional notifier whose action latencies and outcomes to export.
+        """
+        self._scheduler = scheduler
+        self._pipeline = pipeline
+        self._notifier = notifier
+        self.lateness.observe(scheduler.last_lateness_ns)
+        self.ticks += 1
+        if self.ticks % self.export_interval_ticks == 0:
+            self.export()
+
+    def export(self):
+        """Writes the metrics to `export_path`, replacing the file atomically."""
+        temporary_path = f'{self.export_path}.tmp'
+        with open(temporary_path, 'w') as metrics_file:
+            metrics_file.write(self.prometheus_text())
+        os.replace(temporary_path, self.export_path)
+
+    def prometheus_text(self) -> str:
+        """
+        Formats the metrics in the Prometheus text exposition format.
+
+        Returns:
+            text (str): The formatted metrics.
+        """
+        prefix = self.METRIC_PREFIX
+        lines = [
+            f'# HELP {prefix}_stage_duration_seconds Time spent in each stage of a tick.',
+            f'# TYPE {prefix}_stage_duration_seconds histogram',
+        ]
+        for stage, histogram in self.stages.items():
+            lines.extend(self._histogram_lines(f'{prefix}_stage_duration_seconds', histogram, f'stage="{stage}",'))
+
+        lines.append(f'# HELP {prefix}_tick_lateness_seconds How late each tick woke up after its deadline.')
+        lines.append(f'# TYPE {prefix}_tick_lateness_seconds histogram')
+        lines.extend(self._histogram_lines(f'{prefix}_tick_lateness_seconds', self.lateness, ''))
+
+        counters = {'ticks_total': ('Ticks completed.', self.ticks)}
+        if self._scheduler is not None:
+            counters['missed_ticks_total'] = ('Ticks skipped because a wakeup was too late.', self._scheduler.missed_ticks)
+            counters['late_ticks_total'] = ('Ticks that woke later than the late threshold.', self._scheduler.late_ticks)
+            counters['clock_jumps_total'] = ('Wall-clock jumps detected.', self._scheduler.clock_jumps)
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            counters['voluntary_context_switches_total'] = ('Voluntary context switches (sleeps and wakeups).', usage.ru_nvcsw)
+            counters['involuntary_context_switches_total'] = ('Involuntary context switches (preemptions).', usage.ru_nivcsw)
+            counters['cpu_seconds_total'] = ('User and system CPU time.', round(usage.ru_utime + usage.ru_stime, 6))
+        for name, (help_text, value) in counters.items():
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            lines.append(f'{prefix}_{name} {value}')
+        if self._pipeline is not None:
+            stage_counters = {
+                'stage_runs_total': ('Ticks in which each stage ran.', self._pipeline.stage_runs),
+                'stage_skips_total': ('Ticks in which each stage was skipped, its inputs being unchanged.',
+                                      self._pipeline.stage_skips),
+            }
+            for name, (help_text, counts) in stage_counters.items():
+                lines.append(f'# HELP {prefix}_{name} {help_text}')
+                lines.append(f'# TYPE {prefix}_{name} counter')
+                lines.extend(f'{prefix}_{name}{{stage="{stage}"}} {count}' for stage, count in counts.items())
+        if self._notifier is not None:
+            notifier = self._notifier
+            lines.append(f'# HELP {prefix}_notification_latency_seconds Time from reaching the target to each action starting.')
+            lines.append(f'# TYPE {prefix}_notification_latency_seconds histogram')
+            for action_name, histogram in notifier.latencies.items():
+                lines.extend(self._histogram_lines(
+                    f'{prefix}_notification_latency_seconds', histogram, f'action="{action_name}",'
+                ))
+            lines.append(f'# HELP {prefix}_notification_actions_total Notification actions by outcome.')
+            lines.append(f'# TYPE {prefix}_notification_actions_total counter')
+            for outcome in ('succeeded', 'failed', 'timed_out', 'skipped'):
+                lines.append(f'{prefix}_notification_actions_total{{outcome="{outcome}"}} {getattr(notifier, outcome)}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _histogram_lines(name: str, histogram: Histogram, labels: str) -> list:
+        """
+        Formats one histogram as cumulative Prometheus bucket, sum and count samples.
+
+        Args:
+            name (str): The metric name.
+            histogram (Histogram): The histogram to format.
+            labels (str): Extra labels, each followed by a comma (e.g. 'stage="format",').
+        Returns:
+            lines (list): The formatted sample lines.
+        """
+        lines = []
+        cumulative_count = 0
+        for bound_ns, bucket_count in zip(histogram.bounds_ns + (None,), histogram.counts):
+            cumulative_count += bucket_count
+            upper_bound = '+Inf' if bound_ns is None else repr(bound_ns / 1_000_000_000)
+            lines.append(f'{name}_bucket{{{labels}le="{upper_bound}"}} {cumulative_count}')
+        label_set = f'{{{labels.rstrip(",")}}}' if labels else ''
+        lines.append(f'{name}_sum{label_set} {histogram.sum_ns / 1_000_000_000}')
+        lines.append(f'{name}_count{label_set} {histogram.count}')
+        return lines
@@ -0,0 +1,324 @@
+from .clock_utils import SystemClock
+from .metrics_utils import Histogram
+from .settings import TimerConfig
+from .timer_utils import Calculate
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import os
+import signal
+import stat
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+"""
+Notifications for the Visual Countdown Timer.
+
+This module provides the Notifier class, which watches the countdown for the moment it
+reaches its target and then runs notification actions (a terminal bell, a shell
+command, a line appended to a file, or a webhook request). The actions run on a small
+pool of worker threads, each with a deadline, so a slow action never delays the tick
+loop or holds up later notifications, and the time from the target instant to each
+action starting is measured.
+"""
+
+class NotificationAction:
+    """
+    Base class for the actions run when the countdown reaches its target.
+
+    Subclasses implement `run()`. It is called on a thread of its own, and should give
+    up after `timeout_seconds`, raising TimeoutError (or an exception caused by one).
+    The Notifier stops waiting for an action that does not, and counts it as timed out.
+
+    Attributes:
+        name (str): The kind of action, used to label its metrics.
+    """
+
+    name = 'action'
+
+    def run(self, target_datetime: datetime, fired_datetime: datetime, timeout_seconds: float):
+        """
+        Runs the action.
+
+        Args:
+            target_datetime (datetime): The target the countdown reached.
+            fired_datetime (datetime): When the action started.
+            timeout_seconds (float): How long the action may take.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def details(target_datetime: datetime, fired_datetime: datetime) -> dict:
+        """
+        Describes a notification, for actions that send or record it.
+
+        Args:
+            target_datetime (datetime): The target the countdown reached.
+            fired_datetime (datetime): When the action started.
+        Returns:
+            details (dict): The target and firing times as ISO strings, and the latency in milliseconds.
+        """
+        return {
+            'target': target_datetime.isoformat(),
+            'fired_at': fired_datetime.isoformat(timespec='milliseconds'),
+            'latency_ms': round((fired_datetime - target_datetime).total_seconds() * 1000, 3),
+        }
+
+
+class BellAction(NotificationAction):
+    """
+    Rings the terminal bell, on stdout if it is a terminal and on stderr otherwise.
+
+    On Linux, the bell is written through a private, non-blocking open file description,
+    so a terminal that is not accepting output times the action out instead of blocking
+    it. When stderr is redirected to a regular file, the bell is written through stderr
+    itself instead, at its offset, so nothing already in the file is overwritten.
+    """
+
+    name = 'bell'
+
+    def run(self, target_datetime: datetime, fired_datetime: datetime, timeout_seconds: float):
+        stdout_fd = sys.stdout.fileno()
+        terminal_fd = stdout_fd if os.isatty(stdout_fd) else sys.stderr.fileno()
+        if stat.S_ISREG(os.fstat(terminal_fd).st_mode) or not sys.platform.startswith('linux'):
+            os.write(terminal_fd, b'\a')
+            return
+        file_descriptor = os.open(f'/dev/fd/{terminal_fd}', os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            os.write(file_descriptor, b'\a')
+        except BlockingIOError as error:
+            raise TimeoutError('The terminal is not accepting output.') from error
+        finally:
+            os.close(file_descriptor)
+
+
+class CommandAction(NotificationAction):
+    """
+    Runs a shell command, with the target time in the VISUAL_COUNTDOWN_TARGET environment variable.
+
+    The command's output is discarded, so that it cannot disturb the timer display. It
+    runs in a session of its own, and if it is still running at the deadline, its whole
+    process group is killed, including anything the shell started.
+
+    Attributes:
+        command (str): The shell command to run.
+    """
+
+    name = 'command'
+
+    def __init__(self, command: str):
+        self.command = command
+
+    def run(self, target_datetime: datetime, fired_datetime: datetime, timeout_seconds: float):
+        process = subprocess.Popen(
+            self.command, shell=True, start_new_session=True,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            env={**os.environ, 'VISUAL_COUNTDOWN_TARGET': target_datetime.isoformat()},
+        )
+        try:
+            return_code = process.wait(timeout_seconds)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+            raise
+        if return_code:
+            raise subprocess.CalledProcessError(return_code, self.command)
+
+
+class FileAppendAction(NotificationAction):
+    """
+    Appends one JSON line per notification to a file.
+
+    The file is opened non-blocking, so a FIFO without a reader fails the action
+    instead of blocking it.
+
+    Attributes:
+        path (str): The file to append to.
+    """
+
+    name = 'file'
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def run(self, target_datetime: datetime, fired_datetime: datetime, timeout_seconds: float):
+        line = json.dumps(self.details(target_datetime, fired_datetime)) + '\n'
+        file_descriptor = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_NONBLOCK, 0o644)
+        try:
+            os.write(file_descriptor, line.encode())
+        except BlockingIOError as error:
+            raise TimeoutError(f'{self.path} is not accepting output.') from error
+        finally:
+            os.close(file_descriptor)
+
+
+class WebhookAction(NotificationAction):
+    """
+    POSTs the notification as JSON to a URL.
+
+    Attributes:
+        url (str): The http:// or https:// URL to post to.
+    """
+
+    name = 'webhook'
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def run(self, target_datetime: datetime, fired_datetime: datetime, timeout_seconds: float):
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(self.details(target_datetime, fired_datetime)).encode(),
+            headers={'Content-Type': 'application/json'},
+            method='POST',
+        )
+        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+            response.read()
+
+
+class Notifier:
+    """
+    Runs notification actions each time the countdown reaches its target.
+
+    The tick loop calls `observe()` with each clock sample. That only compares the sample
+    with the pending target; once the target is reached (the remaining time has crossed
+    zero), every action is handed to the thread pool and the next target is calculated.
+    If more than `max_pending` actions are still queued or running, new ones are skipped
+    instead of queueing up behind them.
+
+    Each action runs on a daemon thread of its own, which its pool worker waits for at
+    most `timeout_seconds`. An action still running then is counted as timed out and
+    left to finish in the background, so its worker and its pending slot are freed at
+    the deadline even if the action never returns (a blocked write, or a DNS lookup,
+    which no socket timeout covers).
+
+    Attributes:
+        countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+        actions (list): The NotificationActions to run.
+        timeout_seconds (float): How long each action may take.
+        targets_reached (int): Number of times the countdown reached its target.
+        succeeded (int): Number of actions that completed.
+        failed (int): Number of actions that raised an error, other than a timeout.
+        timed_out (int): Number of actions that took longer than `timeout_seconds`.
+        skipped (int): Number of actions skipped because too many were pending.
+        latencies (dict): One Histogram per action name, of the time from the target
+            instant to the action starting.
+
+    Example:
+        >>> notifier = Notifier(25, [BellAction()])
+        >>> TimerLoop.run(25, 12, notifier=notifier)
+    """
+
+    def __init__(self, countdown_minutes, actions: list, clock: SystemClock = None,
+                 max_workers: int = TimerConfig.NOTIFY_MAX_WORKERS,
+                 max_pending: int = TimerConfig.NOTIFY_MAX_PENDING,
+                 timeout_seconds: float = TimerConfig.NOTIFY_TIMEOUT_SECONDS):
+        """
+        Initialize the notifier and its thread pool.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            actions (list): The NotificationActions to run.
+            clock (SystemClock): The clock to measure latency with. Defaults to the system's clock.
+            max_workers (int): The number of worker threads.
+            max_pending (int): The largest number of actions queued or running at once.
+            timeout_seconds (float): How long each action may take.
+        """
+        self.countdown_minutes = countdown_minutes
+        self.actions = actions
+        self.clock = clock if clock is not None else SystemClock()
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self.targets_reached = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.skipped = 0
+        self.latencies = {action.name: Histogram() for action in actions}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='notify')
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._target = None
+
+    def observe(self, datetime_now: datetime):
+        """
+        Checks a clock sample against the pending target, notifying if it has been reached.
+
+        Args:
+            datetime_now (datetime): The current date and time.
+        """
+        if self._target is not None and datetime_now < self._target:
+            return
+        if self._target is not None:
+            self._dispatch(self._target)
+        self._target = Calculate.next_countdown_occurrence(self.countdown_minutes, datetime_now)
+
+    def close(self):
+        """Stops accepting actions. Actions already running finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self, target_datetime: datetime):
+        """
+        Hands every action to the thread pool.
+
+        Args:
+            target_datetime (datetime): The target that was reached.
+        """
+        self.targets_reached += 1
+        target_ns = round(target_datetime.timestamp() * 1_000_000_000)
+        for action in self.actions:
+            with self._lock:
+                if self._pending >= self.max_pending:
+                    self.skipped += 1
+                    continue
+                self._pending += 1
+            self._executor.submit(self._run_action, action, target_datetime, target_ns)
+
+    def _run_action(self, action: NotificationAction, target_datetime: datetime, target_ns: int):
+        """
+        Runs one action on a worker thread, recording its latency and outcome.
+
+        Args:
+            action (NotificationAction): The action to run.
+            target_datetime (datetime): The target that was reached.
+            target_ns (int): The target instant, in nanoseconds since the epoch.
+        """
+        fired_ns = self.clock.time_ns()
+        with self._lock:
+            self.latencies[action.name].observe(max(fired_ns - target_ns, 0))
+        fired_datetime = datetime.fromtimestamp(fired_ns / 1_000_000_000, target_datetime.tzinfo)
+        outcomes = []
+        runner = threading.Thread(
+            target=lambda: outcomes.append(self._outcome(action, target_datetime, fired_datetime)),
+            name=f'notify-{action.name}', daemon=True,
+        )
+        runner.start()
+        runner.join(self.timeout_seconds)
+        outcome = outcomes[0] if outcomes else 'timed_out'
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self._pending -= 1
+
+    def _outcome(self, action: NotificationAction, target_datetime: datetime, fired_datetime: datetime) -> str:
+        """
+        Runs one action and classifies how it ended.
+
+        Args:
+            action (NotificationAction): The action to run.
+            target_datetime (datetime): The target that was reached.
+            fired_datetime (datetime): When the action started.
+        Returns:
+            outcome (str): 'succeeded', 'failed' or 'timed_out'.
+        """
+        try:
+            action.run(target_datetime, fired_datetime, self.timeout_seconds)
+            return 'succeeded'
+        except (TimeoutError, subprocess.TimeoutExpired):
+            return 'timed_out'
+        except urllib.error.URLError as error:
+            return 'timed_out' if isinstance(error.reason, TimeoutError) else 'failed'
+        except Exception:
+            return 'failed'
@@ -0,0 +1,209 @@
+from .render_utils import FrameRenderer, OutputSink
+import os
+import stat
+import sys
+
+"""
+Output sinks for the Visual Countdown Timer.
+
+This module provides the sinks frames can be drawn to besides the terminal: an
+append-only log file, a line-protocol pipe and a null sink, and the OutputSinks
+class, which opens the sink named on the command line.
+
+Every sink has the same interface as FrameRenderer, the terminal sink:
+    sink.draw(frame_text)
+"""
+
+class LogSink(OutputSink):
+    """
+    Appends a record to a log file for every frame, holding only the lines that changed.
+
+    The first record holds the whole frame, one line per row. Every later record is one
+    line with the rows that changed since the previous frame, separated by ' | ', so a
+    log of a running timer grows by one short line per tick instead of a whole screen.
+
+    Example:
+        >>> LogSink('timer.log').draw(frame_text)
+    """
+
+    SEPARATOR = ' | '
+
+    def __init__(self, path: str = None, file_descriptor: int = None):
+        """
+        Opens `path` for appending, creating it if needed, or writes to an open file.
+
+        A file descriptor (stdout redirected to a file, for example) is duplicated, not
+        reopened, so the log shares its offset with everything else written to it.
+        Writes to it block, since a regular file never holds up a writer for long.
+
+        Args:
+            path (str): The log file to append to.
+            file_descriptor (int): An open file to write to instead of `path`.
+        """
+        if file_descriptor is not None:
+            super().__init__(os.dup(file_descriptor))
+        else:
+            super().__init__(
+                os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644),
+                drops_stale_frames=True
+            )
+        self._previous_lines = None
+
+    def reset(self):
+        """Forgets the previous frame, so that the next record holds the whole frame."""
+        self._previous_lines = None
+
+    def close(self):
+        """Closes the log file."""
+        super().close()
+        os.close(self.file_descriptor)
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Builds the log record for a frame.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+        Returns:
+            record (str): The lines that changed, or the whole frame for the first record.
+                Empty if nothing changed.
+        """
+        lines = frame_text.split('\n')
+        previous_lines = self._previous_lines
+        self._previous_lines = lines
+        if previous_lines is None:
+            return frame_text + '\n'
+
+        changed_lines = [
+            line.strip() for row, line in enumerate(lines)
+            if row >= len(previous_lines) or line != previous_lines[row]
+        ]
+        if not changed_lines:
+            return ''
+        return self.SEPARATOR.join(changed_lines) + '\n'
+
+
+class PipeSink(OutputSink):
+    """
+    Writes every frame to a pipe as one line of text, for other programs to read.
+
+    Each line holds the frame's text rows, without indentation and without the
+    horizontal rules, separated by ' | '. A reader that falls behind misses frames
+    instead of slowing the timer down.
+
+    On Linux, the pipe is reopened through /dev/fd, which gives the sink an open file
+    description of its own, so the non-blocking mode frames are written in does not
+    reach stdout, which is shared with the shell and any other process writing to the
+    pipe. Elsewhere /dev/fd only duplicates the descriptor, and if the pipe cannot be
+    reopened (a socket, for example), frames are written blocking instead.
+
+    Example:
+        $ python3 -m visual_countdown_timer --minute 25 --hour-format 24 --output pipe | grep --line-buffered 'minutes'
+    """
+
+    SEPARATOR = ' | '
+    RULE_CHARACTERS = ' =-'
+
+    def __init__(self, file_descriptor: int = None):
+        """
+        Initialize the sink.
+
+        Args:
+            file_descriptor (int): The pipe to write to. Defaults to stdout.
+        """
+        if file_descriptor is None:
+            file_descriptor = sys.stdout.fileno()
+        private_descriptor = None
+        if sys.platform.startswith('linux'):
+            try:
+                private_descriptor = os.open(f'/dev/fd/{file_descriptor}', os.O_WRONLY)
+            except OSError:
+                pass
+        if private_descriptor is None:
+            super().__init__(file_descriptor)
+            self._owns_descriptor = False
+        else:
+            super().__init__(private_descriptor, drops_stale_frames=True)
+            self._owns_descriptor = True
+
+    def close(self):
+        """Closes the sink's own descriptor for the pipe, if it opened one."""
+        super().close()
+        if self._owns_descriptor:
+            os.close(self.file_descriptor)
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Builds the line for a frame.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+        Returns:
+            line (str): The frame as a single newline-terminated line.
+        """
+        return self.SEPARATOR.join(
+            line.strip() for line in frame_text.split('\n') if line.strip(self.RULE_CHARACTERS)
+        ) + '\n'
+
+
+class NullSink(OutputSink):
+    """Discards every frame. Useful for measuring the cost of the timer itself."""
+
+    def __init__(self):
+        super().__init__(file_descriptor=-1)
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Discards a frame.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+        Returns:
+            update_text (str): Always empty, so nothing is written.
+        """
+        self.frames_written += 1
+        return ''
+
+
+class OutputSinks:
+    """Opens output sinks by name."""
+
+    TARGETS = ('auto', 'tty', 'log:PATH', 'pipe', 'null')
+
+    @staticmethod
+    def open(target: str = 'auto') -> OutputSink:
+        """
+        Opens the sink named by `target`.
+
+        Supported targets:
+            auto        The terminal if stdout is one, a log if stdout is a regular file,
+                        otherwise a pipe.
+            tty         The terminal (or stdout), updated in place.
+            log:PATH    An append-only log file at PATH.
+            pipe        One line per frame on stdout.
+            null        Nowhere.
+
+        Args:
+            target (str): The sink to open.
+        Returns:
+            sink (OutputSink): The opened sink.
+        Raises:
+            ValueError: If the target is not one of the supported forms.
+        """
+        kind, _, location = target.partition(':')
+        if kind == 'auto':
+            stdout_fd = sys.stdout.fileno()
+            if os.isatty(stdout_fd):
+                return FrameRenderer(stdout_fd)
+            if stat.S_ISREG(os.fstat(stdout_fd).st_mode):
+                return LogSink(file_descriptor=stdout_fd)
+            return PipeSink(stdout_fd)
+        if kind == 'tty':
+            return FrameRenderer()
+        if kind == 'log' and location:
+            return LogSink(location)
+        if kind == 'pipe':
+            return PipeSink()
+        if kind == 'null':
+            return NullSink()
+        raise ValueError(f"Output must be one of {', '.join(OutputSinks.TARGETS)}, not {target!r}")
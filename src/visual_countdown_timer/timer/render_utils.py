@@ -0,0 +1,262 @@
+from .settings import DisplaySettings
+import os
+import sys
+
+"""
+Terminal rendering for the Visual Countdown Timer.
+
+This module provides the OutputSink base class, which writes each encoded frame with a
+single system call, and the FrameRenderer sink, which keeps the previously drawn
+frame in memory and updates the terminal in place using ANSI escape sequences,
+instead of clearing the screen and reprinting everything on every tick.
+"""
+
+class OutputSink:
+    """
+    Base class for the destinations timer frames are drawn to.
+
+    Subclasses implement `_encode()`, which turns a frame into the text to write. The
+    text is encoded into a buffer that is reused for every frame and written with one
+    `os.write` call.
+
+    A sink that drops stale frames puts its file descriptor in non-blocking mode, so it
+    must own that descriptor's open file description: the mode is shared by every
+    process using the description, such as a shell whose stdout the timer inherited. When
+    the reader falls behind, a frame that cannot be written at all is dropped instead of
+    blocking the tick loop, and the unwritten end of a partly written frame is finished
+    before anything newer is written, so the reader never sees half a frame.
+
+    Attributes:
+        file_descriptor (int): The file descriptor frames are written to.
+        drops_stale_frames (bool): Whether frames are dropped instead of blocking.
+        frames_written (int): Number of frames written.
+        frames_dropped (int): Number of frames dropped because the reader fell behind.
+    """
+
+    def __init__(self, file_descriptor: int, drops_stale_frames: bool = False):
+        """
+        Initialize the sink.
+
+        Args:
+            file_descriptor (int): The file descriptor to write frames to.
+            drops_stale_frames (bool): Whether to drop frames instead of blocking.
+        """
+        self.file_descriptor = file_descriptor
+        self.drops_stale_frames = drops_stale_frames
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._buffer = bytearray()
+        self._unsent = None
+        if drops_stale_frames:
+            os.set_blocking(file_descriptor, False)
+
+    def draw(self, frame_text: str, metrics=None):
+        """
+        Encodes and writes a frame.
+
+        Args:
+            frame_text (str): The complete text of the frame to display.
+            metrics (TickMetrics): Optional metrics to record the 'render' and 'write' stages in.
+        """
+        update_text = self._encode(frame_text)
+        if metrics is not None:
+            metrics.lap('render')
+        if update_text:
+            self._emit(update_text)
+        if metrics is not None:
+            metrics.lap('write')
+
+    def write_every_frame(self):
+        """
+        Makes writes block instead of dropping frames, for when the reader must see every frame.
+
+        A partly written frame is finished by the next write, as before.
+        """
+        if self.drops_stale_frames:
+            os.set_blocking(self.file_descriptor, True)
+            self.drops_stale_frames = False
+
+    def reset(self):
+        """Forgets any previous frame, so that the next frame is written in full."""
+
+    def close(self):
+        """Puts the file descriptor back in blocking mode."""
+        if self.drops_stale_frames:
+            os.set_blocking(self.file_descriptor, True)
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Builds the text to write for a frame.
+
+        Args:
+            frame_text (str): The complete text of the frame to display.
+        Returns:
+            update_text (str): The text to write. Empty if nothing needs writing.
+        """
+        raise NotImplementedError
+
+    def _emit(self, update_text: str):
+        """
+        Writes an update, or drops it if the reader has fallen behind.
+
+        Args:
+            update_text (str): The text to write.
+        """
+        if self._unsent is not None:
+            self._unsent = self._write_available(self._unsent)
+            if self._unsent is not None:
+                self._drop_frame()
+                return
+
+        self._buffer.clear()
+        self._buffer += update_text.encode()
+        if not self.drops_stale_frames:
+            self._write_buffer()
+        else:
+            unsent = self._write_available(self._buffer)
+            if unsent is not None and len(unsent) == len(self._buffer):
+                self._drop_frame()
+                return
+            self._unsent = unsent
+        self.frames_written += 1
+
+    def _drop_frame(self):
+        """Counts a dropped frame, and makes sure the next frame is written in full."""
+        self.frames_dropped += 1
+        self.reset()
+
+    def _write_available(self, data) -> bytes:
+        """
+        Writes as much of `data` as the file descriptor accepts without blocking.
+
+        Args:
+            data (bytes): The data to write.
+        Returns:
+            unsent (bytes): The part of `data` that was not written, or None if all of it was.
+        """
+        try:
+            bytes_written = os.write(self.file_descriptor, data)
+        except BlockingIOError:
+            bytes_written = 0
+        if bytes_written == len(data):
+            return None
+        return bytes(data[bytes_written:])
+
+    def _write_buffer(self):
+        """Writes the encoded update to the file descriptor, normally in one system call."""
+        sys.stdout.flush()
+        remaining = memoryview(self._buffer)
+        while remaining:
+            bytes_written = os.write(self.file_descriptor, remaining)
+            remaining = remaining[bytes_written:]
+
+
+class FrameRenderer(OutputSink):
+    """
+    Draws timer frames to a terminal, rewriting only what changed since the last frame.
+
+    On a TTY, the first frame clears the screen. Every following frame is compared
+    line by line with the previous one, and only the changed tail of each changed line
+    is rewritten, with the cursor moved there by ANSI escape sequences. When the output
+    is not a TTY, each frame is written out in full, the same as `print()` would.
+    Either way, every update is written with a single `os.write` call.
+
+    Attributes:
+        is_terminal (bool): Whether the file descriptor is a TTY.
+    """
+
+    CURSOR_HOME = '\x1b[H'
+    CLEAR_SCREEN = '\x1b[2J'
+    CLEAR_TO_END_OF_LINE = '\x1b[K'
+    CLEAR_TO_END_OF_SCREEN = '\x1b[J'
+
+    def __init__(self, file_descriptor: int = None):
+        """
+        Initialize the renderer.
+
+        Args:
+            file_descriptor (int): The file descriptor to draw to. Defaults to stdout.
+        """
+        if file_descriptor is None:
+            file_descriptor = sys.stdout.fileno()
+        super().__init__(file_descriptor)
+        self.is_terminal = os.isatty(file_descriptor)
+        self._previous_lines = None
+        self._previous_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
+
+    def reset(self):
+        """Forgets the previous frame, so that the next frame is drawn on a cleared screen."""
+        self._previous_lines = None
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Builds the text to write for a frame: only the changes on a TTY, the full frame otherwise.
+
+        Args:
+            frame_text (str): The complete text of the frame to display.
+        Returns:
+            update_text (str): The text to write. Empty if nothing changed.
+        """
+        if self.is_terminal:
+            return self._terminal_update(frame_text)
+        return frame_text + '\n'
+
+    def _terminal_update(self, frame_text: str) -> str:
+        """
+        Builds the escape sequences and text needed to turn the previous frame into this one.
+
+        Args:
+            frame_text (str): The complete text of the frame to display.
+        Returns:
+            update_text (str): The text to write to the terminal. Empty if nothing changed.
+        """
+        # After a resize the terminal has reflowed the old frame, so redraw from scratch.
+        if DisplaySettings.TERMINAL_WINDOW_WIDTH != self._previous_width:
+            self._previous_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
+            self._previous_lines = None
+
+        lines = frame_text.split('\n')
+        previous_lines = self._previous_lines
+        self._previous_lines = lines
+
+        if previous_lines is None:
+            return (
+                self.CURSOR_HOME + self.CLEAR_SCREEN + frame_text + '\n'
+            )
+
+        updates = []
+        for row, line in enumerate(lines, start=1):
+            previous_line = previous_lines[row - 1] if row <= len(previous_lines) else ''
+            if line == previous_line:
+                continue
+            column = self._first_difference(line, previous_line)
+            updates.append(f'\x1b[{row};{column + 1}H{line[column:]}')
+            if len(line) < len(previous_line):
+                updates.append(self.CLEAR_TO_END_OF_LINE)
+
+        if len(lines) < len(previous_lines):
+            updates.append(f'\x1b[{len(lines) + 1};1H{self.CLEAR_TO_END_OF_SCREEN}')
+        elif not updates:
+            return ''
+
+        # Leave the cursor on the line below the frame, where print() would have left it.
+        updates.append(f'\x1b[{len(lines) + 1};1H')
+        return ''.join(updates)
+
+    @staticmethod
+    def _first_difference(line: str, previous_line: str) -> int:
+        """
+        Finds the first column at which two lines differ.
+
+        Args:
+            line (str): The new line.
+            previous_line (str): The line previously drawn in the same row.
+        Returns:
+            column (int): The zero-based index of the first differing character.
+        """
+        column = 0
+        for new_character, old_character in zip(line, previous_line):
+            if new_character != old_character:
+                break
+            column += 1
+        return column
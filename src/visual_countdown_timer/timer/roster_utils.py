@@ -0,0 +1,294 @@
+from .schedule_utils import Schedule
+from .settings import TimerConfig
+from .system_utils import LRUCache
+from .validation_checks import InputCheck
+import csv
+import json
+
+"""
+Roster files for the Visual Countdown Timer.
+
+This module provides the Roster class, which reads timer definitions (a target minute
+or schedule, an hour format and a label) from a CSV or JSON-lines file. Rows are read,
+validated and handed on one at a time, so a roster of any length is checked in a single
+pass in constant memory, and every invalid row is reported with structured errors
+instead of stopping the import.
+"""
+
+class TimerDefinition:
+    """
+    One valid timer definition from a roster.
+
+    Attributes:
+        row (int): The line of the roster file the definition ends on.
+        label (str): The name of the timer. May be empty.
+        countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule.
+        hour_format (int): Time display format (12 or 24 hour)
+    """
+
+    __slots__ = ('row', 'label', 'countdown_minutes', 'hour_format')
+
+    def __init__(self, row: int, label: str, countdown_minutes, hour_format: int):
+        self.row = row
+        self.label = label
+        self.countdown_minutes = countdown_minutes
+        self.hour_format = hour_format
+
+    def __repr__(self) -> str:
+        return f'TimerDefinition(row={self.row}, label={self.label!r}, target={self.countdown_minutes!r})'
+
+
+class RowError:
+    """
+    One problem with one field of a roster row.
+
+    Attributes:
+        row (int): The line of the roster file the row ends on.
+        field (str): The name of the field, or 'row' for a problem with the whole row.
+        value (str): The value found in the field, as text.
+        message (str): What is wrong with the value.
+    """
+
+    __slots__ = ('row', 'field', 'value', 'message')
+
+    def __init__(self, row: int, field: str, value: str, message: str):
+        self.row = row
+        self.field = field
+        self.value = value
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f'RowError(row={self.row}, field={self.field!r}, value={self.value!r}, message={self.message!r})'
+
+    def __str__(self) -> str:
+        return f'Line {self.row}: {self.field} {self.value!r} {self.message}.'
+
+
+class Roster:
+    """
+    Streams and validates the timer definitions in a roster file.
+
+    A roster is either a CSV file with a header row, or a JSON-lines file with one object
+    per line. The format is recognised from the first non-blank character ('{' for JSON
+    lines). Each row has these fields:
+        target        A minute past the hour (0-59) or a cron-style schedule. Required.
+        hour_format   12 or 24. Required.
+        label         A name for the timer. Optional.
+    Other fields are ignored.
+
+    Rosters tend to repeat the same few targets and hour formats, so the result of
+    validating each value is cached, and a repeated schedule is only compiled once.
+
+    Attributes:
+        path (str): The path of the roster file.
+        rows_read (int): The number of rows read so far.
+        rows_invalid (int): The number of rows read so far that had at least one error.
+
+    Example:
+        >>> roster = Roster('timers.csv')
+        >>> for definition, errors in roster.entries():
+        ...     if errors:
+        ...         print(*errors, sep='\\n')
+    """
+
+    REQUIRED_FIELDS = ('target', 'hour_format')
+
+    _value_cache = LRUCache(TimerConfig.ROSTER_VALUE_CACHE_SIZE)
+
+    def __init__(self, path: str):
+        """
+        Initialize the roster. The file is not opened until its entries are read.
+
+        Args:
+            path (str): The path of the roster file.
+        """
+        self.path = path
+        self.rows_read = 0
+        self.rows_invalid = 0
+
+    def definitions(self):
+        """
+        Yields the valid timer definitions, skipping invalid rows.
+
+        Yields:
+            definition (TimerDefinition): The next valid definition.
+        """
+        for definition, errors in self.entries():
+            if definition is not None:
+                yield definition
+
+    def entries(self):
+        """
+        Reads and validates the roster one row at a time.
+
+        Yields:
+            definition (TimerDefinition): The row's definition, or None if the row is invalid.
+            errors (list): The row's RowErrors. Empty if the row is valid.
+        Raises:
+            ValueError: If a CSV roster is missing a required column.
+        """
+        with open(self.path, newline='', encoding='utf-8') as roster_file:
+            if self._is_json_lines(roster_file):
+                rows = self._json_rows(roster_file)
+            else:
+                rows = self._csv_rows(roster_file)
+            for row, fields in rows:
+                definition, errors = self.validate_row(row, fields)
+                self.rows_read += 1
+                if errors:
+                    self.rows_invalid += 1
+                yield definition, errors
+
+    @classmethod
+    def validate_row(cls, row: int, fields) -> tuple:
+        """
+        Validates the fields of one row.
+
+        Args:
+            row (int): The line the row ends on, for error reports.
+            fields (dict | RowError): The row's fields by name, or the error that made the
+                row unreadable.
+        Returns:
+            definition (TimerDefinition): The row's definition, or None if the row is invalid.
+            errors (list): The row's RowErrors. Empty if the row is valid.
+        """
+        if isinstance(fields, RowError):
+            return None, [fields]
+        errors = []
+        countdown_minutes = cls._field(row, 'target', fields.get('target'), errors)
+        hour_format = cls._field(row, 'hour_format', fields.get('hour_format'), errors)
+        if errors:
+            return None, errors
+        label = fields.get('label')
+        return TimerDefinition(row, '' if label is None else str(label).strip(), countdown_minutes, hour_format), errors
+
+    @classmethod
+    def _field(cls, row: int, field: str, value, errors: list):
+        """
+        Validates one required field, reusing the result for a value seen before.
+
+        Args:
+            row (int): The line the row ends on.
+            field (str): 'target' or 'hour_format'.
+            value (str | int): The field's value, or None if it is missing.
+            errors (list): The list to append a RowError to, if the value is invalid.
+        Returns:
+            parsed_value (int | Schedule): The validated value, or None if it is invalid.
+        """
+        # The type is part of the key, so that True and 1 are not treated as the same value.
+        # Lists and objects from JSON lines cannot be cached, and are always invalid anyway.
+        cache_key = (field, value.__class__, value) if isinstance(value, (str, int, float, type(None))) else None
+        parsed_value, error = cls._value_cache.get(cache_key, (None, None))
+        if parsed_value is None and error is None:
+            if field == 'target':
+                parsed_value, error = cls._parse_target(value)
+            else:
+                parsed_value, error = cls._parse_integer(value, InputCheck.hour_display_format)
+            if cache_key is not None:
+                cls._value_cache.set(cache_key, (parsed_value, error))
+        if error is not None:
+            errors.append(RowError(row, field, '' if value is None else str(value), error))
+        return parsed_value
+
+    @classmethod
+    def _parse_target(cls, value) -> tuple:
+        """
+        Parses a target: a minute past the hour, or a schedule expression.
+
+        Args:
+            value (str | int): The field's value, or None if it is missing.
+        Returns:
+            countdown_minutes (int | Schedule): The target, or None if it is invalid.
+            error (str): None if the target is valid, otherwise the problem.
+        """
+        if isinstance(value, str) and len(value.split()) > 1:
+            try:
+                schedule = Schedule(' '.join(value.split()))
+            except ValueError as schedule_error:
+                return None, f"is not a valid schedule ({str(schedule_error).rstrip('.')})"
+            return (schedule.single_minute if schedule.single_minute is not None else schedule), None
+        return cls._parse_integer(value, InputCheck.minutes_range)
+
+    @staticmethod
+    def _parse_integer(value, range_check) -> tuple:
+        """
+        Parses a whole number, then checks its range.
+
+        Args:
+            value (str | int): The field's value, or None if it is missing.
+            range_check (Callable): An InputCheck to run on the whole number.
+        Returns:
+            number (int): The whole number, or None if it is invalid.
+            error (str): None if the number is valid, otherwise the problem.
+        """
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return None, 'is missing'
+        error = InputCheck.integer(value)
+        if error is None:
+            number = int(value)
+            error = range_check(number)
+            if error is None:
+                return number, None
+        return None, error
+
+    @staticmethod
+    def _is_json_lines(roster_file) -> bool:
+        """
+        Checks whether a roster is in the JSON-lines format, then rewinds it.
+
+        Args:
+            roster_file (TextIO): The open roster file.
+        Returns:
+            is_json_lines (bool): Whether the first non-blank character is '{'.
+        """
+        for line in roster_file:
+            if line.strip():
+                roster_file.seek(0)
+                return line.lstrip().startswith('{')
+        roster_file.seek(0)
+        return False
+
+    @classmethod
+    def _csv_rows(cls, roster_file):
+        """
+        Reads the rows of a CSV roster.
+
+        Args:
+            roster_file (TextIO): The open roster file.
+        Yields:
+            row (int): The line the row ends on.
+            fields (dict): The row's fields by column name.
+        Raises:
+            ValueError: If the header row is missing a required column.
+        """
+        reader = csv.DictReader(roster_file, skipinitialspace=True)
+        for field in cls.REQUIRED_FIELDS:
+            if field not in (reader.fieldnames or ()):
+                raise ValueError(f"The roster has no {field!r} column.")
+        for fields in reader:
+            yield reader.line_num, fields
+
+    @staticmethod
+    def _json_rows(roster_file):
+        """
+        Reads the rows of a JSON-lines roster, skipping blank lines.
+
+        Args:
+            roster_file (TextIO): The open roster file.
+        Yields:
+            row (int): The line number.
+            fields (dict | RowError): The row's fields by name, or the error that made the
+                line unreadable.
+        """
+        for row, line in enumerate(roster_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                fields = json.loads(line)
+            except ValueError:
+                yield row, RowError(row, 'row', line.strip(), 'is not valid JSON')
+                continue
+            if not isinstance(fields, dict):
+                yield row, RowError(row, 'row', line.strip(), 'is not a JSON object')
+                continue
+            yield row, fields
@@ -0,0 +1,401 @@
+from datetime import datetime, timedelta, timezone
+from .settings import TimerConfig
+import bisect
+
+"""
+Countdown schedules for the Visual Countdown Timer.
+
+This module provides the Schedule class, which compiles a cron-style expression into
+lookup tables, so the next time the schedule fires can be found without scanning
+minute by minute.
+
+Examples of schedule expressions:
+    25                          Minute 25 of every hour (the same as '25 * * * *').
+    */15 * * * *                Every 15 minutes.
+    0,30 9-17 * * mon-fri       On the hour and half hour, 9:00 to 17:30, on weekdays.
+    0 9 1 * *                   9:00 on the first day of every month.
+"""
+
+class Schedule:
+    """
+    A compiled cron-style schedule: MINUTE HOUR DAY-OF-MONTH MONTH DAY-OF-WEEK.
+
+    Each field accepts '*', numbers, ranges ('9-17'), steps ('*/15', '0-30/10') and
+    comma-separated lists of these. Months and days of the week can also be given by
+    their three-letter English names. Days of the week run from 0 (Sunday) to 6, and 7
+    is also accepted for Sunday. As in cron, when both the day of the month and the day
+    of the week are restricted, a day matches if either of them does.
+
+    Every field is compiled to a bitset. Schedules that do not depend on the day of the
+    month or the month, which is most of them, are also compiled to a sorted array of
+    the minutes of the week at which they fire, so the next occurrence is one binary
+    search away. Other schedules find the next matching day with a per-year bitset of
+    matching days, then the time of day with a binary search.
+
+    The search runs on naive local wall-clock times, and each candidate is then given
+    the UTC offset in effect at that moment, so occurrences after a daylight saving
+    change keep their wall-clock time. A wall-clock time that falls in the gap of a
+    spring-forward change does not occur and is skipped; one that occurs twice, in the
+    repeated hour of a fall-back change, fires only the first time, as in cron.
+
+    Attributes:
+        expression (str): The expression the schedule was compiled from.
+
+    Example:
+        >>> schedule = Schedule('0,30 9-17 * * mon-fri')
+        >>> schedule.next_occurrence(datetime(2024, 1, 5, 17, 45).astimezone())
+        datetime.datetime(2024, 1, 8, 9, 0, ...)
+    """
+
+    MINUTES_PER_DAY = 24 * 60
+    MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+    MONTH_NAMES = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+    DAY_NAMES = ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat')
+
+    # (name, lowest value, highest value, value names)
+    FIELDS = (
+        ('minute', 0, 59, None),
+        ('hour', 0, 23, None),
+        ('day of month', 1, 31, None),
+        ('month', 1, 12, MONTH_NAMES),
+        ('day of week', 0, 7, DAY_NAMES),
+    )
+
+    ALL_MINUTES = (1 << 60) - 1
+    ALL_HOURS = (1 << 24) - 1
+    ALL_DAYS_OF_MONTH = ((1 << 32) - 1) & ~1
+    ALL_MONTHS = ((1 << 13) - 1) & ~1
+    ALL_DAYS_OF_WEEK = (1 << 7) - 1
+
+    def __init__(self, expression: str):
+        """
+        Compiles a schedule expression.
+
+        Args:
+            expression (str): A five-field cron-style expression, or a single minute
+                (0-59) meaning that minute past every hour.
+        Raises:
+            ValueError: If the expression is malformed, or describes a schedule that
+                never fires.
+        """
+        self.expression = expression.strip()
+        fields = self.expression.split()
+        if len(fields) == 1:
+            fields += ['*', '*', '*', '*']
+        if len(fields) != len(self.FIELDS):
+            raise ValueError(
+                f"A schedule needs 5 fields (minute hour day-of-month month day-of-week), not {len(fields)}: "
+                f"{self.expression!r}"
+            )
+
+        self.minutes, self.hours, self.days_of_month, self.months, days_of_week = (
+            self._parse_field(field_text, *field) for field_text, field in zip(fields, self.FIELDS)
+        )
+        # Day 7 is another name for Sunday.
+        self.days_of_week = (days_of_week | days_of_week >> 7) & self.ALL_DAYS_OF_WEEK
+
+        self._days_of_month_restricted = self.days_of_month != self.ALL_DAYS_OF_MONTH
+        self._days_of_week_restricted = self.days_of_week != self.ALL_DAYS_OF_WEEK
+        self._minutes_of_day = [
+            hour * 60 + minute
+            for hour in self._set_bits(self.hours)
+            for minute in self._set_bits(self.minutes)
+        ]
+        self._minutes_of_week = None
+        if not self._days_of_month_restricted and self.months == self.ALL_MONTHS:
+            self._minutes_of_week = [
+                day * self.MINUTES_PER_DAY + minute_of_day
+                for day in self._set_bits(self.days_of_week)
+                for minute_of_day in self._minutes_of_day
+            ]
+        self._matching_days_by_year = {}
+        self._cached_after = None
+        self._cached_tzinfo = None
+        self._cached_occurrence = None
+
+        if self.next_occurrence(datetime.now().astimezone()) is None:
+            raise ValueError(f"The schedule {self.expression!r} never fires.")
+
+    def __repr__(self) -> str:
+        return f'Schedule({self.expression!r})'
+
+    @property
+    def single_minute(self) -> int:
+        """
+        The minute past the hour, if the schedule fires at one minute past every hour.
+
+        Returns:
+            minute (int): The minute (0-59), or None for any other kind of schedule.
+        """
+        is_hourly = (
+            self.hours == self.ALL_HOURS and self.months == self.ALL_MONTHS
+            and not self._days_of_month_restricted and not self._days_of_week_restricted
+        )
+        if is_hourly and self.minutes & (self.minutes - 1) == 0:
+            return self.minutes.bit_length() - 1
+        return None
+
+    def next_occurrence(self, current_datetime: datetime) -> datetime:
+        """
+        Returns the start of the first scheduled minute after the current minute.
+
+        This matches Calculate.next_countdown_occurrence(): during a scheduled minute, the
+        countdown is already running towards the following occurrence. The result is
+        remembered, so asking again before it is reached costs a single comparison.
+
+        Args:
+            current_datetime (datetime): The current date and time. A fixed-offset time
+                whose offset is the local timezone's (as from `astimezone()` or ZoneClock)
+                is taken to be in the local timezone.
+        Returns:
+            next_occurrence (datetime): The next occurrence, with the UTC offset in effect
+                at that time, or None if there is none in the next few years.
+        """
+        if (
+            self._cached_occurrence is not None
+            and self._cached_after <= current_datetime < self._cached_occurrence
+            and current_datetime.tzinfo == self._cached_tzinfo
+        ):
+            return self._cached_occurrence
+
+        current_minute = current_datetime.replace(second=0, microsecond=0)
+        is_local = (
+            isinstance(current_datetime.tzinfo, timezone)
+            and current_datetime.astimezone().utcoffset() == current_datetime.utcoffset()
+        )
+        wall_minute = current_minute.replace(tzinfo=None)
+        while True:
+            if self._minutes_of_week is not None:
+                wall_minute = self._next_weekly_occurrence(wall_minute)
+            else:
+                wall_minute = self._next_occurrence_by_day(wall_minute)
+            if wall_minute is None:
+                next_occurrence = None
+                break
+            next_occurrence = self._first_instant_after(wall_minute, current_datetime, is_local)
+            if next_occurrence is not None:
+                break
+
+        self._cached_after = current_minute
+        self._cached_tzinfo = current_datetime.tzinfo
+        self._cached_occurrence = next_occurrence
+        return next_occurrence
+
+    def occurrences(self, current_datetime: datetime, count: int) -> list:
+        """
+        Returns the next `count` occurrences, in order.
+
+        Args:
+            current_datetime (datetime): The current date and time.
+            count (int): The number of occurrences to return.
+        Returns:
+            occurrences (list): The next occurrences.
+        """
+        occurrences = []
+        while len(occurrences) < count:
+            current_datetime = self.next_occurrence(current_datetime)
+            if current_datetime is None:
+                break
+            occurrences.append(current_datetime)
+        return occurrences
+
+    @staticmethod
+    def _first_instant_after(wall_time: datetime, current_datetime: datetime, is_local: bool) -> datetime:
+        """
+        Finds the first instant at which the clock shows a wall-clock time, if it is still to come.
+
+        Args:
+            wall_time (datetime): A naive wall-clock time.
+            current_datetime (datetime): The current date and time.
+            is_local (bool): Whether `current_datetime` is in the local timezone.
+        Returns:
+            instant (datetime): The wall-clock time with the UTC offset in effect at it, or
+                None if it does not occur after `current_datetime` (it is in the gap of a
+                spring-forward change, or its first occurrence has already passed).
+        """
+        if is_local:
+            instant = wall_time.astimezone()
+        else:
+            instant = wall_time.replace(tzinfo=current_datetime.tzinfo)
+            instant = instant.astimezone(timezone.utc).astimezone(current_datetime.tzinfo)
+        if instant.replace(tzinfo=None) == wall_time and instant > current_datetime:
+            return instant
+        return None
+
+    def _next_weekly_occurrence(self, current_minute: datetime) -> datetime:
+        """
+        Finds the next occurrence with a binary search over the minutes of the week.
+
+        Args:
+            current_minute (datetime): The start of the current minute.
+        Returns:
+            next_occurrence (datetime): The next occurrence.
+        """
+        minute_of_week = (
+            self._day_of_week(current_minute) * self.MINUTES_PER_DAY
+            + current_minute.hour * 60 + current_minute.minute
+        )
+        index = bisect.bisect_right(self._minutes_of_week, minute_of_week)
+        if index < len(self._minutes_of_week):
+            next_minute_of_week = self._minutes_of_week[index]
+        else:
+            next_minute_of_week = self._minutes_of_week[0] + self.MINUTES_PER_WEEK
+        return current_minute + timedelta(minutes=next_minute_of_week - minute_of_week)
+
+    def _next_occurrence_by_day(self, current_minute: datetime) -> datetime:
+        """
+        Finds the next occurrence by looking up the next matching day, then the time of day.
+
+        Args:
+            current_minute (datetime): The start of the current minute.
+        Returns:
+            next_occurrence (datetime): The next occurrence, or None if there is none in
+                the next TimerConfig.SCHEDULE_SEARCH_YEARS years.
+        """
+        midnight = current_minute.replace(hour=0, minute=0)
+        if self._day_matches(current_minute):
+            index = bisect.bisect_right(self._minutes_of_day, current_minute.hour * 60 + current_minute.minute)
+            if index < len(self._minutes_of_day):
+                return midnight + timedelta(minutes=self._minutes_of_day[index])
+
+        year = current_minute.year
+        day_of_year = current_minute.timetuple().tm_yday
+        for year_offset in range(TimerConfig.SCHEDULE_SEARCH_YEARS + 1):
+            later_days = self._matching_days(year + year_offset)
+            if year_offset == 0:
+                later_days >>= day_of_year
+                later_days <<= day_of_year
+            if later_days:
+                # The lowest set bit is the next matching day of that year.
+                next_day_index = (later_days & -later_days).bit_length() - 1
+                next_date = datetime(year + year_offset, 1, 1) + timedelta(days=next_day_index)
+                return (
+                    midnight.replace(year=next_date.year, month=next_date.month, day=next_date.day)
+                    + timedelta(minutes=self._minutes_of_day[0])
+                )
+        return None
+
+    def _matching_days(self, year: int) -> int:
+        """
+        Returns a bitset of the days of a year on which the schedule fires.
+
+        Args:
+            year (int): The year.
+        Returns:
+            matching_days (int): Bit n is set if the schedule fires on day n + 1 of the year.
+        """
+        matching_days = self._matching_days_by_year.get(year)
+        if matching_days is None:
+            matching_days = 0
+            day = datetime(year, 1, 1)
+            day_index = 0
+            while day.year == year:
+                if self._day_matches(day):
+                    matching_days |= 1 << day_index
+                day += timedelta(days=1)
+                day_index += 1
+            self._matching_days_by_year[year] = matching_days
+        return matching_days
+
+    def _day_matches(self, day: datetime) -> bool:
+        """
+        Checks whether the schedule fires on a given day.
+
+        Args:
+            day (datetime): Any time on the day to check.
+        Returns:
+            matches (bool): Whether the day's month, day of the month and day of the week match.
+        """
+        if not self.months >> day.month & 1:
+            return False
+        day_of_month_matches = self.days_of_month >> day.day & 1
+        day_of_week_matches = self.days_of_week >> self._day_of_week(day) & 1
+        if self._days_of_month_restricted and self._days_of_week_restricted:
+            return bool(day_of_month_matches or day_of_week_matches)
+        return bool(day_of_month_matches and day_of_week_matches)
+
+    @staticmethod
+    def _day_of_week(day: datetime) -> int:
+        """
+        Returns the cron day of the week, which counts from 0 on Sunday.
+
+        Args:
+            day (datetime): The day.
+        Returns:
+            day_of_week (int): 0 (Sunday) to 6 (Saturday).
+        """
+        return (day.weekday() + 1) % 7
+
+    @staticmethod
+    def _set_bits(bits: int) -> list:
+        """
+        Lists the positions of the set bits of an integer, in ascending order.
+
+        Args:
+            bits (int): The bitset.
+        Returns:
+            positions (list): The positions of the set bits.
+        """
+        return [position for position in range(bits.bit_length()) if bits >> position & 1]
+
+    @classmethod
+    def _parse_field(cls, field_text: str, name: str, lowest: int, highest: int, value_names: tuple) -> int:
+        """
+        Compiles one field of a schedule expression into a bitset.
+
+        Args:
+            field_text (str): The text of the field, such as '0,30' or '*/15'.
+            name (str): The field's name, for error messages.
+            lowest (int): The lowest allowed value.
+            highest (int): The highest allowed value.
+            value_names (tuple): Names for the values, counting from `lowest`, or None.
+        Returns:
+            bits (int): A bitset with bit n set if value n is included.
+        Raises:
+            ValueError: If the field is malformed or out of range.
+        """
+        bits = 0
+        for part in field_text.split(','):
+            range_text, has_step, step_text = part.partition('/')
+            step = cls._parse_value(step_text, name, None) if has_step else 1
+            if step < 1:
+                raise ValueError(f"The {name} step must be at least 1, not {step}.")
+
+            if range_text == '*':
+                start, end = lowest, highest
+            elif '-' in range_text:
+                start_text, _, end_text = range_text.partition('-')
+                start = cls._parse_value(start_text, name, value_names, lowest)
+                end = cls._parse_value(end_text, name, value_names, lowest)
+            else:
+                start = cls._parse_value(range_text, name, value_names, lowest)
+                end = highest if has_step else start
+
+            if not lowest <= start <= end <= highest:
+                raise ValueError(f"The {name} must be between {lowest} and {highest}, not {range_text!r}.")
+            for value in range(start, end + 1, step):
+                bits |= 1 << value
+        return bits
+
+    @staticmethod
+    def _parse_value(value_text: str, name: str, value_names: tuple, lowest: int = 0) -> int:
+        """
+        Parses one number or name in a schedule field.
+
+        Args:
+            value_text (str): A number, or one of `value_names`.
+            name (str): The field's name, for error messages.
+            value_names (tuple): Names for the values, counting from `lowest`, or None.
+            lowest (int): The value of the first name.
+        Returns:
+            value (int): The parsed value.
+        Raises:
+            ValueError: If the text is neither a number nor a known name.
+        """
+        if value_names is not None and value_text.lower() in value_names:
+            return value_names.index(value_text.lower()) + lowest
+        try:
+            return int(value_text)
+        except ValueError:
+            raise ValueError(f"Invalid {name} in schedule: {value_text!r}")
@@ -5,6 +5,7 @@ This module defines configuration classes containing settings for
 display formatting, timer behavior, and validation parameters.
 """
 
+import os
 import shutil
 
 class DisplaySettings:
@@ -12,6 +13,7 @@ class DisplaySettings:
     
     # App Width
     TERMINAL_WINDOW_WIDTH = shutil.get_terminal_size().columns
+    TERMINAL_WINDOW_HEIGHT = shutil.get_terminal_size().lines
 
     # Line formatting
     LINE_THICKNESS = 34
@@ -20,6 +22,25 @@ class DisplaySettings:
     # Progress bar settings
     PROGRESS_BAR_WIDTH_TOTAL = 30
 
+    # Smooth display mode (frames per second)
+    SMOOTH_FPS_DEFAULT = 30
+    SMOOTH_FPS_MIN = 10
+    SMOOTH_FPS_MAX = 60
+
+    # Remaining time settings (when False, only whole minutes are shown, rounded up)
+    SHOW_SECONDS = True
+
+    # Big digits (when True, the remaining time is drawn with block glyphs, each pixel up to BIG_DIGIT_MAX_SCALE columns wide)
+    BIG_DIGITS = False
+    BIG_DIGIT_MAX_SCALE = 3
+
+    # Dashboard (columns between the cells of the grid)
+    DASHBOARD_CELL_GAP = 2
+
+    # Formatting caches (maximum number of entries)
+    FORMAT_CACHE_SIZE = 256
+    LAYOUT_CACHE_SIZE = 512
+
 
 class TimerConfig:
     """Configuration for timer behavior and validation."""
@@ -27,6 +48,59 @@ class TimerConfig:
     # Time format options
     POSSIBLE_HOUR_FORMATS = (12, 24)
     
+    # Exit codes
+    EXIT_SUCCESS = 0
+
     # Input validation
     MIN_MINUTES = 0
     MAX_MINUTES = 59
+
+    # Tick scheduling (nanoseconds)
+    TICK_INTERVAL_NS = 1_000_000_000
+    LATE_TICK_THRESHOLD_NS = 50_000_000
+    CLOCK_JUMP_THRESHOLD_NS = 250_000_000
+    EARLY_WAKEUP_TOLERANCE_NS = 20_000_000
+
+    # Broadcast server
+    BROADCAST_LISTEN_BACKLOG = 1024
+
+    # Metrics export
+    METRICS_EXPORT_INTERVAL_TICKS = 10
+    METRICS_BUCKET_BOUNDS_NS = (
+        1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000,
+        1_000_000, 2_500_000, 5_000_000, 10_000_000, 25_000_000, 50_000_000,
+        100_000_000, 250_000_000, 500_000_000, 1_000_000_000,
+    )
+
+    # Timezone transitions (seconds)
+    ZONE_TRANSITION_HORIZON_SECONDS = 366 * 24 * 60 * 60
+    ZONE_PROBE_STEP_SECONDS = 6 * 60 * 60
+
+    # Schedules (how far ahead to look for the next occurrence)
+    SCHEDULE_SEARCH_YEARS = 8
+
+    # State file
+    STATE_FILE_DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.visual_countdown_timer.state')
+    STATE_RING_RECORDS = 1024
+
+    # Shared-memory frames
+    SHARED_FRAME_DEFAULT_NAME = 'visual_countdown_timer'
+    SHARED_FRAME_CAPACITY = 64 * 1024
+    SHARED_FRAME_MAX_RETRY_SECONDS = 0.016
+
+    # Rosters (number of validated field values kept while importing)
+    ROSTER_VALUE_CACHE_SIZE = 4096
+
+    # Simulation (how many hours --simulate runs for by default, and how late simulated sleeps wake up)
+    SIMULATE_HOURS_DEFAULT = 24
+    SIMULATED_WAKEUP_LATENCY_NS = 100_000
+
+    # Notifications (worker threads, actions queued or running at once, and seconds each action may take)
+    NOTIFY_MAX_WORKERS = 4
+    NOTIFY_MAX_PENDING = 16
+    NOTIFY_TIMEOUT_SECONDS = 5
+
+    # Dashboard (thread CPU time one tick may spend on cells, and how many cells are drawn between
+    # checks of it, which is how far a tick can overrun the budget)
+    DASHBOARD_TICK_BUDGET_NS = 10_000_000
+    DASHBOARD_BUDGET_CHECK_CELLS = 16
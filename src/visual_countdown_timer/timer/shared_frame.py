@@ -0,0 +1,306 @@
+from .clock_utils import TickScheduler
+from .render_utils import FrameRenderer, OutputSink
+from .settings import TimerConfig
+from multiprocessing import resource_tracker, shared_memory
+import os
+import struct
+import time
+
+"""
+Shared-memory frame publishing for the Visual Countdown Timer.
+
+This module provides the SharedFramePublisher sink, which writes every new frame into
+a named shared memory segment, and the SharedFrameViewer class, which attaches to that
+segment from other terminals and draws the frames, so any number of panes on one host
+can show a single running timer without each of them redoing the timer's work.
+"""
+
+class SharedFramePublisher(OutputSink):
+    """
+    Publishes frames to a named shared memory segment.
+
+    Layout (little-endian):
+        magic (8 bytes), sequence number (uint64), state (uint32: LIVE or CLOSED),
+        frame length in bytes (uint32), publisher process ID (uint32), interval between
+        the publisher's frames in nanoseconds (uint64), padding up to HEADER_SIZE, then the
+        UTF-8 frame text.
+
+    The sequence number works as a seqlock: it is made odd before the frame is written
+    and even again afterwards, so a viewer that sees the same even number before and
+    after reading knows it read a whole frame. Frames identical to the previous one are
+    not published, so the sequence number only changes when the display does.
+
+    Attributes:
+        name (str): The name of the shared memory segment.
+
+    Example:
+        >>> TimerLoop.run(25, 12, sink=SharedFramePublisher('visual_countdown_timer'))
+    """
+
+    HEADER = struct.Struct('<8sQII')
+    PUBLISHER_PID = struct.Struct('<I')
+    FRAME_INTERVAL = struct.Struct('<Q')
+    HEADER_SIZE = 64
+    MAGIC = b'VCTFRAME'
+    LIVE = 1
+    CLOSED = 0
+
+    # Segments created by this process, which its resource tracker must keep tracking.
+    _created_names = set()
+
+    def __init__(self, name: str = TimerConfig.SHARED_FRAME_DEFAULT_NAME,
+                 frame_interval_ns: int = TimerConfig.TICK_INTERVAL_NS):
+        """
+        Creates the shared memory segment, replacing one left behind by a timer that did not exit cleanly.
+
+        Args:
+            name (str): The name of the shared memory segment.
+            frame_interval_ns (int): How often the timer draws a frame, in nanoseconds, so
+                viewers can check for new frames as often. Defaults to one second.
+        Raises:
+            ValueError: If another timer is still publishing under this name, or the
+                segment was not created by a SharedFramePublisher.
+        """
+        super().__init__(file_descriptor=-1)
+        self.name = name
+        size = self.HEADER_SIZE + TimerConfig.SHARED_FRAME_CAPACITY
+        try:
+            self._memory = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            self._remove_stale_segment(name)
+            self._memory = shared_memory.SharedMemory(name, create=True, size=size)
+        self._created_names.add(name)
+        self._sequence = 0
+        self._previous_frame = None
+        self.HEADER.pack_into(self._memory.buf, 0, self.MAGIC, 0, self.LIVE, 0)
+        self.PUBLISHER_PID.pack_into(self._memory.buf, self.HEADER.size, os.getpid())
+        self.FRAME_INTERVAL.pack_into(self._memory.buf, self.HEADER.size + self.PUBLISHER_PID.size, frame_interval_ns)
+
+    @classmethod
+    def _remove_stale_segment(cls, name: str):
+        """
+        Removes a segment whose publisher has closed it or is no longer running.
+
+        Args:
+            name (str): The name of the shared memory segment.
+        Raises:
+            ValueError: If the segment's publisher is still running, or the segment was
+                not created by a SharedFramePublisher.
+        """
+        memory = SharedFrameViewer._attach(name)
+        try:
+            magic, _, state, _ = cls.HEADER.unpack_from(memory.buf)
+            publisher_pid = cls.PUBLISHER_PID.unpack_from(memory.buf, cls.HEADER.size)[0]
+        finally:
+            memory.close()
+        if magic != cls.MAGIC:
+            raise ValueError(f"The shared memory segment {name!r} does not hold timer frames; refusing to replace it.")
+        if state == cls.LIVE and cls._process_is_running(publisher_pid):
+            raise ValueError(f"Another timer (process {publisher_pid}) is already publishing as {name!r}.")
+        shared_memory.SharedMemory(name).unlink()
+
+    @staticmethod
+    def _process_is_running(pid: int) -> bool:
+        """
+        Checks whether a process exists.
+
+        Args:
+            pid (int): The process ID.
+        Returns:
+            is_running (bool): Whether the process exists, even if it belongs to another user.
+        """
+        if pid <= 0:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def close(self):
+        """Tells viewers the timer has stopped, then removes the shared memory segment."""
+        self._write_header(self._sequence + 2, self.CLOSED, 0)
+        self._memory.close()
+        self._memory.unlink()
+        self._created_names.discard(self.name)
+
+    def _encode(self, frame_text: str) -> str:
+        """
+        Passes a frame on to be published, unless it is the same as the previous one.
+
+        Args:
+            frame_text (str): The complete text of the frame.
+        Returns:
+            update_text (str): The frame, or an empty string if nothing changed.
+        """
+        if frame_text == self._previous_frame:
+            return ''
+        self._previous_frame = frame_text
+        return frame_text
+
+    def _emit(self, update_text: str):
+        """
+        Writes a frame into the shared memory segment under the seqlock.
+
+        Frames too large for the segment are dropped.
+
+        Args:
+            update_text (str): The frame to publish.
+        """
+        frame_bytes = update_text.encode()
+        if len(frame_bytes) > TimerConfig.SHARED_FRAME_CAPACITY:
+            self.frames_dropped += 1
+            return
+        self._write_header(self._sequence + 1, self.LIVE, 0)
+        self._memory.buf[self.HEADER_SIZE:self.HEADER_SIZE + len(frame_bytes)] = frame_bytes
+        self._write_header(self._sequence + 1, self.LIVE, len(frame_bytes))
+        self.frames_written += 1
+
+    def _write_header(self, sequence: int, state: int, frame_length: int):
+        """
+        Writes the segment header.
+
+        Args:
+            sequence (int): The new sequence number. Odd while a frame is being written.
+            state (int): LIVE or CLOSED.
+            frame_length (int): The length of the frame in bytes.
+        """
+        self._sequence = sequence
+        self.HEADER.pack_into(self._memory.buf, 0, self.MAGIC, sequence, state, frame_length)
+
+
+class SharedFrameViewer:
+    """
+    Attaches to a SharedFramePublisher's segment and draws its frames.
+
+    Checking for a new frame only reads the header in place. The frame text is decoded
+    straight from the shared buffer, and only when the sequence number has changed.
+
+    Attributes:
+        name (str): The name of the shared memory segment.
+        closed (bool): Whether the publisher has stopped.
+        publisher_pid (int): The process ID of the publishing timer.
+        frame_interval_ns (int): How often the publisher draws a frame, in nanoseconds.
+        publisher_gone (bool): Whether the publisher exited without closing the segment.
+
+    Example:
+        >>> SharedFrameViewer('visual_countdown_timer').run()
+    """
+
+    READ_ATTEMPTS = 100
+
+    def __init__(self, name: str = TimerConfig.SHARED_FRAME_DEFAULT_NAME):
+        """
+        Attaches to the shared memory segment.
+
+        Args:
+            name (str): The name of the shared memory segment.
+        Raises:
+            FileNotFoundError: If no timer is publishing under this name.
+            ValueError: If the segment was not created by a SharedFramePublisher.
+        """
+        self.name = name
+        self.closed = False
+        self.publisher_gone = False
+        self._memory = self._attach(name)
+        self._last_sequence = None
+        if SharedFramePublisher.HEADER.unpack_from(self._memory.buf)[0] != SharedFramePublisher.MAGIC:
+            self._memory.close()
+            raise ValueError(f"The shared memory segment {name!r} does not hold timer frames.")
+        pid_offset = SharedFramePublisher.HEADER.size
+        self.publisher_pid = SharedFramePublisher.PUBLISHER_PID.unpack_from(self._memory.buf, pid_offset)[0]
+        self.frame_interval_ns = SharedFramePublisher.FRAME_INTERVAL.unpack_from(
+            self._memory.buf, pid_offset + SharedFramePublisher.PUBLISHER_PID.size
+        )[0] or TimerConfig.TICK_INTERVAL_NS
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        """
+        Opens an existing shared memory segment without taking ownership of it.
+
+        Before Python 3.13, attaching registers the segment with this process's resource
+        tracker, which would delete it when the viewer exits, while the publisher is
+        still using it. The registration is undone straight away, unless this process
+        created the segment itself.
+
+        Args:
+            name (str): The name of the shared memory segment.
+        Returns:
+            memory (SharedMemory): The attached segment.
+        """
+        try:
+            return shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            memory = shared_memory.SharedMemory(name)
+            if name not in SharedFramePublisher._created_names:
+                resource_tracker.unregister(memory._name, 'shared_memory')
+            return memory
+
+    def read_frame(self) -> str:
+        """
+        Returns the current frame if it changed since the last call.
+
+        Returns:
+            frame_text (str): The new frame, or None if there is no new frame (or the
+                publisher kept the segment locked for every attempt).
+        """
+        buffer = self._memory.buf
+        for _ in range(self.READ_ATTEMPTS):
+            _, sequence, state, frame_length = SharedFramePublisher.HEADER.unpack_from(buffer)
+            if state == SharedFramePublisher.CLOSED:
+                self.closed = True
+                return None
+            if sequence == self._last_sequence:
+                return None
+            if sequence & 1:
+                continue
+            if frame_length == 0:
+                # Nothing has been published yet.
+                return None
+            frame_start = SharedFramePublisher.HEADER_SIZE
+            frame_text = str(buffer[frame_start:frame_start + frame_length], 'utf-8', 'replace')
+            if SharedFramePublisher.HEADER.unpack_from(buffer)[1] == sequence:
+                self._last_sequence = sequence
+                return frame_text
+        return None
+
+    def run(self, sink: OutputSink = None):
+        """
+        Draws frames as they are published, until the publisher stops or exits.
+
+        The viewer wakes on the publisher's frame interval (each wall-clock second, or each
+        frame of the smooth display mode), when the publisher draws a new frame. If the
+        frame is not there yet, it checks again after 1, 2, 4... milliseconds, up to
+        TimerConfig.SHARED_FRAME_MAX_RETRY_SECONDS or half the frame interval, and
+        otherwise makes sure the publisher is still running and waits for the next frame.
+
+        Args:
+            sink (OutputSink): Where to draw the frames. Defaults to the terminal.
+        """
+        sink = sink if sink is not None else FrameRenderer()
+        scheduler = TickScheduler(interval_ns=self.frame_interval_ns)
+        max_retry_seconds = min(TimerConfig.SHARED_FRAME_MAX_RETRY_SECONDS, self.frame_interval_ns / 2e9)
+        try:
+            while True:
+                frame_text = self.read_frame()
+                retry_seconds = 0.001
+                while frame_text is None and not self.closed and retry_seconds <= max_retry_seconds:
+                    time.sleep(retry_seconds)
+                    retry_seconds *= 2
+                    frame_text = self.read_frame()
+                if self.closed:
+                    return
+                if frame_text is not None:
+                    sink.draw(frame_text)
+                elif not SharedFramePublisher._process_is_running(self.publisher_pid):
+                    self.publisher_gone = True
+                    return
+                scheduler.wait_for_next_tick()
+        finally:
+            self.close()
+
+    def close(self):
+        """Detaches from the shared memory segment."""
+        self._memory.close()
@@ -0,0 +1,210 @@
+from .schedule_utils import Schedule
+from .settings import TimerConfig
+import mmap
+import os
+import struct
+import zlib
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+"""
+Persistent state for the Visual Countdown Timer.
+
+This module provides the StateFile class, which keeps the active configuration and a
+history of recent ticks in a small, fixed-size file accessed through `mmap`. A
+restarted timer reads its configuration back from the file instead of asking for it
+again, and every tick is recorded by overwriting one slot of a ring buffer in place.
+"""
+
+class StateFile:
+    """
+    A fixed-layout, memory-mapped state file.
+
+    Layout (little-endian):
+        Header (HEADER_SIZE bytes):
+            magic (8 bytes), format version (uint16), hour format (uint16, 0 if unset),
+            target minute (int16, -1 for a schedule or if unset), padding (2 bytes),
+            ring capacity (uint32), next ring slot (uint32), ticks recorded (uint64),
+            schedule expression (SCHEDULE_FIELD_SIZE bytes, UTF-8, zero-padded)
+        Ring buffer (capacity * RECORD_SIZE bytes), one record per tick:
+            wall-clock time (int64 ns), wakeup lateness (int64 ns),
+            CRC-32 of the frame text (uint32), padding (4 bytes)
+
+    The file is created at its full size, so recording a tick never grows it: the record
+    is packed into its slot and the slot counter is updated, both in place.
+
+    The file stays locked (flock) while it is open, so two timers cannot record into the
+    same ring at once.
+
+    Attributes:
+        path (str): The path of the state file.
+        capacity (int): The number of tick records the ring buffer holds.
+
+    Example:
+        >>> state = StateFile('/tmp/timer.state')
+        >>> state.save_configuration(25, 12)
+        >>> state.configuration()
+        (25, 12)
+    """
+
+    MAGIC = b'VCTSTATE'
+    VERSION = 1
+    SCHEDULE_FIELD_SIZE = 96
+    HEADER_FORMAT = struct.Struct(f'<8sHHh2xIIQ{SCHEDULE_FIELD_SIZE}s')
+    HEADER_SIZE = 128
+    RING_POSITION_FORMAT = struct.Struct('<IQ')
+    RING_POSITION_OFFSET = 20
+    RECORD_FORMAT = struct.Struct('<qqI4x')
+    RECORD_SIZE = RECORD_FORMAT.size
+
+    def __init__(self, path: str, capacity: int = TimerConfig.STATE_RING_RECORDS):
+        """
+        Opens the state file at `path`, creating it if it is missing or empty.
+
+        A state file written by another version, or with a different capacity, is reset.
+        Any other non-empty file is left alone, so that a mistyped path cannot destroy it.
+
+        Args:
+            path (str): The path of the state file.
+            capacity (int): The number of tick records to keep, used when the file is created.
+        Raises:
+            ValueError: If the file is not empty and is not a state file, or another timer
+                has it open.
+        """
+        self.path = path
+        file_descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise ValueError(f"{path} is in use by another running timer.")
+            file_size = os.fstat(file_descriptor).st_size
+            header = os.pread(file_descriptor, self.HEADER_FORMAT.size, 0)
+            if file_size and not header.startswith(self.MAGIC):
+                raise ValueError(f"{path} is not a Visual Countdown Timer state file.")
+            if not self._header_is_valid(header, file_size):
+                os.ftruncate(file_descriptor, 0)
+                os.ftruncate(file_descriptor, self.HEADER_SIZE + capacity * self.RECORD_SIZE)
+                os.pwrite(
+                    file_descriptor,
+                    self.HEADER_FORMAT.pack(self.MAGIC, self.VERSION, 0, -1, capacity, 0, 0, b''),
+                    0
+                )
+            self._map = mmap.mmap(file_descriptor, 0)
+        except BaseException:
+            os.close(file_descriptor)
+            raise
+        # Closing the file descriptor would release the lock, so it stays open with the map.
+        self._file_descriptor = file_descriptor
+        self.capacity = self.HEADER_FORMAT.unpack_from(self._map)[4]
+        self._next_slot, self._ticks_recorded = self.RING_POSITION_FORMAT.unpack_from(
+            self._map, self.RING_POSITION_OFFSET
+        )
+
+    def _header_is_valid(self, header: bytes, file_size: int) -> bool:
+        """
+        Checks that a header was written by this version and matches the file's size.
+
+        Args:
+            header (bytes): The bytes at the start of the file.
+            file_size (int): The size of the file in bytes.
+        Returns:
+            is_valid (bool): Whether the file can be used as it is.
+        """
+        if len(header) < self.HEADER_FORMAT.size:
+            return False
+        magic, version, _, _, capacity, next_slot, _, _ = self.HEADER_FORMAT.unpack(header)
+        return (
+            magic == self.MAGIC and version == self.VERSION and capacity > 0
+            and next_slot < capacity and file_size == self.HEADER_SIZE + capacity * self.RECORD_SIZE
+        )
+
+    def configuration(self) -> tuple:
+        """
+        Reads back the saved configuration.
+
+        Returns:
+            countdown_minutes (int | Schedule): The saved minute or schedule, or None if unset.
+            hour_format (int): The saved hour format, or None if unset.
+        """
+        _, _, hour_format, target_minute, _, _, _, schedule_field = self.HEADER_FORMAT.unpack_from(self._map)
+        expression = schedule_field.rstrip(b'\0').decode(errors='ignore')
+        if target_minute >= 0:
+            countdown_minutes = target_minute
+        elif expression:
+            try:
+                countdown_minutes = Schedule(expression)
+            except ValueError:
+                countdown_minutes = None
+        else:
+            countdown_minutes = None
+        return countdown_minutes, (hour_format if hour_format in TimerConfig.POSSIBLE_HOUR_FORMATS else None)
+
+    def save_configuration(self, countdown_minutes, hour_format: int):
+        """
+        Saves the configuration, so that a restarted timer can resume without prompting.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule.
+            hour_format (int): Time display format (12 or 24 hour)
+        Raises:
+            ValueError: If the schedule expression does not fit in the state file.
+        """
+        if isinstance(countdown_minutes, Schedule):
+            target_minute = -1
+            schedule_field = countdown_minutes.expression.encode()
+            if len(schedule_field) > self.SCHEDULE_FIELD_SIZE:
+                raise ValueError(f"Schedules longer than {self.SCHEDULE_FIELD_SIZE} bytes cannot be saved.")
+        else:
+            target_minute = countdown_minutes
+            schedule_field = b''
+        self.HEADER_FORMAT.pack_into(
+            self._map, 0,
+            self.MAGIC, self.VERSION, hour_format, target_minute,
+            self.capacity, self._next_slot, self._ticks_recorded, schedule_field
+        )
+
+    def record_tick(self, timestamp_ns: int, lateness_ns: int, frame_text: str):
+        """
+        Records one tick in the ring buffer, overwriting the oldest record once it is full.
+
+        Args:
+            timestamp_ns (int): The wall-clock time of the tick, in nanoseconds since the epoch.
+            lateness_ns (int): How late the tick woke up, in nanoseconds.
+            frame_text (str): The frame drawn on this tick.
+        """
+        self.RECORD_FORMAT.pack_into(
+            self._map, self.HEADER_SIZE + self._next_slot * self.RECORD_SIZE,
+            timestamp_ns, lateness_ns, zlib.crc32(frame_text.encode())
+        )
+        self._next_slot = (self._next_slot + 1) % self.capacity
+        self._ticks_recorded += 1
+        self.RING_POSITION_FORMAT.pack_into(
+            self._map, self.RING_POSITION_OFFSET, self._next_slot, self._ticks_recorded
+        )
+
+    def records(self) -> list:
+        """
+        Reads the tick history, oldest first.
+
+        Returns:
+            records (list): One (timestamp_ns, lateness_ns, frame_crc32) tuple per recorded tick.
+        """
+        record_count = min(self._ticks_recorded, self.capacity)
+        first_slot = (self._next_slot - record_count) % self.capacity
+        return [
+            self.RECORD_FORMAT.unpack_from(
+                self._map, self.HEADER_SIZE + (first_slot + index) % self.capacity * self.RECORD_SIZE
+            )
+            for index in range(record_count)
+        ]
+
+    def close(self):
+        """Flushes the state to disk, unmaps the file and releases the lock."""
+        self._map.flush()
+        self._map.close()
+        os.close(self._file_descriptor)
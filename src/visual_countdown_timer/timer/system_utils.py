@@ -1,11 +1,13 @@
+from .clock_utils import SystemClock
 from .settings import DisplaySettings, TimerConfig
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Callable
 import os
+import shutil
 import signal
 import sys
 import textwrap
-import time
 
 """
 System-level utilities for the Visual Countdown Timer.
@@ -14,8 +16,67 @@ This module provides classes for handling system operations like terminal
 clearing, timing controls, and text processing utilities.
 """
 
+class LRUCache:
+    """
+    A mapping with a maximum size that evicts its least recently used entries.
+
+    Attributes:
+        max_size (int): The largest number of entries kept before evicting.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): The largest number of entries kept before evicting.
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for a key, marking it as recently used.
+
+        Args:
+            key: The key to look up.
+            default: The value to return if the key is not cached.
+        Returns:
+            The cached value, or `default` if the key is not cached.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        """
+        Caches a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        self._entries.clear()
+
 class SystemUtils:
     """Handles system-level operations like terminal clearing and timing."""
+
+    # Wrapped lines, keyed by (line, width). Most of the frame is the same every
+    # second, so each static line is only wrapped once per terminal width.
+    _layout_cache = LRUCache(DisplaySettings.LAYOUT_CACHE_SIZE)
     
     @staticmethod
     def clean_text(unformatted_text: str) -> str:
@@ -79,14 +140,15 @@ class SystemUtils:
 
         wrapped_lines = []
         extra_linebreaks_needed = False
+        terminal_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
 
         for line in unformatted_text.splitlines():
             if line.strip() != '':
                 if extra_linebreaks_desired:
                     if not extra_linebreaks_needed:
-                        if len(line) > DisplaySettings.TERMINAL_WINDOW_WIDTH:
+                        if len(line) > terminal_width:
                             extra_linebreaks_needed = True
-                wrapped_lines.append(textwrap.fill(line, width=DisplaySettings.TERMINAL_WINDOW_WIDTH))
+                wrapped_lines.append(SystemUtils._wrap_line(line, terminal_width))
 
         separator = '\n\n' if (extra_linebreaks_desired and extra_linebreaks_needed) else '\n'
         wrapped_text = separator.join(wrapped_lines)
@@ -94,19 +156,48 @@ class SystemUtils:
             wrapped_text += ' '
         return wrapped_text
 
+    @classmethod
+    def _wrap_line(cls, line: str, width: int) -> str:
+        """
+        Wraps a single line to the given width, reusing the result of any earlier call.
+
+        Args:
+            line (str): A non-empty line of text.
+            width (int): The width to wrap to.
+        Returns:
+            wrapped_line (str): The line wrapped with textwrap.fill.
+        """
+        # A line that already fits only loses its trailing spaces to textwrap. Skipping the
+        # cache for it also keeps lines that change every second (the big digits) from
+        # pushing the static lines out of the cache.
+        if len(line) <= width and '\t' not in line:
+            return line.rstrip(' ')
+        cache_key = (line, width)
+        wrapped_line = cls._layout_cache.get(cache_key)
+        if wrapped_line is None:
+            wrapped_line = textwrap.fill(line, width=width)
+            cls._layout_cache.set(cache_key, wrapped_line)
+        return wrapped_line
+
     @staticmethod
-    def sleep_until_next_second(current_time: datetime):
+    def sleep_until_next_second(current_time: datetime, clock: SystemClock = None):
         """
         Pauses execution to align next loop with the next full second.
         
         Calculates fractional time remaining in current second and sleeps
         for that duration to ensure loops run on second boundaries.
+
+        Args:
+            current_time (datetime): The current time, as read from `clock`.
+            clock (SystemClock): The clock to sleep on. Defaults to the system's clocks.
         """
         remaining_time_until_next_loop = 1 - (current_time.microsecond / 1_000_000)
-        return time.sleep(remaining_time_until_next_loop)
+        return (clock if clock is not None else SystemClock()).sleep(remaining_time_until_next_loop)
     
 class TerminalUtils:
 
+    EXIT_MESSAGE = "\n\nTimer stopped. Thank you for using Visual Countdown Timer!\n\n"
+
     @staticmethod
     def clear_terminal():
         """Clears the terminal screen."""
@@ -120,6 +211,24 @@ class TerminalUtils:
         else:
             os.system('clear')
 
+    @staticmethod
+    def initialize_resize_handler():
+        """
+        Tracks terminal resizes (SIGWINCH) so the display can follow the new size.
+
+        The handler only updates DisplaySettings.TERMINAL_WINDOW_WIDTH and TERMINAL_WINDOW_HEIGHT,
+        so nothing needs to be re-measured on every tick. It leaves the wrapped-line cache alone,
+        since it can interrupt a lookup halfway; the cache is keyed by width, so lines wrapped for
+        the old width are simply no longer used and age out.
+        Does nothing on platforms without SIGWINCH, such as Windows.
+        """
+        if not hasattr(signal, 'SIGWINCH'):
+            return
+
+        def resize_handler(sig, frame):
+            DisplaySettings.TERMINAL_WINDOW_WIDTH, DisplaySettings.TERMINAL_WINDOW_HEIGHT = shutil.get_terminal_size()
+        signal.signal(signal.SIGWINCH, resize_handler)
+
     @staticmethod
     def initialize_exit_handler():
         """Setup graceful shutdown handler for interrupt signals (typically Ctrl+C)."""
@@ -127,7 +236,7 @@ class TerminalUtils:
         def signal_handler(sig, frame):
             print(
                 SystemUtils.wrap_text(
-                    "\n\nTimer stopped. Thank you for using Visual Countdown Timer!\n\n"
+                    TerminalUtils.EXIT_MESSAGE
                 )
             )
             sys.exit(TimerConfig.EXIT_SUCCESS)
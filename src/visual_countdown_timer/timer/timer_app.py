@@ -1,6 +1,22 @@
+from .async_runtime import AsyncTimerRuntime
+from .broadcast_server import FrameBroadcaster
+from .clock_utils import VirtualClock
+from .dashboard import Dashboard
 from .display_utils import UserDisplay
+from .metrics_utils import TickMetrics
+from .notify_utils import BellAction, CommandAction, FileAppendAction, Notifier, WebhookAction
+from .output_sinks import OutputSinks
+from .roster_utils import Roster
+from .schedule_utils import Schedule
+from .settings import DisplaySettings, TimerConfig
+from .shared_frame import SharedFramePublisher, SharedFrameViewer
+from .state_file import StateFile
 from .system_utils import SystemUtils, TerminalUtils
 from .timer_utils import TimerLoop, UserInput
+from .timezone_utils import ZoneClock
+from datetime import datetime
+import argparse
+import zoneinfo
 
 """
 Main application coordinator for the Visual Countdown Timer.
@@ -11,16 +27,338 @@ components to create the complete countdown timer application.
 
 class TimerApp:
     """Main application coordinator."""
-    
-    def __init__(self):
-        """Initialize the timer application."""
+
+    def __init__(self, options: argparse.Namespace = None):
+        """
+        Initialize the timer application.
+
+        Args:
+            options (argparse.Namespace): Parsed command-line options. Defaults to no options.
+        """
+        self.options = options if options is not None else self.parse_arguments([])
         exit_handler = TerminalUtils.initialize_exit_handler()
+        TerminalUtils.initialize_resize_handler()
         # Change to exit_handler_initialized = TerminalUtils...() where the function returns either True or False
 
+    @staticmethod
+    def parse_arguments(argv: list = None) -> argparse.Namespace:
+        """
+        Parses the command-line options.
+
+        Args:
+            argv (list): The arguments to parse. Defaults to sys.argv.
+        Returns:
+            options (argparse.Namespace): The parsed options.
+        """
+        parser = argparse.ArgumentParser(
+            prog='python -m visual_countdown_timer',
+            description='A continuous visual hourly countdown timer for the terminal.'
+        )
+        parser.add_argument('--minute', type=int,
+                            help='Minute past each hour to count down to (0-59). Skips the prompt.')
+        parser.add_argument('--schedule', metavar='EXPRESSION',
+                            help='Count down to the next time a cron-style schedule fires instead of a '
+                                 'minute past every hour, e.g. "*/15 * * * *" or "0,30 9-17 * * mon-fri". '
+                                 'Skips the prompt.')
+        parser.add_argument('--hour-format', type=int, choices=TimerConfig.POSSIBLE_HOUR_FORMATS,
+                            help='Time display format, 12 or 24 hours. Skips the prompt.')
+        parser.add_argument('--hotkeys', action='store_true',
+                            help='Run on an event loop with live hotkeys: +/- change the target minute, '
+                                 'h switches between 12 and 24 hours, p pauses, q quits.')
+        parser.add_argument('--serve', metavar='ADDRESS',
+                            help='Render each frame once and broadcast it to local clients instead of '
+                                 'drawing it here. ADDRESS is unix:PATH (raw terminal frames) or '
+                                 'http:HOST:PORT (Server-Sent Events). http:PORT listens on 127.0.0.1 only.')
+        parser.add_argument('--publish', metavar='NAME', nargs='?', const=TimerConfig.SHARED_FRAME_DEFAULT_NAME,
+                            help='Publish each frame to a shared memory segment instead of drawing it here, '
+                                 'for other terminals on this computer to show with --attach.')
+        parser.add_argument('--attach', metavar='NAME', nargs='?', const=TimerConfig.SHARED_FRAME_DEFAULT_NAME,
+                            help='Show the frames of a timer running with --publish, instead of running a timer.')
+        parser.add_argument('--smooth', metavar='FPS', type=int, nargs='?', const=DisplaySettings.SMOOTH_FPS_DEFAULT,
+                            help='Redraw FPS times per second (10-60, default 30) with a smooth, '
+                                 'high-resolution progress bar.')
+        parser.add_argument('--milliseconds', action='store_true',
+                            help='With --smooth, show the remaining seconds to the millisecond.')
+        parser.add_argument('--hide-seconds', action='store_true',
+                            help='Show the remaining time in whole minutes only. The display then '
+                                 'changes once a minute, so the timer only wakes up once a minute.')
+        parser.add_argument('--big', action='store_true',
+                            help='Draw the remaining time with large block digits, as big as the '
+                                 'terminal allows, so it can be read from across a room.')
+        parser.add_argument('--zones', metavar='ZONES',
+                            help='Also show the current time in these IANA timezones, separated by '
+                                 'commas (for example Europe/Berlin,America/New_York).')
+        parser.add_argument('--output', metavar='SINK', default='auto',
+                            help='Where to draw the timer: tty (update the terminal in place), '
+                                 'log:PATH (append only the changed lines to a file), pipe (one line '
+                                 'per frame on stdout), null, or auto (the default), which picks tty, '
+                                 'log or pipe depending on what stdout is.')
+        parser.add_argument('--state-file', metavar='PATH', nargs='?', const=TimerConfig.STATE_FILE_DEFAULT_PATH,
+                            help='Save the settings and a history of recent ticks in PATH (default: '
+                                 '~/.visual_countdown_timer.state). When restarted with the same state '
+                                 'file, the timer resumes without asking for its settings again.')
+        parser.add_argument('--no-resume', action='store_true',
+                            help='With --state-file, ask for the settings again instead of resuming.')
+        parser.add_argument('--history', action='store_true',
+                            help='Print the tick history saved in the state file, then exit.')
+        parser.add_argument('--on-zero-bell', action='store_true',
+                            help='Ring the terminal bell each time the countdown reaches its target.')
+        parser.add_argument('--on-zero-command', metavar='COMMAND', action='append', default=[],
+                            help='Run a shell command each time the countdown reaches its target. The '
+                                 'target time is in the VISUAL_COUNTDOWN_TARGET environment variable. '
+                                 'Can be given more than once.')
+        parser.add_argument('--on-zero-append', metavar='PATH', action='append', default=[],
+                            help='Append a JSON line to PATH each time the countdown reaches its target. '
+                                 'Can be given more than once.')
+        parser.add_argument('--on-zero-webhook', metavar='URL', action='append', default=[],
+                            help='POST a JSON message to URL each time the countdown reaches its target. '
+                                 'Can be given more than once.')
+        parser.add_argument('--simulate', metavar='START', nargs='?', const='now',
+                            help='Run the timer on a simulated clock from START (an ISO date and time, '
+                                 'default now) as fast as possible, drawing every frame, then exit. '
+                                 'Run with TZ set to simulate another timezone.')
+        parser.add_argument('--simulate-hours', metavar='HOURS', type=float, default=TimerConfig.SIMULATE_HOURS_DEFAULT,
+                            help='With --simulate, how many hours to simulate (default 24).')
+        parser.add_argument('--dashboard', metavar='PATH',
+                            help='Show every timer of the roster at PATH in one terminal, as a grid '
+                                 'that fits the terminal. Each timer has its own target, hour format '
+                                 'and label; see --check-roster for the roster format.')
+        parser.add_argument('--check-roster', metavar='PATH',
+                            help='Validate the timer definitions in a CSV or JSON-lines roster file, print '
+                                 'every invalid row, then exit.')
+        parser.add_argument('--metrics-file', metavar='PATH',
+                            help='Time every stage of every tick and write the measurements to PATH '
+                                 'in the Prometheus text format.')
+        options = parser.parse_args(argv)
+        if options.serve is not None and not options.serve.startswith(('unix:', 'http:')):
+            parser.error('--serve must be unix:PATH, http:HOST:PORT or http:PORT.')
+        if options.output not in ('auto', 'tty', 'pipe', 'null') and not options.output.startswith('log:'):
+            parser.error('--output must be auto, tty, log:PATH, pipe or null.')
+        if options.smooth is not None and not (DisplaySettings.SMOOTH_FPS_MIN <= options.smooth <= DisplaySettings.SMOOTH_FPS_MAX):
+            parser.error('--smooth must be between 10 and 60 frames per second.')
+        options.notification_actions = (
+            ([BellAction()] if options.on_zero_bell else [])
+            + [CommandAction(command) for command in options.on_zero_command]
+            + [FileAppendAction(path) for path in options.on_zero_append]
+            + [WebhookAction(url) for url in options.on_zero_webhook]
+        )
+        if options.dashboard and (options.serve or options.hotkeys or options.publish or options.smooth or options.big
+                                  or options.notification_actions):
+            parser.error('--dashboard cannot be used with --serve, --hotkeys, --publish, --smooth, --big '
+                         'or --on-zero options.')
+        if options.hotkeys and (options.smooth or options.publish or options.output != 'auto'
+                                or options.metrics_file or options.state_file):
+            parser.error('--hotkeys cannot be used with --smooth, --publish, --output, --metrics-file '
+                         'or --state-file.')
+        if options.smooth and (options.metrics_file or options.state_file):
+            parser.error('--smooth cannot be used with --metrics-file or --state-file.')
+        if options.serve and (options.smooth or options.publish or options.output != 'auto' or options.metrics_file):
+            parser.error('--serve cannot be used with --smooth, --publish, --output or --metrics-file.')
+        if options.notification_actions and (options.serve or options.hotkeys):
+            parser.error('--on-zero options cannot be used with --serve or --hotkeys.')
+        for url in options.on_zero_webhook:
+            if not url.startswith(('http://', 'https://')):
+                parser.error(f'--on-zero-webhook: {url!r} is not an http:// or https:// URL.')
+        if options.simulate is not None:
+            if options.serve or options.hotkeys or options.notification_actions:
+                parser.error('--simulate cannot be used with --serve, --hotkeys or --on-zero options.')
+            if options.simulate_hours <= 0:
+                parser.error('--simulate-hours must be more than 0.')
+            try:
+                simulate_start = datetime.now() if options.simulate == 'now' else datetime.fromisoformat(options.simulate)
+            except ValueError:
+                parser.error(f'--simulate: {options.simulate!r} is not an ISO date and time, such as 2026-03-28T00:00.')
+            options.simulate_start = simulate_start.astimezone().timestamp()
+        if options.history and options.state_file is None:
+            options.state_file = TimerConfig.STATE_FILE_DEFAULT_PATH
+        options.zone_clocks = []
+        for zone_name in (options.zones or '').split(','):
+            if not zone_name.strip():
+                continue
+            try:
+                options.zone_clocks.append(ZoneClock(zone_name.strip()))
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                parser.error(f'--zones: unknown timezone {zone_name.strip()!r}.')
+        if options.minute is not None and not (TimerConfig.MIN_MINUTES <= options.minute <= TimerConfig.MAX_MINUTES):
+            parser.error('--minute must be a whole number between 0 and 59.')
+        if options.schedule is not None:
+            if options.minute is not None:
+                parser.error('--minute and --schedule cannot be used together.')
+            try:
+                schedule = Schedule(options.schedule)
+            except ValueError as error:
+                parser.error(f'--schedule: {error}')
+            options.minute = schedule.single_minute if schedule.single_minute is not None else schedule
+            if options.state_file and len(schedule.expression.encode()) > StateFile.SCHEDULE_FIELD_SIZE:
+                parser.error(
+                    f'--schedule: schedules longer than {StateFile.SCHEDULE_FIELD_SIZE} bytes cannot be saved '
+                    'in the state file; shorten it (for example with ranges or steps) or drop --state-file.'
+                )
+        return options
+
     def run(self):
         """Run the main timer application."""
+        if self.options.hide_seconds:
+            DisplaySettings.SHOW_SECONDS = False
+        if self.options.big:
+            DisplaySettings.BIG_DIGITS = True
+        if self.options.attach:
+            self._attach(self.options.attach)
+            return
+        if self.options.check_roster:
+            self._check_roster(self.options.check_roster)
+            return
+        if self.options.dashboard:
+            self._start_dashboard(self.options.dashboard)
+            return
+        try:
+            state_file = StateFile(self.options.state_file) if self.options.state_file else None
+        except (OSError, ValueError) as error:
+            print(SystemUtils.wrap_text(f"\nError: could not open the state file: {error}"))
+            return
+        try:
+            if self.options.history:
+                self._print_history(state_file)
+                return
+            countdown_minutes, hour_format = self._get_preferences(state_file)
+            if state_file is not None:
+                try:
+                    state_file.save_configuration(countdown_minutes, hour_format)
+                except ValueError as error:
+                    print(SystemUtils.wrap_text(f"\nThe settings will not be saved in the state file: {error}"))
+            self._start_timer(countdown_minutes, hour_format, state_file)
+        finally:
+            if state_file is not None:
+                state_file.close()
+
+    def _start_timer(self, countdown_minutes, hour_format: int, state_file: StateFile = None):
+        """
+        Starts the timer loop chosen by the command-line options.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule.
+            hour_format (int): Time display format (12 or 24 hour)
+            state_file (StateFile): Optional state file to record every tick in.
+        """
+        if self.options.serve:
+            try:
+                broadcaster = FrameBroadcaster(self.options.serve)
+            except (OSError, ValueError) as error:
+                print(SystemUtils.wrap_text(f"\nError: could not serve on {self.options.serve}: {error}"))
+                return
+            print(
+                SystemUtils.wrap_text(
+                    f"\nBroadcasting the countdown on {self.options.serve}. Press Ctrl + C to stop."
+                )
+            )
+            broadcaster.serve_forever(countdown_minutes, hour_format, self.options.zone_clocks, state_file)
+        elif self.options.hotkeys:
+            AsyncTimerRuntime(countdown_minutes, hour_format, self.options.zone_clocks).run()
+        else:
+            if self.options.publish:
+                try:
+                    frame_interval_ns = (
+                        1_000_000_000 // self.options.smooth if self.options.smooth else TimerConfig.TICK_INTERVAL_NS
+                    )
+                    sink = SharedFramePublisher(self.options.publish, frame_interval_ns)
+                except ValueError as error:
+                    print(SystemUtils.wrap_text(f"\nError: {error}"))
+                    return
+                print(
+                    SystemUtils.wrap_text(
+                        f"\nPublishing the countdown as {self.options.publish}. Show it in other terminals with:"
+                        f"\n{UserDisplay.INDENT}python3 -m visual_countdown_timer --attach {self.options.publish}"
+                        "\nPress Ctrl + C to stop."
+                    )
+                )
+            else:
+                sink = OutputSinks.open(self.options.output)
+            clock = until = None
+            if self.options.simulate is not None:
+                # A simulation runs faster than any reader, so no frame may be dropped.
+                sink.write_every_frame()
+                clock = VirtualClock(self.options.simulate_start)
+                until = self.options.simulate_start + self.options.simulate_hours * 60 * 60
+            notifier = None
+            if self.options.notification_actions:
+                notifier = Notifier(countdown_minutes, self.options.notification_actions, clock)
+            try:
+                if self.options.smooth:
+                    TimerLoop.run_smooth(
+                        countdown_minutes, hour_format, self.options.smooth, self.options.milliseconds, sink,
+                        self.options.zone_clocks, clock, until, notifier
+                    )
+                else:
+                    metrics = TickMetrics(self.options.metrics_file) if self.options.metrics_file else None
+                    TimerLoop.run(
+                        countdown_minutes, hour_format, metrics, sink, self.options.zone_clocks, state_file, clock, until,
+                        notifier
+                    )
+            finally:
+                if notifier is not None:
+                    notifier.close()
+                sink.close()
+
+    def _start_dashboard(self, path: str):
+        """
+        Shows every timer of a roster as a grid, once the whole roster is known to be valid.
+
+        Args:
+            path (str): The path of the roster file.
+        """
+        roster = Roster(path)
+        definitions = []
+        try:
+            for definition, errors in roster.entries():
+                for error in errors:
+                    print(error)
+                if definition is not None:
+                    definitions.append(definition)
+        except (OSError, UnicodeDecodeError, ValueError) as error:
+            print(SystemUtils.wrap_text(f"\nError: could not read the roster {path}: {error}"))
+            return
+        if roster.rows_invalid or not definitions:
+            print(
+                SystemUtils.wrap_text(
+                    f"\nError: the roster {path} has {roster.rows_invalid} invalid and {len(definitions)} "
+                    "valid timer definitions. The dashboard needs at least one, and no invalid ones."
+                )
+            )
+            return
+        sink = Dashboard.open_sink(self.options.output)
+        clock = until = None
+        if self.options.simulate is not None:
+            sink.write_every_frame()
+            clock = VirtualClock(self.options.simulate_start)
+            until = self.options.simulate_start + self.options.simulate_hours * 60 * 60
+        try:
+            Dashboard(definitions, sink, clock).run(until)
+        finally:
+            sink.close()
+
+    def _get_preferences(self, state_file: StateFile = None) -> tuple:
+        """
+        Prompts the user for any preferences not given on the command line or saved in the state file.
+
+        Args:
+            state_file (StateFile): Optional state file to resume the saved preferences from.
+        Returns:
+            countdown_minutes (int | Schedule): A valid countdown minute (0–59), or a compiled schedule.
+            hour_format (int): The user's preferred time format (12 or 24).
+        """
+        countdown_minutes = self.options.minute
+        hour_format = self.options.hour_format
+        if state_file is not None and not self.options.no_resume:
+            saved_countdown_minutes, saved_hour_format = state_file.configuration()
+            if countdown_minutes is None:
+                countdown_minutes = saved_countdown_minutes
+            if hour_format is None:
+                hour_format = saved_hour_format
+        if countdown_minutes is not None and hour_format is not None:
+            return countdown_minutes, hour_format
+
         TerminalUtils.clear_terminal()
-        
+
         # Get user preferences
         print(
             SystemUtils.wrap_text(
@@ -33,8 +371,84 @@ class TimerApp:
                 UserDisplay.TIMER_INTRO_TEXT
             )
         )
-        countdown_minutes = UserInput.get_countdown_time()
-        hour_format = UserInput.get_hour_format()
-        
-        # Start timer loop
-        TimerLoop.run(countdown_minutes, hour_format)
+        if countdown_minutes is None:
+            countdown_minutes = UserInput.get_countdown_time()
+        if hour_format is None:
+            hour_format = UserInput.get_hour_format()
+        return countdown_minutes, hour_format
+
+    def _attach(self, name: str):
+        """
+        Shows the frames of a timer publishing to shared memory, until it stops.
+
+        Args:
+            name (str): The name the timer publishes under.
+        """
+        try:
+            viewer = SharedFrameViewer(name)
+        except (FileNotFoundError, ValueError):
+            print(
+                SystemUtils.wrap_text(
+                    f"\nNo timer is publishing as {name}. Start one with --publish {name} first."
+                )
+            )
+            return
+        sink = OutputSinks.open(self.options.output)
+        try:
+            viewer.run(sink)
+        finally:
+            sink.close()
+        if viewer.publisher_gone:
+            print(
+                SystemUtils.wrap_text(
+                    f"\nThe timer publishing as {name} (process {viewer.publisher_pid}) is gone; it exited without stopping."
+                )
+            )
+            return
+        print(
+            SystemUtils.wrap_text(
+                "\nThe timer has stopped."
+            )
+        )
+
+    @staticmethod
+    def _print_history(state_file: StateFile):
+        """
+        Prints the ticks recorded in the state file, oldest first.
+
+        Args:
+            state_file (StateFile): The state file to read.
+        """
+        records = state_file.records()
+        if not records:
+            print(SystemUtils.wrap_text(f"\nNo ticks have been recorded in {state_file.path} yet."))
+            return
+        for timestamp_ns, lateness_ns, frame_crc32 in records:
+            tick_time = datetime.fromtimestamp(timestamp_ns / 1_000_000_000).astimezone()
+            print(
+                f"{tick_time.isoformat(timespec='milliseconds')}  "
+                f"late {lateness_ns / 1_000_000:7.3f} ms  frame {frame_crc32:08x}"
+            )
+
+    @staticmethod
+    def _check_roster(path: str):
+        """
+        Validates a roster file in one pass, printing each error as it is found, then a summary.
+
+        Args:
+            path (str): The path of the roster file.
+        """
+        roster = Roster(path)
+        try:
+            for definition, errors in roster.entries():
+                for error in errors:
+                    print(error)
+        except (OSError, UnicodeDecodeError, ValueError) as error:
+            print(SystemUtils.wrap_text(f"\nError: could not read the roster {path}: {error}"))
+            return
+        print(
+            SystemUtils.wrap_text(
+                f"\nChecked {roster.rows_read} timer definitions in {path}: "
+                f"{roster.rows_read - roster.rows_invalid} valid, {roster.rows_invalid} invalid."
+            )
+        )
@@ -1,7 +1,12 @@
 from datetime import datetime, timedelta
-from .display_utils import ProgressBar, UserDisplay
-from .settings import TimerConfig
-from .system_utils import SystemUtils, TerminalUtils
+from .big_digits import BigDigits
+from .clock_utils import SystemClock, TickScheduler
+from .display_utils import ProgressBar, SmoothProgressBar, UserDisplay
+from .render_utils import FrameRenderer
+from .schedule_utils import Schedule
+from .settings import DisplaySettings, TimerConfig
+from .system_utils import LRUCache, SystemUtils
+from .timezone_utils import ZoneClock
 from .validation_checks import InputIsValid
 
 """
@@ -16,23 +21,35 @@ class Format:
     Formats time and date entries for user display.
     """
 
-    @staticmethod
-    def date(datetime_unformatted: datetime) -> datetime:
+    # Formatted strings only change once a minute (times) or once a day (dates),
+    # so most ticks can reuse a previous result instead of calling strftime.
+    _date_cache = LRUCache(DisplaySettings.FORMAT_CACHE_SIZE)
+    _time_cache = LRUCache(DisplaySettings.FORMAT_CACHE_SIZE)
+
+    @classmethod
+    def date(cls, datetime_unformatted: datetime) -> datetime:
         """
         Formats a date for the user display.
+        Results are cached per calendar date.
 
         Args:
             datetime_unformatted (datetime): The datetime object to format
         Returns:
             date_formatted (datetime): The formatted date.
         """
-        date_formatted = datetime_unformatted.strftime('%B %d, %Y')
+        cache_key = (datetime_unformatted.year, datetime_unformatted.month, datetime_unformatted.day)
+        date_formatted = cls._date_cache.get(cache_key)
+        if date_formatted is None:
+            date_formatted = datetime_unformatted.strftime('%B %d, %Y')
+            cls._date_cache.set(cache_key, date_formatted)
         return date_formatted
 
     @classmethod
     def time(cls, datetime_unformatted: datetime, hour_display_format: int) -> str:
         """
         Formats a datetime object into a 12-hour or 24-hour time string.
+        Results are cached per minute, UTC offset and timezone name, so the cache stays
+        correct across midnight and daylight saving time transitions.
         This function assumes that the `hour_display_format` input has been checked, and is:
             1) An integer.
             2) A valid hour display format, as defined in settings.TimerConfig.POSSIBLE_HOUR_FORMATS.
@@ -45,11 +62,23 @@ class Format:
             time_formatted (str): Formatted time string
         """
 
+        cache_key = (
+            datetime_unformatted.hour,
+            datetime_unformatted.minute,
+            datetime_unformatted.utcoffset(),
+            datetime_unformatted.tzname(),
+            hour_display_format,
+        )
+        time_formatted = cls._time_cache.get(cache_key)
+        if time_formatted is not None:
+            return time_formatted
+
         if hour_display_format == 12:
             time_formatted_notimezone = cls._time_12h(datetime_unformatted)
         elif hour_display_format == 24:
             time_formatted_notimezone = cls._time_24h(datetime_unformatted)
         time_formatted = cls._add_timezone(datetime_unformatted, time_formatted_notimezone)
+        cls._time_cache.set(cache_key, time_formatted)
         return time_formatted
 
     @staticmethod
@@ -62,10 +91,47 @@ class Format:
         Returns:
             time_with_timezone (str): The time string with timezone appended            
         """
-        timezone = datetime_unformatted.strftime('%Z')
+        timezone = datetime_unformatted.tzname() or ''
         time_with_timezone = time_without_timezone + ' ' + timezone
         return time_with_timezone
 
+    @classmethod
+    def target_time(cls, target_datetime: datetime, datetime_now: datetime, hour_display_format: int) -> str:
+        """
+        Formats the countdown target. Targets more than an hour away also show the weekday.
+
+        Args:
+            target_datetime (datetime): The time being counted down to.
+            datetime_now (datetime): The current date and time.
+            hour_display_format (int): 12 or 24 hour format
+        Returns:
+            target_time_formatted (str): The formatted target time, e.g. '3:25pm CET' or 'Mon 9:00am CET'.
+        """
+        target_time_formatted = cls.time(target_datetime, hour_display_format)
+        if target_datetime - datetime_now > timedelta(hours=1):
+            target_time_formatted = f"{target_datetime.strftime('%a')} {target_time_formatted}"
+        return target_time_formatted
+
+    @classmethod
+    def zone_times(cls, zone_clocks: list, datetime_now: datetime, hour_display_format: int) -> str:
+        """
+        Formats the time in each of several other timezones, one zone per line.
+
+        Args:
+            zone_clocks (list): The ZoneClock of each timezone to show.
+            datetime_now (datetime): The current date and time.
+            hour_display_format (int): 12 or 24 hour format
+        Returns:
+            zone_times_formatted (str): One 'Label: time' line per zone.
+        """
+        if not zone_clocks:
+            return ''
+        timestamp = datetime_now.timestamp()
+        return '\n'.join(
+            f'{zone_clock.label}: {cls.time(zone_clock.now(timestamp), hour_display_format)}'
+            for zone_clock in zone_clocks
+        )
+
     @staticmethod
     def _time_12h(datetime_unformatted: datetime) -> str:
         """
@@ -106,11 +172,50 @@ class Format:
         Returns:
             remaining_time (str): The formatted number of remaining minutes and seconds.
         """
-        minutes_formatted = Format._remaining_time_individual(remaining_minutes, 'minute')
+        hours_and_minutes_formatted = Format._remaining_hours_and_minutes(remaining_minutes)
         seconds_formatted = Format._remaining_time_individual(remaining_seconds, 'second')
-        remaining_time_formatted = Format._remaining_times_combined(minutes_formatted, seconds_formatted)
+        remaining_time_formatted = Format._remaining_times_combined(*hours_and_minutes_formatted, seconds_formatted)
         return remaining_time_formatted
     
+    @staticmethod
+    def remaining_time_precise(remaining_minutes: int, remaining_seconds: int, remaining_milliseconds: int) -> str:
+        """
+        Formats the remaining minutes, seconds and milliseconds for display in-app.
+
+        Args:
+            remaining_minutes (int): The unformatted number of remaining minutes.
+            remaining_seconds (int): The unformatted number of remaining whole seconds.
+            remaining_milliseconds (int): The unformatted number of remaining milliseconds (0-999).
+
+        Returns:
+            remaining_time (str): The formatted remaining time, with seconds to three decimal places.
+        """
+        hours_and_minutes_formatted = Format._remaining_hours_and_minutes(remaining_minutes)
+        seconds_formatted = f'{UserDisplay.INDENT}{remaining_seconds:02}.{remaining_milliseconds:03} seconds'
+        remaining_time_formatted = Format._remaining_times_combined(*hours_and_minutes_formatted, seconds_formatted)
+        return remaining_time_formatted
+
+    @staticmethod
+    def _remaining_hours_and_minutes(remaining_minutes: int) -> list:
+        """
+        Formats the remaining minutes, split into hours and minutes when more than an hour is left.
+
+        Countdowns to a minute past the hour never need the hours line; schedules can.
+
+        Args:
+            remaining_minutes (int): The unformatted number of remaining minutes.
+
+        Returns:
+            hours_and_minutes_formatted (list): The formatted hours (if any) and minutes.
+        """
+        if remaining_minutes <= 60:
+            return [Format._remaining_time_individual(remaining_minutes, 'minute')]
+        remaining_hours, remaining_minutes = divmod(remaining_minutes, 60)
+        return [
+            Format._remaining_time_individual(remaining_hours, 'hour'),
+            Format._remaining_time_individual(remaining_minutes, 'minute'),
+        ]
+
     @staticmethod
     def _remaining_times_combined(*individual_formatted_times: str) -> str:
         """
@@ -141,6 +246,95 @@ class Format:
         remaining_time_formatted = f'{UserDisplay.INDENT}{remaining_time:02} {time_label}'
         return remaining_time_formatted
 
+class FrameTable:
+    """
+    Precomputed remaining-time and progress-bar text for every second of a countdown hour.
+
+    A countdown to a minute past the hour never has more than an hour left, so there are
+    only MAX_SECONDS + 1 possible values of `total_seconds`. The table renders each of them
+    once, so the timer loop can fetch both fragments with a single list lookup. The table
+    is rebuilt automatically when the terminal width or the display settings change.
+
+    Example:
+        >>> FrameTable.build()
+        >>> remaining_time, progress_bar_text = FrameTable.lookup(1500)
+    """
+
+    MAX_SECONDS = 3600
+
+    _entries = []
+    _signature = None
+
+    @classmethod
+    def build(cls):
+        """Renders the remaining-time and progress-bar text for every possible number of seconds."""
+        cls._entries = [cls._render(total_seconds) for total_seconds in range(cls.MAX_SECONDS + 1)]
+        cls._signature = cls._current_signature()
+
+    @classmethod
+    def lookup(cls, total_seconds: int) -> tuple:
+        """
+        Returns the rendered fragments for a number of remaining seconds.
+
+        Args:
+            total_seconds (int): The total remaining time in seconds.
+        Returns:
+            remaining_time (str): The formatted remaining minutes and seconds.
+            progress_bar_text (str): The rendered progress bar.
+        """
+        if cls._signature != cls._current_signature():
+            cls.build()
+        if 0 <= total_seconds <= cls.MAX_SECONDS:
+            return cls._entries[total_seconds]
+        return cls._render(total_seconds)
+
+    @classmethod
+    def _render(cls, total_seconds: int) -> tuple:
+        """
+        Renders the fragments for one number of remaining seconds, without using the table.
+
+        Args:
+            total_seconds (int): The total remaining time in seconds.
+        Returns:
+            remaining_time (str): The formatted remaining minutes and seconds.
+            progress_bar_text (str): The rendered progress bar.
+        """
+        if DisplaySettings.SHOW_SECONDS:
+            remaining_minutes, remaining_seconds = divmod(total_seconds, 60)
+            remaining_time = Format.remaining_time(remaining_minutes, remaining_seconds)
+            progress_bar_text = ProgressBar.render(total_seconds)
+        else:
+            # `total_seconds` is truncated, so the true remaining time is up to a second longer.
+            # Rounding it up makes the minutes and the bar change exactly on minute boundaries,
+            # together with the clock.
+            seconds_rounded_up = total_seconds if total_seconds == cls.MAX_SECONDS else total_seconds + 1
+            remaining_minutes = ProgressBar._minutes_rounded_up(seconds_rounded_up)
+            remaining_seconds = None
+            remaining_time = Format._remaining_times_combined(*Format._remaining_hours_and_minutes(remaining_minutes))
+            progress_bar_text = ProgressBar.render(seconds_rounded_up)
+        if DisplaySettings.BIG_DIGITS:
+            # Falls back to the normal text when the terminal is too narrow for the glyphs.
+            remaining_time = BigDigits.remaining_time(remaining_minutes, remaining_seconds) or remaining_time
+        return remaining_time, progress_bar_text
+
+    @staticmethod
+    def _current_signature() -> tuple:
+        """
+        Collects the settings that the rendered fragments depend on.
+
+        Returns:
+            signature (tuple): The current terminal width and display settings.
+        """
+        return (
+            DisplaySettings.TERMINAL_WINDOW_WIDTH,
+            DisplaySettings.INDENT_LENGTH,
+            DisplaySettings.LINE_THICKNESS,
+            DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL,
+            DisplaySettings.SHOW_SECONDS,
+            DisplaySettings.BIG_DIGITS,
+            DisplaySettings.BIG_DIGIT_MAX_SCALE,
+        )
+
 class Calculate:
     """Handles all time-related calculations."""
     
@@ -150,12 +344,15 @@ class Calculate:
         Returns the next datetime where the minute equals target_minute.
         
         Args:
-            target_minute (int): The target minute after the hour
+            target_minute (int | Schedule): The target minute after the hour, or a compiled
+                schedule to count down to instead.
             current_datetime (datetime): The current date and time
             
         Returns:
             next_occurrence (datetime): The next datetime where minute equals target_minute
         """
+        if isinstance(target_minute, Schedule):
+            return target_minute.next_occurrence(current_datetime)
         if current_datetime.minute < target_minute:
             next_occurrence = current_datetime.replace(minute=target_minute, second=0, microsecond=0)
         else:
@@ -180,6 +377,247 @@ class Calculate:
         remaining_seconds = int(remaining_time.total_seconds())
         return remaining_seconds
     
+class RefreshPlanner:
+    """
+    Works out when the timer display will next look different.
+
+    With seconds shown, the display changes every second. With seconds hidden, the
+    current time, the remaining minutes and the progress bar all change on minute
+    boundaries at most, so the loop can sleep until then instead of waking every second.
+    """
+
+    @staticmethod
+    def ticks_until_visible_change(state: 'TickState') -> int:
+        """
+        Returns how many one-second ticks from now the display will next change.
+
+        With seconds hidden, the remaining-time and progress-bar text only depend on the
+        remaining minutes rounded up (see FrameTable._render), so they next change when the
+        rounded-up remaining time crosses a whole minute. That is worked out arithmetically,
+        however far away the target is.
+
+        Args:
+            state (TickState): The tick just drawn, sampled just after a second boundary.
+        Returns:
+            ticks (int): The number of ticks until the next visible change, at least 1.
+        """
+        if DisplaySettings.SHOW_SECONDS:
+            return 1
+        datetime_now = state.datetime_now
+        total_seconds = state.total_seconds
+
+        # The clock (and the date, at midnight) changes at the next minute boundary.
+        ticks_until_clock_change = 60 - datetime_now.second
+        # The rounded-up remaining time (total_seconds + 1) drops below its current whole
+        # minute after total_seconds % 60 + 1 ticks. Reaching the target starts the countdown
+        # over, which always changes the display, and is never sooner than that.
+        ticks_until_minutes_change = total_seconds % 60 + 1
+        if total_seconds > FrameTable.MAX_SECONDS:
+            # The rounded-up time is capped at MAX_SECONDS once the remaining time reaches it.
+            ticks_until_minutes_change = min(ticks_until_minutes_change, total_seconds - FrameTable.MAX_SECONDS)
+        return min(ticks_until_minutes_change, ticks_until_clock_change)
+
+
+class TickState:
+    """
+    An immutable snapshot of one tick, passed from each stage of a TickPipeline to the next.
+
+    Besides each stage's outputs, the snapshot keeps the inputs the stages depended on,
+    so the next tick can tell which stages have to run again.
+
+    Attributes:
+        datetime_now (datetime): The clock sample.
+        end_of_current_loop (datetime): The time being counted down to.
+        total_seconds (int): The remaining time in whole seconds.
+        format_key (tuple): The inputs of the format stage.
+        display_times (tuple): The formatted date, time, target time and zone times.
+        fragments (tuple): The remaining-time and progress-bar text, from the FrameTable.
+        terminal_width (int): The width the frame was wrapped to.
+        frame_text (str): The complete, wrapped frame.
+        frames_dropped (int): The sink's dropped-frame count after the frame was emitted.
+    """
+
+    __slots__ = (
+        'datetime_now', 'end_of_current_loop', 'total_seconds', 'format_key', 'display_times',
+        'fragments', 'terminal_width', 'frame_text', 'frames_dropped',
+    )
+
+    def __init__(self, datetime_now, end_of_current_loop, total_seconds, format_key, display_times,
+                 fragments, terminal_width, frame_text, frames_dropped):
+        initialize = object.__setattr__
+        initialize(self, 'datetime_now', datetime_now)
+        initialize(self, 'end_of_current_loop', end_of_current_loop)
+        initialize(self, 'total_seconds', total_seconds)
+        initialize(self, 'format_key', format_key)
+        initialize(self, 'display_times', display_times)
+        initialize(self, 'fragments', fragments)
+        initialize(self, 'terminal_width', terminal_width)
+        initialize(self, 'frame_text', frame_text)
+        initialize(self, 'frames_dropped', frames_dropped)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'TickState is immutable; cannot set {name!r}.')
+
+    def __repr__(self) -> str:
+        return f'TickState({self.datetime_now.isoformat()}, total_seconds={self.total_seconds})'
+
+
+class TickPipeline:
+    """
+    Renders and emits the timer display one tick at a time, in five stages:
+
+        sample      Reads the clock.
+        calculate   Finds the time being counted down to and the remaining seconds.
+        format      Formats the date, the current time, the target time and the zone times.
+        layout      Builds the display and wraps it to the terminal width.
+        emit        Draws the frame on the sink.
+
+    Every stage after `sample` compares its inputs with the ones recorded in the previous
+    tick's TickState, and reuses the previous outputs when nothing changed. The countdown
+    target is only recalculated once it has been reached, the times are only formatted
+    once a minute, and unchanged frames are not drawn again.
+
+    Attributes:
+        countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+        hour_format (int): Time display format (12 or 24 hour)
+        sink (OutputSink): Where the frames are drawn.
+        zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+        clock (SystemClock): The clock sampled at each tick.
+        local_clock (ZoneClock): The timezone the samples are shown in.
+        state (TickState): The snapshot of the most recent tick, or None before the first.
+        stage_runs (dict): How many times each stage actually ran, keyed by stage name.
+        stage_skips (dict): How many times each stage was skipped, keyed by stage name.
+
+    Example:
+        >>> pipeline = TickPipeline(25, 12, FrameRenderer())
+        >>> state = pipeline.tick()
+        >>> pipeline.stage_runs
+        {'sample': 1, 'calculate': 1, 'format': 1, 'layout': 1, 'emit': 1}
+    """
+
+    STAGES = ('sample', 'calculate', 'format', 'layout', 'emit')
+    ONE_HOUR = timedelta(hours=1)
+
+    def __init__(self, countdown_minutes, hour_format: int, sink, zone_clocks: list = (), clock: SystemClock = None,
+                 local_clock: ZoneClock = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            hour_format (int): Time display format (12 or 24 hour)
+            sink (OutputSink): Where to draw the frames.
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+            clock (SystemClock): The clock to sample. Defaults to the system's clock.
+            local_clock (ZoneClock): The timezone to show the samples in. Defaults to the local timezone.
+        """
+        self.countdown_minutes = countdown_minutes
+        self.hour_format = hour_format
+        self.sink = sink
+        self.zone_clocks = zone_clocks
+        self.clock = clock if clock is not None else SystemClock()
+        self.local_clock = local_clock if local_clock is not None else ZoneClock.local()
+        self.state = None
+        self.stage_runs = dict.fromkeys(self.STAGES, 0)
+        self.stage_skips = dict.fromkeys(self.STAGES, 0)
+        self._calculated_for = None
+
+    def tick(self, timestamp: float = None, metrics=None) -> TickState:
+        """
+        Runs one tick through every stage.
+
+        Args:
+            timestamp (float): The POSIX timestamp to use instead of sampling `clock`.
+            metrics (TickMetrics): Optional metrics to record each stage's time in.
+        Returns:
+            state (TickState): The snapshot of this tick, also kept as `state`.
+        """
+        previous = self.state
+        stage_runs = self.stage_runs
+        stage_skips = self.stage_skips
+
+        # sample
+        datetime_now = self.local_clock.now(self.clock.time() if timestamp is None else timestamp)
+        stage_runs['sample'] += 1
+        if metrics is not None:
+            metrics.lap('sample')
+
+        # calculate: the next occurrence only changes once it has been reached.
+        if (
+            previous is not None
+            and self._calculated_for is self.countdown_minutes
+            and datetime_now.tzinfo is previous.datetime_now.tzinfo
+            and previous.datetime_now <= datetime_now < previous.end_of_current_loop
+        ):
+            end_of_current_loop = previous.end_of_current_loop
+            stage_skips['calculate'] += 1
+        else:
+            end_of_current_loop = Calculate.next_countdown_occurrence(self.countdown_minutes, datetime_now)
+            self._calculated_for = self.countdown_minutes
+            stage_runs['calculate'] += 1
+        total_seconds = Calculate.remaining_seconds(end_of_current_loop, datetime_now)
+        if metrics is not None:
+            metrics.lap('calculate')
+
+        # format: every formatted time changes on minute boundaries at most.
+        format_key = (
+            datetime_now.minute, datetime_now.hour, datetime_now.day, datetime_now.month, datetime_now.year,
+            datetime_now.tzname(), self.hour_format, self.zone_clocks, end_of_current_loop,
+            end_of_current_loop - datetime_now > self.ONE_HOUR,
+        )
+        if previous is not None and format_key == previous.format_key:
+            display_times = previous.display_times
+            stage_skips['format'] += 1
+        else:
+            display_times = (
+                Format.date(datetime_now),
+                Format.time(datetime_now, self.hour_format),
+                Format.target_time(end_of_current_loop, datetime_now, self.hour_format),
+                Format.zone_times(self.zone_clocks, datetime_now, self.hour_format),
+            )
+            stage_runs['format'] += 1
+        if metrics is not None:
+            metrics.lap('format')
+
+        # layout
+        fragments = FrameTable.lookup(total_seconds)
+        terminal_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
+        if (
+            previous is not None
+            and display_times is previous.display_times
+            and fragments == previous.fragments
+            and terminal_width == previous.terminal_width
+        ):
+            frame_text = previous.frame_text
+            stage_skips['layout'] += 1
+        else:
+            current_date, current_time, target_time, zone_times = display_times
+            remaining_time, progress_bar_text = fragments
+            frame_text = SystemUtils.wrap_text(UserDisplay.show_timer_display(
+                current_date, current_time, target_time, remaining_time, progress_bar_text, zone_times
+            ))
+            stage_runs['layout'] += 1
+        if metrics is not None:
+            metrics.lap('layout')
+
+        # emit: a frame the sink dropped is drawn again, even if it has not changed.
+        if (
+            previous is not None
+            and frame_text is previous.frame_text
+            and self.sink.frames_dropped == previous.frames_dropped
+        ):
+            stage_skips['emit'] += 1
+        else:
+            self.sink.draw(frame_text, metrics)
+            stage_runs['emit'] += 1
+
+        self.state = TickState(
+            datetime_now, end_of_current_loop, total_seconds, format_key, display_times,
+            fragments, terminal_width, frame_text, self.sink.frames_dropped
+        )
+        return self.state
+
+
 class TimerLoop:
     """
     Manages the continuous countdown timer execution and display updates.
@@ -195,7 +633,7 @@ class TimerLoop:
     toward the next occurrence of the specified target minute.
     
     Attributes:
-        countdown_minutes (int): Target minute past each hour (0-59)
+        countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
         hour_format (int): Time display format (12 or 24 hour)
     
     Example:
@@ -203,43 +641,158 @@ class TimerLoop:
         >>> timer_loop.run()  # Starts continuous countdown to X:25
     """
     
+    @classmethod
+    def run(cls, countdown_minutes, hour_format, metrics=None, sink=None, zone_clocks=(), state_file=None,
+            clock=None, until=None, notifier=None):
+        """
+        Main timer loop that updates the display continuously.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            hour_format (int): Time display format (12 or 24 hour)
+            metrics (TickMetrics): Optional metrics to time every stage of every tick in.
+            sink (OutputSink): Where to draw the frames. Defaults to the terminal.
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+            state_file (StateFile): Optional state file to record every tick in.
+            clock (SystemClock): The clock to read and sleep on. Defaults to the system's clocks;
+                a VirtualClock runs the timer faster than real time.
+            until (float): Optional POSIX timestamp, by `clock`, to stop at. Defaults to running forever.
+            notifier (Notifier): Optional notifier to run actions when the countdown reaches its target.
+        """
+        clock = clock if clock is not None else SystemClock()
+        pipeline = TickPipeline(
+            countdown_minutes, hour_format, sink if sink is not None else FrameRenderer(), zone_clocks, clock
+        )
+        scheduler = TickScheduler(clock=clock)
+        FrameTable.build()
+        while until is None or clock.time() < until:
+            if metrics is not None:
+                metrics.start_lap()
+            state = pipeline.tick(metrics=metrics)
+            if notifier is not None:
+                notifier.observe(state.datetime_now)
+            if state_file is not None:
+                state_file.record_tick(clock.time_ns(), scheduler.last_lateness_ns, state.frame_text)
+            scheduler.wait_for_next_tick(
+                RefreshPlanner.ticks_until_visible_change(state)
+            )
+            if metrics is not None:
+                metrics.end_tick(scheduler, pipeline, notifier)
+
+    @classmethod
+    def run_smooth(cls, countdown_minutes, hour_format, frames_per_second, show_milliseconds=False, sink=None,
+                   zone_clocks=(), clock=None, until=None, notifier=None):
+        """
+        Timer loop for the smooth display mode, redrawing many times per second.
+
+        Only the parts of the display that changed are rewritten each frame, which is
+        normally just the progress bar (and the seconds, when milliseconds are shown).
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            hour_format (int): Time display format (12 or 24 hour)
+            frames_per_second (int): How many times per second to redraw.
+            show_milliseconds (bool): Whether to show the remaining seconds to the millisecond.
+            sink (OutputSink): Where to draw the frames. Defaults to the terminal.
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+            clock (SystemClock): The clock to read and sleep on. Defaults to the system's clocks.
+            until (float): Optional POSIX timestamp, by `clock`, to stop at. Defaults to running forever.
+            notifier (Notifier): Optional notifier to run actions when the countdown reaches its target.
+        """
+        clock = clock if clock is not None else SystemClock()
+        renderer = sink if sink is not None else FrameRenderer()
+        local_clock = ZoneClock.local()
+        scheduler = TickScheduler(interval_ns=1_000_000_000 // frames_per_second, clock=clock)
+        FrameTable.build()
+        while until is None or clock.time() < until:
+            datetime_now = local_clock.now(clock.time())
+            if notifier is not None:
+                notifier.observe(datetime_now)
+            renderer.draw(
+                cls.render_smooth_frame(countdown_minutes, hour_format, datetime_now, show_milliseconds, zone_clocks)
+            )
+            scheduler.wait_for_next_tick()
+
     @staticmethod
-    def run(countdown_minutes, hour_format):
-        """Main timer loop that updates the display continuously."""
-        while True:
-            TerminalUtils.clear_terminal()
-            
-            # Get current time information
-            datetime_now = datetime.now().astimezone()
-            current_date = Format.date(datetime_now)
-            current_time = Format.time(datetime_now, hour_format)
-            
-            # Calculate next target time
-            end_of_current_loop = Calculate.next_countdown_occurrence(countdown_minutes, datetime_now)
-            target_time = Format.time(end_of_current_loop, hour_format)
-            
-            # Calculate remaining time
-            total_seconds = Calculate.remaining_seconds(end_of_current_loop, datetime_now)
+    def render_smooth_frame(countdown_minutes: int, hour_format: int, datetime_now: datetime,
+                            show_milliseconds: bool = False, zone_clocks: list = ()) -> str:
+        """
+        Builds the complete, wrapped timer display for one frame of the smooth display mode.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            hour_format (int): Time display format (12 or 24 hour)
+            datetime_now (datetime): The current date and time.
+            show_milliseconds (bool): Whether to show the remaining seconds to the millisecond.
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+        Returns:
+            frame_text (str): The timer display, wrapped to the terminal width.
+        """
+        end_of_current_loop = Calculate.next_countdown_occurrence(countdown_minutes, datetime_now)
+        remaining_microseconds = (end_of_current_loop - datetime_now) // timedelta(microseconds=1)
+        total_seconds, microseconds = divmod(remaining_microseconds, 1_000_000)
+
+        if show_milliseconds:
             remaining_minutes, remaining_seconds = divmod(total_seconds, 60)
-            remaining_time = Format.remaining_time(remaining_minutes, remaining_seconds)
-            
-            # Create visual elements
-            progress_bar_text = ProgressBar.render(total_seconds)
-            
-            # Display everything
-            print(
-                SystemUtils.wrap_text(
-                    UserDisplay.show_timer_display(
-                        current_date,
-                        current_time,
-                        target_time,
-                        remaining_time,
-                        progress_bar_text
-                    )
-                )
+            remaining_time = Format.remaining_time_precise(remaining_minutes, remaining_seconds, microseconds // 1000)
+        else:
+            remaining_time = FrameTable.lookup(total_seconds)[0]
+
+        frame_text = SystemUtils.wrap_text(
+            UserDisplay.show_timer_display(
+                Format.date(datetime_now),
+                Format.time(datetime_now, hour_format),
+                Format.target_time(end_of_current_loop, datetime_now, hour_format),
+                remaining_time,
+                SmoothProgressBar.render(remaining_microseconds),
+                Format.zone_times(zone_clocks, datetime_now, hour_format)
             )
+        )
+        return frame_text
+
+    @staticmethod
+    def render_frame(countdown_minutes: int, hour_format: int, datetime_now: datetime, metrics=None,
+                     zone_clocks: list = ()) -> str:
+        """
+        Builds the complete, wrapped timer display for one tick.
+
+        Args:
+            countdown_minutes (int | Schedule): Target minute past each hour (0-59), or a schedule
+            hour_format (int): Time display format (12 or 24 hour)
+            datetime_now (datetime): The current date and time.
+            metrics (TickMetrics): Optional metrics to record the 'datetime', 'format'
+                and 'wrap' stages in.
+            zone_clocks (list): The ZoneClock of each other timezone to show the time in.
+        Returns:
+            frame_text (str): The timer display, wrapped to the terminal width.
+        """
+        # Calculate next target time and remaining time
+        end_of_current_loop = Calculate.next_countdown_occurrence(countdown_minutes, datetime_now)
+        total_seconds = Calculate.remaining_seconds(end_of_current_loop, datetime_now)
+        if metrics is not None:
+            metrics.lap('datetime')
 
-            SystemUtils.sleep_until_next_second(datetime_now)
+        # Format the times and look up the remaining time's visual elements
+        current_date = Format.date(datetime_now)
+        current_time = Format.time(datetime_now, hour_format)
+        target_time = Format.target_time(end_of_current_loop, datetime_now, hour_format)
+        remaining_time, progress_bar_text = FrameTable.lookup(total_seconds)
+        timer_display_text = UserDisplay.show_timer_display(
+            current_date,
+            current_time,
+            target_time,
+            remaining_time,
+            progress_bar_text,
+            Format.zone_times(zone_clocks, datetime_now, hour_format)
+        )
+        if metrics is not None:
+            metrics.lap('format')
+
+        # Display everything
+        frame_text = SystemUtils.wrap_text(timer_display_text)
+        if metrics is not None:
+            metrics.lap('wrap')
+        return frame_text
 
 
 class UserInput:
@@ -253,7 +806,8 @@ class UserInput:
         Args:
             None        
         Returns:
-            countdown_minutes (int): A valid countdown minute (0–59)
+            countdown_minutes (int | Schedule): A valid countdown minute (0–59), or a compiled
+                schedule if the user entered a cron-style schedule expression.
         """
         while True:
             countdown_minutes = input(
@@ -263,6 +817,12 @@ class UserInput:
                 )
             )
             countdown_minutes = SystemUtils.clean_text(countdown_minutes)
+            if len(countdown_minutes.split()) > 1:
+                if InputIsValid.schedule(countdown_minutes):
+                    schedule = Schedule(countdown_minutes)
+                    if UserConfirms.schedule(schedule):
+                        return schedule.single_minute if schedule.single_minute is not None else schedule
+                continue
             if InputIsValid.integer(countdown_minutes):
                 countdown_minutes = int(countdown_minutes)
                 if InputIsValid.minutes_range(countdown_minutes):
@@ -336,6 +896,38 @@ class UserConfirms:
             )
             return False
 
+    @classmethod
+    def schedule(cls, schedule: Schedule) -> bool:
+        """
+        Displays the next few times a schedule fires and gets user confirmation.
+
+        Args:
+            schedule (Schedule): The schedule the user has entered, to confirm.
+        Returns:
+            bool: True if the user confirms yes, False for all other responses.
+        """
+        EXAMPLE_OCCURRENCES = 3
+        occurrences = schedule.occurrences(ZoneClock.local().now(), EXAMPLE_OCCURRENCES)
+        EXAMPLE_TIMES_DISPLAY = ' | '.join(occurrence.strftime('%a %H:%M') for occurrence in occurrences) + ' | etc.\n'
+
+        print(
+            SystemUtils.wrap_text(
+                f'\nYou entered the schedule "{schedule.expression}". The timer will count down to:' +
+                f'\n{EXAMPLE_TIMES_DISPLAY}'
+            )
+        )
+
+        if cls._confirm_user_input():
+            return True
+
+        else:
+            print(
+                SystemUtils.wrap_text(
+                    "\nNo problem! Let's try again:"
+                )
+            )
+            return False
+
     @classmethod
     def hour_display_format(cls, user_hours: int) -> bool:
         """
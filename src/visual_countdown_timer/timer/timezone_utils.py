@@ -0,0 +1,158 @@
+from datetime import datetime, timezone
+from .settings import TimerConfig
+import bisect
+import time
+from zoneinfo import ZoneInfo
+
+"""
+Timezone handling for the Visual Countdown Timer.
+
+This module provides the ZoneClock class, which tells the current time in the local
+timezone or any IANA timezone. Each zone's UTC offset and abbreviation are worked out
+once for the coming year, so reading the clock on a tick costs no more than building
+a datetime with a fixed offset.
+"""
+
+class ZoneClock:
+    """
+    The current time in one timezone, with the zone's transitions precomputed.
+
+    On creation (and whenever the clock moves past the precomputed range), the zone is
+    probed across the next year to find every instant its UTC offset or abbreviation
+    changes. Between two transitions the zone behaves like a fixed offset, so the time
+    is built with a cached `datetime.timezone` instead of resolving the zone again.
+
+    Attributes:
+        zone_name (str): The IANA name of the zone, or None for the local timezone.
+        label (str): A short name for the zone, for display.
+
+    Example:
+        >>> berlin = ZoneClock('Europe/Berlin')
+        >>> berlin.now().tzname()
+        'CEST'
+    """
+
+    _local = None
+
+    def __init__(self, zone_name: str = None):
+        """
+        Initialize the clock.
+
+        Args:
+            zone_name (str): An IANA timezone name, such as 'Europe/Berlin'. Defaults to
+                the local timezone.
+        Raises:
+            zoneinfo.ZoneInfoNotFoundError: If there is no timezone with this name.
+        """
+        self.zone_name = zone_name
+        self.label = zone_name.rsplit('/', 1)[-1].replace('_', ' ') if zone_name else 'Local'
+        self._zone = ZoneInfo(zone_name) if zone_name else None
+        self._transitions = []
+        self._timezones = []
+        self._horizon = 0
+        self._period_start = 0
+        self._period_end = 0
+        self._timezone = None
+
+    @classmethod
+    def local(cls) -> 'ZoneClock':
+        """
+        Returns the shared clock for the local timezone.
+
+        Returns:
+            local_clock (ZoneClock): The local timezone's clock.
+        """
+        if cls._local is None:
+            cls._local = cls()
+        return cls._local
+
+    def now(self, timestamp: float = None) -> datetime:
+        """
+        Returns the current time in this zone, like `datetime.now(zone)`.
+
+        Args:
+            timestamp (float): The POSIX timestamp to convert. Defaults to the current time.
+        Returns:
+            datetime_now (datetime): The time in this zone, with a fixed-offset tzinfo that
+                carries the zone's abbreviation.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if not self._period_start <= timestamp < self._period_end:
+            self._find_period(timestamp)
+        return datetime.fromtimestamp(timestamp, self._timezone)
+
+    def _find_period(self, timestamp: float):
+        """
+        Looks up the offset in effect at `timestamp`, precomputing transitions if needed.
+
+        Args:
+            timestamp (float): The POSIX timestamp to look up.
+        """
+        if not (self._transitions and self._transitions[0] <= timestamp < self._horizon):
+            self._precompute_transitions(int(timestamp))
+        index = bisect.bisect_right(self._transitions, timestamp) - 1
+        self._period_start = self._transitions[index]
+        self._period_end = self._transitions[index + 1] if index + 1 < len(self._transitions) else self._horizon
+        self._timezone = self._timezones[index]
+
+    def _precompute_transitions(self, start: int):
+        """
+        Finds every offset or abbreviation change in the year after `start`.
+
+        Args:
+            start (int): The POSIX timestamp to start from, in whole seconds.
+        """
+        horizon = start + TimerConfig.ZONE_TRANSITION_HORIZON_SECONDS
+        offset_and_name = self._probe(start)
+        transitions = [start]
+        timezones = [timezone(*offset_and_name)]
+
+        probe_time = start
+        while probe_time < horizon:
+            next_probe_time = min(probe_time + TimerConfig.ZONE_PROBE_STEP_SECONDS, horizon)
+            next_offset_and_name = self._probe(next_probe_time)
+            if next_offset_and_name != offset_and_name:
+                transitions.append(self._find_transition(probe_time, next_probe_time, offset_and_name))
+                timezones.append(timezone(*next_offset_and_name))
+                offset_and_name = next_offset_and_name
+            probe_time = next_probe_time
+
+        self._transitions = transitions
+        self._timezones = timezones
+        self._horizon = horizon
+
+    def _find_transition(self, before: int, after: int, offset_and_name: tuple) -> int:
+        """
+        Narrows down the second at which the zone stops using `offset_and_name`.
+
+        Args:
+            before (int): A timestamp at which `offset_and_name` is in effect.
+            after (int): A later timestamp at which it no longer is.
+            offset_and_name (tuple): The UTC offset and abbreviation in effect at `before`.
+        Returns:
+            transition (int): The first whole second at which they changed.
+        """
+        while after - before > 1:
+            middle = (before + after) // 2
+            if self._probe(middle) == offset_and_name:
+                before = middle
+            else:
+                after = middle
+        return after
+
+    def _probe(self, timestamp: int) -> tuple:
+        """
+        Asks the timezone database for the offset and abbreviation at `timestamp`.
+
+        Args:
+            timestamp (int): The POSIX timestamp to probe.
+        Returns:
+            utc_offset (timedelta): The UTC offset in effect.
+            zone_abbreviation (str): The zone's abbreviation, such as 'CEST'.
+        """
+        if self._zone is None:
+            datetime_probe = datetime.fromtimestamp(timestamp).astimezone()
+        else:
+            datetime_probe = datetime.fromtimestamp(timestamp, self._zone)
+        return datetime_probe.utcoffset(), datetime_probe.tzname()
@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta
+from .timer_utils import Calculate
+from .validation_checks import InputCheck
+import itertools
+
+"""
+Many-target countdown engine for the Visual Countdown Timer.
+
+This module provides the CountdownWheel class, which tracks any number of
+"minute past the hour" countdown targets in one process and fires a callback
+each time one of them is reached.
+"""
+
+class CountdownTarget:
+    """
+    One countdown target tracked by a CountdownWheel.
+
+    Attributes:
+        target_id (int): Unique identifier assigned by the wheel.
+        target_minute (int): The minute past each hour to count down to (0-59).
+        callback (Callable): Called as callback(target, occurrence) when the target is reached.
+        label (str): Optional name of the team or job the target belongs to.
+    """
+
+    __slots__ = ('target_id', 'target_minute', 'callback', 'label')
+
+    def __init__(self, target_id: int, target_minute: int, callback, label: str = ''):
+        self.target_id = target_id
+        self.target_minute = target_minute
+        self.callback = callback
+        self.label = label
+
+    def __repr__(self) -> str:
+        return f'CountdownTarget({self.target_id}, minute={self.target_minute}, label={self.label!r})'
+
+
+class CountdownWheel:
+    """
+    Tracks many hourly countdown targets on a timing wheel with one slot per second of the hour.
+
+    Every target fires at second 0 of its minute, every hour, so it lives permanently in the
+    slot for that second and never has to be rescheduled. Advancing the wheel only visits the
+    slots for the seconds that have passed since the last advance, so the work per tick is
+    constant no matter how many targets exist, plus one callback per target actually reached.
+
+    Example:
+        >>> wheel = CountdownWheel(datetime.now().astimezone())
+        >>> wheel.add(25, lambda target, occurrence: print(target, occurrence))
+        >>> wheel.advance(datetime.now().astimezone())
+    """
+
+    SLOTS = 3600
+
+    def __init__(self, current_datetime: datetime):
+        """
+        Initialize an empty wheel.
+
+        Args:
+            current_datetime (datetime): The time the wheel starts at. Targets reached at or
+                before this instant do not fire.
+        """
+        self._slots = [{} for _ in range(self.SLOTS)]
+        self._targets = {}
+        self._ids = itertools.count(1)
+        self._current_datetime = current_datetime.replace(microsecond=0)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def add(self, target_minute: int, callback, label: str = '') -> CountdownTarget:
+        """
+        Adds a target that fires every hour at `target_minute` past the hour.
+
+        Args:
+            target_minute (int): The minute past each hour to count down to (0-59).
+            callback (Callable): Called as callback(target, occurrence) when the target is reached.
+            label (str): Optional name of the team or job the target belongs to.
+        Returns:
+            target (CountdownTarget): The new target, which can be passed to remove().
+        Raises:
+            ValueError: If `target_minute` is not a whole number between 0 and 59.
+        """
+        error = InputCheck.integer(target_minute) or InputCheck.minutes_range(int(target_minute))
+        if error is not None:
+            raise ValueError(f"The target minute {error}, not {target_minute!r}.")
+        target_minute = int(target_minute)
+        target = CountdownTarget(next(self._ids), target_minute, callback, label)
+        self._slots[target_minute * 60][target.target_id] = target
+        self._targets[target.target_id] = target
+        return target
+
+    def remove(self, target: CountdownTarget):
+        """
+        Stops tracking a target.
+
+        Args:
+            target (CountdownTarget): A target returned by add().
+        """
+        del self._targets[target.target_id]
+        del self._slots[target.target_minute * 60][target.target_id]
+
+    def next_occurrence(self, target: CountdownTarget) -> datetime:
+        """
+        Returns the next time a target will fire.
+
+        Args:
+            target (CountdownTarget): A target returned by add().
+        Returns:
+            next_occurrence (datetime): The next datetime where the minute equals the target minute.
+        """
+        return Calculate.next_countdown_occurrence(target.target_minute, self._current_datetime)
+
+    def advance(self, current_datetime: datetime) -> int:
+        """
+        Moves the wheel forward to `current_datetime`, firing every target reached on the way.
+
+        Seconds skipped since the last advance (for example after a late tick) are caught up,
+        so no target is missed. A jump of more than an hour fires each target once.
+        Moving backwards (for example after a wall-clock correction) fires nothing.
+
+        Args:
+            current_datetime (datetime): The current date and time.
+        Returns:
+            fired (int): The number of callbacks fired.
+        """
+        current_datetime = current_datetime.replace(microsecond=0)
+        elapsed_seconds = int((current_datetime - self._current_datetime).total_seconds())
+        self._current_datetime = current_datetime
+        if elapsed_seconds <= 0:
+            return 0
+
+        fired = 0
+        one_second = timedelta(seconds=1)
+        first_second = current_datetime - (min(elapsed_seconds, self.SLOTS) - 1) * one_second
+        moment = first_second
+        while moment <= current_datetime:
+            slot = self._slots[moment.minute * 60 + moment.second]
+            if slot:
+                for target in list(slot.values()):
+                    target.callback(target, moment)
+                    fired += 1
+            moment += one_second
+        return fired
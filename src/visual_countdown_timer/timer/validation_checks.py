@@ -1,3 +1,4 @@
+from .schedule_utils import Schedule
 from .settings import TimerConfig
 from .system_utils import SystemUtils
 
@@ -6,9 +7,80 @@ Contains all logic related to validating input.
 """
 
 
+class InputCheck:
+    """
+    Pure validation checks, shared by the interactive prompts and the roster loader.
+
+    Each check returns None if the value is valid, or a short description of the problem
+    otherwise. Nothing is printed, so the checks can be run on any number of values.
+    """
+
+    @staticmethod
+    def integer(user_input) -> str:
+        """
+        Checks that a value is a whole number, or a string holding one.
+
+        Args:
+            user_input: The value to check.
+        Returns:
+            error (str): None if the value is a whole number, otherwise the problem.
+        """
+        if isinstance(user_input, (bool, float)):
+            return 'must be a whole number'
+        try:
+            int(user_input)
+        except (TypeError, ValueError):
+            return 'must be a whole number'
+        return None
+
+    @staticmethod
+    def minutes_range(user_input: int) -> str:
+        """
+        Checks that an integer is a minute past the hour.
+
+        Args:
+            user_input (int): The integer to check.
+        Returns:
+            error (str): None if the integer is between 0 and 59, otherwise the problem.
+        """
+        if TimerConfig.MIN_MINUTES <= user_input <= TimerConfig.MAX_MINUTES:
+            return None
+        return f'must be between {TimerConfig.MIN_MINUTES} and {TimerConfig.MAX_MINUTES}'
+
+    @staticmethod
+    def hour_display_format(user_input: int) -> str:
+        """
+        Checks that an integer is a supported hour display format.
+
+        Args:
+            user_input (int): The integer to check.
+        Returns:
+            error (str): None if the integer is 12 or 24, otherwise the problem.
+        """
+        if user_input in TimerConfig.POSSIBLE_HOUR_FORMATS:
+            return None
+        return 'must be 12 or 24'
+
+    @staticmethod
+    def schedule(user_input: str) -> str:
+        """
+        Checks that a string is a cron-style schedule expression that fires.
+
+        Args:
+            user_input (str): The schedule expression to check.
+        Returns:
+            error (str): None if the expression compiles to a schedule, otherwise the problem.
+        """
+        try:
+            Schedule(user_input)
+        except ValueError as error:
+            return str(error)
+        return None
+
+
 class InputIsValid:
     """
-    Contains all validation checks.
+    Contains all validation checks, printing an error message for invalid input.
     """
 
     def hour_display_format(user_input: int) -> bool:
@@ -22,7 +94,7 @@ class InputIsValid:
             bool: True if user_input is a valid hour display format (12 or 24),
                   False otherwise.
         """
-        if user_input in TimerConfig.POSSIBLE_HOUR_FORMATS:
+        if InputCheck.hour_display_format(user_input) is None:
             return True
         else:
             print(
@@ -36,11 +108,10 @@ class InputIsValid:
         """
         Validates that a user input is an integer.
         """
-        try:
-            user_input = int(user_input)
+        if InputCheck.integer(user_input) is None:
             return True
-        
-        except ValueError:
+
+        else:
             print(
                 SystemUtils.wrap_text(
                     "\nError: please enter a whole number." +
@@ -49,6 +120,29 @@ class InputIsValid:
             )
             return False
         
+    def schedule(user_input: str) -> bool:
+        """
+        Validates that a user input is a cron-style schedule expression that fires.
+
+        Args:
+            user_input (str): The schedule expression to validate, e.g. "0,30 9-17 * * mon-fri".
+
+        Returns:
+            bool: True if user_input compiles to a schedule, False otherwise.
+        """
+        error = InputCheck.schedule(user_input)
+        if error is None:
+            return True
+
+        else:
+            print(
+                SystemUtils.wrap_text(
+                    f"\nError: {error}" +
+                    "\n(A schedule has five fields: minute, hour, day of month, month and day of week.)"
+                )
+            )
+            return False
+
     def minutes_range(user_input: int) -> bool:
         """
         Validates that an integer is within the valid range for minutes.
@@ -64,11 +158,7 @@ class InputIsValid:
             bool: True if user_input is an integer between 0 and 59 (inclusive),
                   False otherwise.
         """
-        
-        MIN_MINUTES = 0
-        MAX_MINUTES = 60
-        
-        if (MIN_MINUTES <= user_input < MAX_MINUTES):
+        if InputCheck.minutes_range(user_input) is None:
             return True
         
         else:
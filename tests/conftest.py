@@ -0,0 +1,10 @@
+import os
+import sys
+
+"""
+Shared pytest configuration for the Visual Countdown Timer tests.
+
+The package lives under `src/` and is not installed, so the tests import it from there.
+"""
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
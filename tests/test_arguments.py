@@ -0,0 +1,46 @@
+from visual_countdown_timer.timer.timer_app import TimerApp
+import pytest
+
+"""
+Tests for the command-line options that cannot be combined.
+"""
+
+
+class TestParseArguments:
+
+    @pytest.mark.parametrize('extra_arguments', [
+        ['--smooth'],
+        ['--publish'],
+        ['--output', 'pipe'],
+        ['--metrics-file', 'metrics.json'],
+        ['--state-file', 'timer.state'],
+    ])
+    def test_hotkeys_reject_options_they_cannot_honor(self, extra_arguments):
+        with pytest.raises(SystemExit):
+            TimerApp.parse_arguments(['--minute', '25', '--hotkeys'] + extra_arguments)
+
+    def test_hotkeys_show_other_timezones(self):
+        options = TimerApp.parse_arguments(['--minute', '25', '--hotkeys', '--zones', 'Europe/Berlin'])
+        assert [zone_clock.zone_name for zone_clock in options.zone_clocks] == ['Europe/Berlin']
+
+    @pytest.mark.parametrize('extra_arguments', [
+        ['--smooth'],
+        ['--publish'],
+        ['--output', 'pipe'],
+        ['--metrics-file', 'metrics.json'],
+    ])
+    def test_serve_rejects_options_it_cannot_honor(self, extra_arguments):
+        with pytest.raises(SystemExit):
+            TimerApp.parse_arguments(['--minute', '25', '--serve', 'http:8765'] + extra_arguments)
+
+    @pytest.mark.parametrize('extra_arguments', [
+        ['--metrics-file', 'metrics.json'],
+        ['--state-file', 'timer.state'],
+    ])
+    def test_smooth_rejects_options_it_cannot_honor(self, extra_arguments):
+        with pytest.raises(SystemExit):
+            TimerApp.parse_arguments(['--minute', '25', '--smooth', '30'] + extra_arguments)
+
+    def test_simulations_do_not_fire_notifications(self):
+        with pytest.raises(SystemExit):
+            TimerApp.parse_arguments(['--minute', '25', '--hour-format', '24', '--simulate', '--on-zero-bell'])
@@ -0,0 +1,138 @@
+from datetime import datetime
+import itertools
+import os
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from visual_countdown_timer.timer.big_digits import BigDigits
+from visual_countdown_timer.timer.dashboard import Dashboard, DashboardRenderer
+from visual_countdown_timer.timer.display_utils import ProgressBar, UserDisplay
+from visual_countdown_timer.timer.output_sinks import NullSink
+from visual_countdown_timer.timer.roster_utils import TimerDefinition
+from visual_countdown_timer.timer.schedule_utils import Schedule
+from visual_countdown_timer.timer.settings import DisplaySettings
+from visual_countdown_timer.timer.system_utils import SystemUtils
+from visual_countdown_timer.timer.timer_utils import Calculate, Format, FrameTable, TickPipeline, TimerLoop
+
+"""
+pytest-benchmark cases for the functions on the Visual Countdown Timer's tick path.
+
+Each case times one call of a hot function with the inputs of a typical tick, and the
+last cases time a whole tick, rendered in full and through the incremental TickPipeline,
+with normal and with big digits, and a tick of dashboards of 50 and 1000 timers.
+
+Timings are only comparable on one machine, so record a baseline locally with
+`--benchmark-save` before comparing against it with `--benchmark-compare` (see the README).
+"""
+
+DATETIME_NOW = datetime(2025, 3, 14, 15, 9, 26).astimezone()
+TARGET_MINUTE = 25
+HOUR_FORMAT = 12
+
+
+@pytest.fixture
+def big_digits(monkeypatch):
+    """Turns on big digits, in a terminal wide enough for the largest glyphs."""
+    monkeypatch.setattr(DisplaySettings, 'BIG_DIGITS', True)
+    monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 80)
+
+
+@pytest.fixture
+def tick_fragments():
+    """The display fragments of one tick at DATETIME_NOW, counting down to TARGET_MINUTE."""
+    end_of_current_loop = Calculate.next_countdown_occurrence(TARGET_MINUTE, DATETIME_NOW)
+    total_seconds = Calculate.remaining_seconds(end_of_current_loop, DATETIME_NOW)
+    remaining_time, progress_bar_text = FrameTable.lookup(total_seconds)
+    return (
+        Format.date(DATETIME_NOW),
+        Format.time(DATETIME_NOW, HOUR_FORMAT),
+        Format.time(end_of_current_loop, HOUR_FORMAT),
+        remaining_time,
+        progress_bar_text,
+    )
+
+
+def test_format_date(benchmark):
+    benchmark(Format.date, DATETIME_NOW)
+
+
+def test_format_time(benchmark):
+    benchmark(Format.time, DATETIME_NOW, HOUR_FORMAT)
+
+
+def test_format_time_uncached(benchmark):
+    benchmark(lambda: Format._add_timezone(DATETIME_NOW, Format._time_12h(DATETIME_NOW)))
+
+
+def test_next_countdown_occurrence(benchmark):
+    benchmark(Calculate.next_countdown_occurrence, TARGET_MINUTE, DATETIME_NOW)
+
+
+def test_next_schedule_occurrence(benchmark):
+    schedule = Schedule('0,30 9-17 * * mon-fri')
+    benchmark(Calculate.next_countdown_occurrence, schedule, DATETIME_NOW)
+
+
+def test_remaining_seconds(benchmark):
+    end_of_current_loop = Calculate.next_countdown_occurrence(TARGET_MINUTE, DATETIME_NOW)
+    benchmark(Calculate.remaining_seconds, end_of_current_loop, DATETIME_NOW)
+
+
+def test_progress_bar_render(benchmark):
+    benchmark(ProgressBar.render, 954)
+
+
+def test_frame_table_lookup(benchmark):
+    FrameTable.build()
+    benchmark(FrameTable.lookup, 954)
+
+
+def test_show_timer_display(benchmark, tick_fragments):
+    benchmark(UserDisplay.show_timer_display, *tick_fragments)
+
+
+def test_wrap_text(benchmark, tick_fragments):
+    benchmark(SystemUtils.wrap_text, UserDisplay.show_timer_display(*tick_fragments))
+
+
+def test_big_digits_remaining_time(benchmark, big_digits):
+    benchmark(BigDigits.remaining_time, 15, 34)
+
+
+def test_show_timer_display_big(benchmark, big_digits, tick_fragments):
+    benchmark(UserDisplay.show_timer_display, *tick_fragments)
+
+
+def test_wrap_text_big(benchmark, big_digits, tick_fragments):
+    benchmark(SystemUtils.wrap_text, UserDisplay.show_timer_display(*tick_fragments))
+
+
+def test_full_tick(benchmark):
+    benchmark(TimerLoop.render_frame, TARGET_MINUTE, HOUR_FORMAT, DATETIME_NOW)
+
+
+def test_pipeline_tick(benchmark):
+    pipeline = TickPipeline(TARGET_MINUTE, HOUR_FORMAT, NullSink())
+    timestamps = itertools.count(DATETIME_NOW.timestamp())
+    benchmark(lambda: pipeline.tick(next(timestamps)))
+
+
+def test_pipeline_tick_big(benchmark, big_digits):
+    pipeline = TickPipeline(TARGET_MINUTE, HOUR_FORMAT, NullSink())
+    timestamps = itertools.count(DATETIME_NOW.timestamp())
+    benchmark(lambda: pipeline.tick(next(timestamps)))
+
+
+@pytest.mark.parametrize('timer_count', (50, 1000))
+def test_dashboard_tick(benchmark, monkeypatch, timer_count):
+    monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 220)
+    monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_HEIGHT', 10_000)
+    file_descriptor = os.open(os.devnull, os.O_WRONLY)
+    definitions = [TimerDefinition(row, f'timer {row}', row % 60, HOUR_FORMAT) for row in range(timer_count)]
+    dashboard = Dashboard(definitions, DashboardRenderer(file_descriptor))
+    timestamps = itertools.count(DATETIME_NOW.timestamp())
+    try:
+        benchmark(lambda: dashboard.tick(next(timestamps)))
+    finally:
+        os.close(file_descriptor)
@@ -0,0 +1,48 @@
+from hypothesis import given, strategies
+from visual_countdown_timer.timer.big_digits import BigDigits
+from visual_countdown_timer.timer.settings import DisplaySettings
+from visual_countdown_timer.timer.system_utils import SystemUtils
+from visual_countdown_timer.timer.timer_utils import FrameTable
+import pytest
+
+"""
+Tests for the big-digit display.
+"""
+
+
+@pytest.fixture
+def big_digits(monkeypatch):
+    monkeypatch.setattr(DisplaySettings, 'BIG_DIGITS', True)
+
+
+class TestBigDigits:
+
+    @given(strategies.integers(min_value=0, max_value=60), strategies.integers(min_value=0, max_value=59),
+           strategies.integers(min_value=20, max_value=200))
+    def test_rows_fit_and_are_never_blank(self, remaining_minutes, remaining_seconds, terminal_width):
+        DisplaySettings.TERMINAL_WINDOW_WIDTH, previous_width = terminal_width, DisplaySettings.TERMINAL_WINDOW_WIDTH
+        try:
+            rows = BigDigits.remaining_time(remaining_minutes, remaining_seconds).split('\n')
+        finally:
+            DisplaySettings.TERMINAL_WINDOW_WIDTH = previous_width
+        assert len(rows) == BigDigits.GLYPH_ROWS
+        assert all(row.strip() and len(row) <= terminal_width for row in rows)
+
+    def test_largest_scale_that_fits(self, monkeypatch):
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', BigDigits.width('24:59', 2))
+        assert BigDigits.remaining_time(24, 59).split('\n')[0] == '  ' + '  '.join(
+            ('██████', '██  ██', '  ', '██████', '██████')
+        )
+
+    def test_too_narrow_a_terminal_falls_back_to_text(self, monkeypatch, big_digits):
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 10)
+        assert BigDigits.remaining_time(24, 59) is None
+        assert FrameTable.lookup(1499)[0] == FrameTable._render(1499)[0]
+        assert 'minutes' in FrameTable.lookup(1499)[0]
+
+    def test_frame_table_uses_big_digits(self, monkeypatch, big_digits):
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 80)
+        remaining_time, progress_bar_text = FrameTable.lookup(24 * 60 + 59)
+        assert remaining_time == BigDigits.remaining_time(24, 59)
+        assert SystemUtils.wrap_text(remaining_time) == remaining_time.rstrip()
+        assert FrameTable.lookup(2 * 60 * 60 + 5)[0] == BigDigits.remaining_time(120, 5)
@@ -0,0 +1,84 @@
+from visual_countdown_timer.timer.broadcast_server import FrameBroadcaster
+from visual_countdown_timer.timer.timer_utils import TickPipeline
+from visual_countdown_timer.timer.timezone_utils import ZoneClock
+import os
+import resource
+import socket
+import pytest
+
+"""
+Tests for the addresses the frame broadcaster listens on.
+"""
+
+
+class TestFrameBroadcaster:
+
+    def test_regular_files_are_not_replaced(self, tmp_path):
+        path = tmp_path / 'notes.txt'
+        path.write_text('my notes\n')
+        with pytest.raises(ValueError):
+            FrameBroadcaster(f'unix:{path}')
+        assert path.read_text() == 'my notes\n'
+
+    def test_stale_sockets_are_replaced_and_live_ones_are_not(self, tmp_path):
+        path = tmp_path / 'timer.sock'
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+        broadcaster = FrameBroadcaster(f'unix:{path}')
+        try:
+            with pytest.raises(ValueError):
+                FrameBroadcaster(f'unix:{path}')
+        finally:
+            broadcaster.close()
+
+    def test_http_port_alone_listens_on_loopback(self):
+        broadcaster = FrameBroadcaster('http:0')
+        try:
+            assert broadcaster._listener.getsockname()[0] == '127.0.0.1'
+        finally:
+            broadcaster.close()
+
+    def test_running_out_of_file_descriptors_pauses_accepting(self, tmp_path, capsys):
+        path = tmp_path / 'timer.sock'
+        broadcaster = FrameBroadcaster(f'unix:{path}')
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(path))
+        soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+        lowest_free_fd = os.dup(0)
+        os.close(lowest_free_fd)
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (lowest_free_fd, hard_limit))
+            broadcaster.poll(0.1)
+            broadcaster.poll(0.1)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft_limit, hard_limit))
+            assert broadcaster.accept_errors == 1
+            assert len(broadcaster) == 0
+            assert capsys.readouterr().out.count('EMFILE') == 1
+
+            broadcaster.resume_accepting()
+            broadcaster.poll(0.1)
+            assert len(broadcaster) == 1
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft_limit, hard_limit))
+            client.close()
+            broadcaster.close()
+
+    def test_frames_come_from_the_tick_pipeline_with_zone_times(self, tmp_path):
+        path = tmp_path / 'timer.sock'
+        broadcaster = FrameBroadcaster(f'unix:{path}')
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(path))
+        try:
+            broadcaster.poll(0.1)
+            pipeline = TickPipeline(25, 24, broadcaster, [ZoneClock('Asia/Tokyo')])
+            state = pipeline.tick(1_700_000_000)
+            pipeline.tick(1_700_000_000)
+            assert pipeline.stage_skips['emit'] == 1
+            client.settimeout(1)
+            received = client.recv(65536).decode()
+            assert ZoneClock('Asia/Tokyo').now(1_700_000_000).strftime('%H:%M') in state.frame_text
+            assert state.frame_text in received
+        finally:
+            client.close()
+            broadcaster.close()
@@ -0,0 +1,81 @@
+from visual_countdown_timer.timer.clock_utils import TickScheduler, VirtualClock, WallClockAlarm
+from visual_countdown_timer.timer.output_sinks import NullSink
+from visual_countdown_timer.timer.timer_utils import TimerLoop
+import pytest
+import sys
+import time
+
+"""
+Tests for the virtual clock and the timer loop running on it.
+"""
+
+START_TIMESTAMP = 1_700_000_000.25
+
+
+class TestVirtualClock:
+
+    def test_sleep_moves_both_clocks(self):
+        clock = VirtualClock(START_TIMESTAMP, wakeup_latency_ns=0)
+        clock.sleep(1.5)
+        assert clock.monotonic_ns() == 1_500_000_000
+        assert clock.time_ns() == clock.start_time_ns + 1_500_000_000
+
+    def test_scheduler_wakes_just_after_each_second(self):
+        clock = VirtualClock(START_TIMESTAMP)
+        scheduler = TickScheduler(clock=clock)
+        for _ in range(100):
+            scheduler.wait_for_next_tick()
+            assert clock.time_ns() % 1_000_000_000 == clock.wakeup_latency_ns
+        assert clock.time_ns() // 1_000_000_000 == int(START_TIMESTAMP) + 100
+        assert (scheduler.missed_ticks, scheduler.clock_jumps) == (0, 0)
+
+    def test_skipped_ticks_take_one_sleep(self):
+        class CountingClock(VirtualClock):
+            sleeps = 0
+
+            def sleep(self, seconds):
+                self.sleeps += 1
+                super().sleep(seconds)
+
+        clock = CountingClock(START_TIMESTAMP)
+        scheduler = TickScheduler(clock=clock)
+        scheduler.wait_for_next_tick(60)
+        assert clock.sleeps == 1
+        assert clock.time_ns() // 1_000_000_000 == int(START_TIMESTAMP) + 60
+
+    @pytest.mark.parametrize('frames_per_second', [10, 30, 50, 60])
+    def test_smooth_frame_intervals_come_due(self, frames_per_second):
+        clock = VirtualClock(START_TIMESTAMP)
+        scheduler = TickScheduler(interval_ns=1_000_000_000 // frames_per_second, clock=clock)
+        for _ in range(frames_per_second):
+            clock.sleep(scheduler.seconds_until_next_tick())
+            assert scheduler.tick_due()
+            scheduler.complete_tick()
+        assert scheduler.missed_ticks == 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='timerfd is only available on Linux')
+class TestWallClockAlarm:
+
+    def test_wakes_at_the_wall_clock_deadline(self):
+        alarm = WallClockAlarm.open()
+        try:
+            deadline_ns = time.time_ns() + 50_000_000
+            alarm.sleep_until(deadline_ns)
+            assert time.time_ns() >= deadline_ns
+            start_ns = time.monotonic_ns()
+            alarm.sleep_until(deadline_ns)
+            assert time.monotonic_ns() - start_ns < 50_000_000
+        finally:
+            alarm.close()
+
+
+class TestSimulatedTimerLoop:
+
+    def test_every_second_of_a_day_is_drawn(self):
+        clock = VirtualClock(START_TIMESTAMP)
+        sink = NullSink()
+        TimerLoop.run(25, 24, sink=sink, clock=clock, until=START_TIMESTAMP + 24 * 60 * 60)
+        # One frame when the loop starts, then one at every second boundary of the day.
+        assert sink.frames_written == 24 * 60 * 60 + 1
+        assert clock.time() >= START_TIMESTAMP + 24 * 60 * 60
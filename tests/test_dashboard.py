@@ -0,0 +1,82 @@
+from visual_countdown_timer.timer.dashboard import Dashboard, DashboardRenderer
+from visual_countdown_timer.timer.output_sinks import NullSink
+from visual_countdown_timer.timer.roster_utils import TimerDefinition
+from visual_countdown_timer.timer.settings import DisplaySettings, TimerConfig
+import os
+import pytest
+
+"""
+Tests for the multi-timer dashboard.
+"""
+
+# Half past a minute, so the next second changes only the seconds of every cell.
+START_TIMESTAMP = 1_700_000_010.25
+
+
+def definitions(count: int) -> list:
+    return [TimerDefinition(row + 2, f'desk {row}', row % 60, 12 if row % 2 else 24) for row in range(count)]
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    def resize(width: int, height: int):
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', width)
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_HEIGHT', height)
+    resize(120, 40)
+    return resize
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    file_descriptor = os.open(tmp_path / 'screen', os.O_RDWR | os.O_CREAT)
+    yield DashboardRenderer(file_descriptor)
+    os.close(file_descriptor)
+
+
+def drawn_since(renderer: DashboardRenderer, offset: int) -> str:
+    """Returns what the renderer wrote after `offset` bytes."""
+    return os.pread(renderer.file_descriptor, 1 << 20, offset).decode()
+
+
+class TestDashboard:
+
+    def test_grid_fits_the_terminal(self, terminal):
+        dashboard = Dashboard(definitions(50), NullSink())
+        dashboard.tick(START_TIMESTAMP)
+        assert (dashboard.columns, dashboard.visible_cells) == (3, 12)
+        assert '38 more timers do not fit' in dashboard.frame_text()
+
+        terminal(34, 1000)
+        dashboard.tick(START_TIMESTAMP + 1)
+        assert (dashboard.columns, dashboard.visible_cells) == (1, 50)
+        assert 'more timers' not in dashboard.frame_text()
+
+    def test_only_changed_lines_are_rewritten(self, terminal, renderer):
+        dashboard = Dashboard(definitions(50), renderer)
+        assert dashboard.tick(START_TIMESTAMP) == 12
+        first_frame = drawn_since(renderer, 0)
+        assert first_frame.count('desk') == 12
+
+        assert dashboard.tick(START_TIMESTAMP + 1) == 12
+        update = drawn_since(renderer, len(first_frame.encode()))
+        # One move to each cell's seconds line, and one to below the grid.
+        assert update.count('\x1b[') == 12 + 1
+        assert 'desk' not in update and 'minutes' not in update
+
+    def test_unchanged_cells_are_skipped(self, terminal, monkeypatch):
+        monkeypatch.setattr(DisplaySettings, 'SHOW_SECONDS', False)
+        sink = NullSink()
+        dashboard = Dashboard(definitions(50), sink)
+        dashboard.tick(START_TIMESTAMP)
+        assert dashboard.tick(START_TIMESTAMP + 1) == 0
+        assert sink.frames_written == 1
+
+    def test_budget_defers_cells_to_later_ticks(self, terminal, renderer):
+        terminal(200, 1000)
+        dashboard = Dashboard(definitions(50), renderer, tick_budget_ns=0)
+        check_interval = TimerConfig.DASHBOARD_BUDGET_CHECK_CELLS
+        assert dashboard.tick(START_TIMESTAMP) == check_interval
+        assert dashboard.cells_deferred == 50 - check_interval
+        for _ in range(3):
+            dashboard.tick(START_TIMESTAMP)
+        assert all(cell.body is not None for cell in dashboard.cells)
@@ -0,0 +1,116 @@
+from visual_countdown_timer.timer.clock_utils import VirtualClock
+from datetime import datetime
+from visual_countdown_timer.timer.notify_utils import (
+    BellAction, CommandAction, FileAppendAction, NotificationAction, Notifier,
+)
+from visual_countdown_timer.timer.output_sinks import NullSink
+from visual_countdown_timer.timer.timer_utils import TimerLoop
+import json
+import os
+import pytest
+import subprocess
+import sys
+import threading
+import time
+
+"""
+Tests for the notifications sent when the countdown reaches its target.
+"""
+
+START_TIMESTAMP = 1_700_000_000.25
+
+
+def run_notifier(notifier: Notifier, clock: VirtualClock, hours: int):
+    """Runs the timer loop on `clock` for `hours`, then waits for the notifier's actions to finish."""
+    TimerLoop.run(
+        notifier.countdown_minutes, 24, sink=NullSink(), clock=clock,
+        until=START_TIMESTAMP + hours * 60 * 60, notifier=notifier,
+    )
+    notifier._executor.shutdown(wait=True)
+
+
+def process_is_gone(pid: int) -> bool:
+    """Checks whether a process has exited, counting a zombie waiting to be reaped as gone."""
+    try:
+        with open(f'/proc/{pid}/stat') as stat_file:
+            return stat_file.read().rpartition(')')[2].split()[0] == 'Z'
+    except FileNotFoundError:
+        return True
+
+
+class TestNotifier:
+
+    def test_each_target_is_notified_once(self, tmp_path):
+        clock = VirtualClock(START_TIMESTAMP)
+        log_path = tmp_path / 'zero.jsonl'
+        notifier = Notifier(25, [FileAppendAction(str(log_path))], clock)
+        run_notifier(notifier, clock, 3)
+
+        lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [line['target'][14:16] for line in lines] == ['25', '25', '25']
+        assert len({line['target'] for line in lines}) == 3
+        assert (notifier.targets_reached, notifier.succeeded, notifier.failed) == (3, 3, 0)
+        assert notifier.latencies['file'].count == 3
+
+    def test_slow_and_failing_commands(self):
+        clock = VirtualClock(START_TIMESTAMP)
+        notifier = Notifier(25, [CommandAction('sleep 5'), CommandAction('exit 1')], clock, timeout_seconds=0.1)
+        run_notifier(notifier, clock, 1)
+        assert (notifier.succeeded, notifier.failed, notifier.timed_out, notifier.skipped) == (0, 1, 1, 0)
+
+    def test_actions_are_skipped_when_too_many_are_pending(self):
+        clock = VirtualClock(START_TIMESTAMP)
+        notifier = Notifier(
+            25, [CommandAction('sleep 1')] * 3, clock, max_workers=1, max_pending=2, timeout_seconds=2,
+        )
+        run_notifier(notifier, clock, 1)
+        assert (notifier.succeeded, notifier.skipped) == (2, 1)
+
+    def test_actions_that_never_return_free_their_slot_at_the_deadline(self):
+        released = threading.Event()
+
+        class BlockedAction(NotificationAction):
+            name = 'blocked'
+
+            def run(self, target_datetime, fired_datetime, timeout_seconds):
+                released.wait()
+
+        clock = VirtualClock(START_TIMESTAMP)
+        notifier = Notifier(25, [BlockedAction()], clock, max_workers=1, max_pending=1, timeout_seconds=0.05)
+        try:
+            run_notifier(notifier, clock, 3)
+            assert (notifier.timed_out, notifier.skipped) == (3, 0)
+        finally:
+            released.set()
+
+    def test_fifos_without_a_reader_fail_instead_of_blocking(self, tmp_path):
+        fifo_path = tmp_path / 'zero.fifo'
+        os.mkfifo(fifo_path)
+        clock = VirtualClock(START_TIMESTAMP)
+        notifier = Notifier(25, [FileAppendAction(str(fifo_path))], clock, timeout_seconds=5)
+        run_notifier(notifier, clock, 1)
+        assert (notifier.failed, notifier.timed_out) == (1, 0)
+
+
+class TestNotificationActions:
+
+    def test_bell_does_not_overwrite_a_redirected_stderr(self, tmp_path, monkeypatch):
+        with open(tmp_path / 'out.log', 'w') as stdout_file, open(tmp_path / 'err.log', 'w') as stderr_file:
+            monkeypatch.setattr(sys, 'stdout', stdout_file)
+            monkeypatch.setattr(sys, 'stderr', stderr_file)
+            os.write(stderr_file.fileno(), b'before\n')
+            BellAction().run(datetime.now(), datetime.now(), 1)
+            os.write(stderr_file.fileno(), b'after\n')
+        assert (tmp_path / 'err.log').read_bytes() == b'before\n\aafter\n'
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason='reads /proc')
+    def test_timed_out_commands_are_killed_with_their_children(self, tmp_path):
+        pid_path = tmp_path / 'child.pid'
+        action = CommandAction(f'sleep 30 & echo $! > {pid_path}; wait')
+        with pytest.raises(subprocess.TimeoutExpired):
+            action.run(datetime.now(), datetime.now(), 0.5)
+        child_pid = int(pid_path.read_text())
+        deadline = time.monotonic() + 2
+        while not process_is_gone(child_pid) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert process_is_gone(child_pid)
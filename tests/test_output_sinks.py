@@ -0,0 +1,50 @@
+from visual_countdown_timer.timer.output_sinks import LogSink, PipeSink
+import os
+
+"""
+Tests for the pipe and log output sinks.
+"""
+
+
+class TestPipeSink:
+
+    def test_the_shared_pipe_stays_blocking(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            sink = PipeSink(write_fd)
+            sink.draw('  25 minutes left\n  ====')
+            assert os.get_blocking(write_fd)
+            assert sink.drops_stale_frames
+            sink.close()
+            assert os.get_blocking(write_fd)
+            assert os.read(read_fd, 1024) == b'25 minutes left\n'
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_frames_are_dropped_when_the_reader_falls_behind(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            sink = PipeSink(write_fd)
+            for second in range(20000):
+                sink.draw(f'{second:05} seconds left ' + '.' * 100)
+            assert sink.frames_dropped > 0
+            sink.close()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+class TestLogSink:
+
+    def test_an_open_file_shares_its_offset_with_other_writes(self, tmp_path):
+        file_descriptor = os.open(tmp_path / 'out.log', os.O_WRONLY | os.O_CREAT)
+        try:
+            os.write(file_descriptor, b'title\n')
+            sink = LogSink(file_descriptor=file_descriptor)
+            sink.draw('  25 minutes left')
+            sink.close()
+            os.write(file_descriptor, b'stopped\n')
+        finally:
+            os.close(file_descriptor)
+        assert (tmp_path / 'out.log').read_text() == 'title\n  25 minutes left\nstopped\n'
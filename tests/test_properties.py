@@ -0,0 +1,382 @@
+from datetime import datetime, timedelta, timezone
+from hypothesis import given, settings, strategies
+from visual_countdown_timer.timer import batch_calculate
+from visual_countdown_timer.timer.batch_calculate import BatchCalculate
+from visual_countdown_timer.timer.big_digits import BigDigits
+from visual_countdown_timer.timer.display_utils import ProgressBar, UserDisplay
+from visual_countdown_timer.timer.output_sinks import NullSink
+from visual_countdown_timer.timer.schedule_utils import Schedule
+from visual_countdown_timer.timer.settings import DisplaySettings
+from visual_countdown_timer.timer.system_utils import SystemUtils, TerminalUtils
+from visual_countdown_timer.timer.timer_utils import Calculate, Format, FrameTable, RefreshPlanner, TickPipeline, TimerLoop
+from visual_countdown_timer.timer.timezone_utils import ZoneClock
+from zoneinfo import ZoneInfo
+import contextlib
+import math
+import os
+import pytest
+import signal
+import textwrap
+import time
+
+"""
+Property-based correctness tests for the per-tick functions of the Visual Countdown Timer.
+"""
+
+# Fixed UTC offsets from -12:00 to +14:00 in quarter hours, like the ones astimezone() produces.
+utc_offsets = strategies.integers(min_value=-48, max_value=56).map(lambda quarters: timezone(timedelta(minutes=15 * quarters)))
+aware_datetimes = strategies.builds(
+    lambda naive_datetime, offset: naive_datetime.replace(tzinfo=offset),
+    strategies.datetimes(min_value=datetime(2000, 1, 1), max_value=datetime(2100, 1, 1)),
+    utc_offsets,
+)
+target_minutes = strategies.integers(min_value=0, max_value=59)
+hour_formats = strategies.sampled_from((12, 24))
+
+
+class TestCalculate:
+
+    @given(target_minutes, aware_datetimes)
+    def test_remaining_seconds_within_one_hour(self, target_minute, current_datetime):
+        next_occurrence = Calculate.next_countdown_occurrence(target_minute, current_datetime)
+        assert 0 <= Calculate.remaining_seconds(next_occurrence, current_datetime) <= 3600
+
+    @given(target_minutes, aware_datetimes)
+    def test_next_occurrence_is_target_minute_after_now(self, target_minute, current_datetime):
+        next_occurrence = Calculate.next_countdown_occurrence(target_minute, current_datetime)
+        assert next_occurrence > current_datetime
+        assert (next_occurrence.minute, next_occurrence.second, next_occurrence.microsecond) == (target_minute, 0, 0)
+
+    @given(
+        strategies.sets(strategies.integers(0, 59), min_size=1, max_size=4),
+        strategies.sets(strategies.integers(0, 23), min_size=1, max_size=4),
+        strategies.sets(strategies.integers(0, 6), min_size=1),
+        aware_datetimes,
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_schedule_matches_minute_by_minute_search(self, minutes, hours, days_of_week, current_datetime):
+        schedule = Schedule(
+            f"{','.join(map(str, minutes))} {','.join(map(str, hours))} * * {','.join(map(str, days_of_week))}"
+        )
+        candidate = current_datetime.replace(second=0, microsecond=0)
+        while True:
+            candidate += timedelta(minutes=1)
+            if candidate.minute in minutes and candidate.hour in hours and (candidate.weekday() + 1) % 7 in days_of_week:
+                break
+        assert schedule.next_occurrence(current_datetime) == candidate
+
+
+# Zones with whole-hour, half-hour (Lord Howe) and 45-minute (Chatham) offsets, with and without DST.
+zone_clocks = {zone_name: ZoneClock(zone_name) for zone_name in (
+    'UTC', 'America/New_York', 'Europe/London', 'Australia/Lord_Howe', 'Pacific/Chatham', 'Asia/Kolkata',
+)}
+# Every instant a zone's offset changes in 2026.
+dst_transitions = []
+for zone_name in zone_clocks:
+    clock = ZoneClock(zone_name)
+    clock._precompute_transitions(int(datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()))
+    dst_transitions += [(zone_name, transition) for transition in clock._transitions[1:]]
+# Seconds around DST transitions, around quarter-hour UTC boundaries (every local hour and day
+# boundary, including New Year, in all of the zones above), and anywhere from 2000 to 2100.
+epoch_timestamps = strategies.one_of(
+    strategies.tuples(strategies.sampled_from(dst_transitions), strategies.integers(-7200, 7200)).map(
+        lambda transition_and_delta: (transition_and_delta[0][0], transition_and_delta[0][1] + transition_and_delta[1])
+    ),
+    strategies.tuples(
+        strategies.sampled_from(sorted(zone_clocks)),
+        strategies.builds(lambda quarter_hour, delta: quarter_hour * 900 + delta,
+                          strategies.integers(946_684_800 // 900, 4_102_444_800 // 900), strategies.integers(-90, 90)),
+    ),
+)
+
+
+@pytest.mark.skipif(batch_calculate.numpy is None, reason='NumPy is not installed')
+class TestBatchCalculate:
+
+    @given(epoch_timestamps, target_minutes)
+    @settings(max_examples=500, deadline=None)
+    def test_matches_scalar_calculations(self, zone_and_timestamp, target_minute):
+        zone_name, timestamp = zone_and_timestamp
+        current_datetime = zone_clocks[zone_name].now(timestamp)
+        next_occurrence = Calculate.next_countdown_occurrence(target_minute, current_datetime)
+        remaining_seconds = Calculate.remaining_seconds(next_occurrence, current_datetime)
+
+        utc_offset_seconds = int(current_datetime.utcoffset().total_seconds())
+        batch_next_occurrences = BatchCalculate.next_countdown_occurrences([timestamp], target_minute, utc_offset_seconds)
+        batch_remaining_seconds = BatchCalculate.remaining_seconds(batch_next_occurrences, [timestamp])
+        width_remaining, width_elapsed = BatchCalculate.progress_bar_widths(batch_remaining_seconds)
+        assert batch_next_occurrences[0] == next_occurrence.timestamp()
+        assert batch_remaining_seconds[0] == remaining_seconds
+        assert (width_remaining[0], width_elapsed[0]) == ProgressBar._text_width(remaining_seconds)
+
+
+@contextlib.contextmanager
+def local_timezone(zone_name):
+    """Makes `zone_name` the process's local timezone for the duration of the block."""
+    saved_tz = os.environ.get('TZ')
+    os.environ['TZ'] = zone_name
+    time.tzset()
+    try:
+        yield
+    finally:
+        if saved_tz is None:
+            del os.environ['TZ']
+        else:
+            os.environ['TZ'] = saved_tz
+        time.tzset()
+
+
+class TestScheduleDaylightSaving:
+
+    @given(
+        strategies.sets(strategies.integers(0, 59), min_size=1, max_size=3),
+        strategies.sets(strategies.integers(0, 23), min_size=1, max_size=3),
+        strategies.sampled_from(('*', '1,15,29', '*/2')),
+        strategies.sets(strategies.integers(0, 6), min_size=1),
+        strategies.sampled_from([transition for transition in dst_transitions if transition[0] != 'UTC']),
+        strategies.integers(-2 * 24 * 60 * 60, 2 * 24 * 60 * 60),
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_matches_a_search_in_local_time(self, minutes, hours, days_of_month, days_of_week, transition, delta):
+        zone_name, transition_timestamp = transition
+        schedule = Schedule(
+            f"{','.join(map(str, minutes))} {','.join(map(str, hours))} {days_of_month} * "
+            f"{','.join(map(str, days_of_week))}"
+        )
+        zone = ZoneInfo(zone_name)
+        with local_timezone(zone_name):
+            current_datetime = datetime.fromtimestamp(transition_timestamp + delta).astimezone()
+            next_occurrence = schedule.next_occurrence(current_datetime)
+
+        # The first instant after the current minute whose local time matches, skipping the
+        # second pass through the repeated hour of a fall-back change.
+        days = {'*': range(1, 32), '1,15,29': (1, 15, 29), '*/2': range(1, 32, 2)}[days_of_month]
+        candidate = current_datetime.astimezone(timezone.utc).replace(second=0, microsecond=0)
+        while True:
+            candidate += timedelta(minutes=1)
+            local = candidate.astimezone(zone)
+            day_of_month_matches = local.day in days
+            day_of_week_matches = (local.weekday() + 1) % 7 in days_of_week
+            if days_of_month != '*' and len(days_of_week) < 7:
+                day_matches = day_of_month_matches or day_of_week_matches
+            else:
+                day_matches = day_of_month_matches and day_of_week_matches
+            if not local.fold and local.minute in minutes and local.hour in hours and day_matches:
+                break
+        assert next_occurrence == candidate
+        assert next_occurrence.utcoffset() == local.utcoffset()
+
+
+class TestProgressBar:
+
+    @given(strategies.integers(min_value=0, max_value=10 * 24 * 3600))
+    def test_bar_widths_sum_to_total(self, remaining_seconds):
+        width_remaining, width_elapsed = ProgressBar._text_width(remaining_seconds)
+        assert width_remaining >= 0 and width_elapsed >= 0
+        assert width_remaining + width_elapsed == DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL
+
+    @given(strategies.integers(min_value=0, max_value=3600))
+    def test_rendered_bar_has_fixed_length(self, remaining_seconds):
+        progress_bar_text = ProgressBar.render(remaining_seconds)
+        assert len(progress_bar_text) == DisplaySettings.PROGRESS_BAR_WIDTH_TOTAL + 2
+        assert progress_bar_text.strip('[#.]') == ''
+
+    @given(strategies.integers(min_value=0, max_value=3599))
+    def test_bar_never_grows_as_time_passes(self, remaining_seconds):
+        assert ProgressBar._text_width(remaining_seconds)[0] <= ProgressBar._text_width(remaining_seconds + 1)[0]
+
+
+class TestFormat:
+
+    @given(aware_datetimes, hour_formats)
+    def test_cached_time_matches_direct_formatting(self, current_datetime, hour_format):
+        if hour_format == 12:
+            time_formatted = Format._time_12h(current_datetime)
+        else:
+            time_formatted = Format._time_24h(current_datetime)
+        assert Format.time(current_datetime, hour_format) == f"{time_formatted} {current_datetime.strftime('%Z')}"
+
+    @given(aware_datetimes)
+    def test_cached_date_matches_strftime(self, current_datetime):
+        assert Format.date(current_datetime) == current_datetime.strftime('%B %d, %Y')
+
+    @given(strategies.integers(min_value=0, max_value=59), strategies.integers(min_value=0, max_value=59))
+    def test_remaining_time_shows_both_units(self, remaining_minutes, remaining_seconds):
+        minutes_line, seconds_line = Format.remaining_time(remaining_minutes, remaining_seconds).split('\n')
+        assert minutes_line.split() == [f'{remaining_minutes:02}', 'minute' if remaining_minutes == 1 else 'minutes']
+        assert seconds_line.split() == [f'{remaining_seconds:02}', 'second' if remaining_seconds == 1 else 'seconds']
+
+
+def original_fragments(total_seconds):
+    """The remaining-time and progress-bar text built with Format, ProgressBar and BigDigits directly."""
+    if DisplaySettings.SHOW_SECONDS:
+        remaining_minutes, remaining_seconds = divmod(total_seconds, 60)
+        remaining_time = Format.remaining_time(remaining_minutes, remaining_seconds)
+        progress_bar_text = ProgressBar.render(total_seconds)
+    else:
+        true_seconds = min(total_seconds + 1, FrameTable.MAX_SECONDS)
+        remaining_minutes, remaining_seconds = math.ceil(true_seconds / 60), None
+        remaining_time = Format._remaining_times_combined(*Format._remaining_hours_and_minutes(remaining_minutes))
+        progress_bar_text = ProgressBar.render(true_seconds)
+    if DisplaySettings.BIG_DIGITS:
+        remaining_time = BigDigits.remaining_time(remaining_minutes, remaining_seconds) or remaining_time
+    return remaining_time, progress_bar_text
+
+
+class TestFrameTable:
+
+    @pytest.mark.parametrize('show_seconds', (True, False))
+    def test_table_matches_original_rendering(self, monkeypatch, show_seconds):
+        monkeypatch.setattr(DisplaySettings, 'SHOW_SECONDS', show_seconds)
+        FrameTable.build()
+        for total_seconds in range(FrameTable.MAX_SECONDS + 1):
+            assert FrameTable.lookup(total_seconds) == original_fragments(total_seconds)
+
+    @pytest.mark.parametrize('show_seconds', (True, False))
+    def test_table_is_rebuilt_when_the_width_changes(self, monkeypatch, show_seconds):
+        monkeypatch.setattr(DisplaySettings, 'SHOW_SECONDS', show_seconds)
+        monkeypatch.setattr(DisplaySettings, 'BIG_DIGITS', True)
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 80)
+        FrameTable.build()
+        wide_fragments = FrameTable.lookup(1499)
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 40)
+        monkeypatch.setattr(DisplaySettings, 'PROGRESS_BAR_WIDTH_TOTAL', 20)
+        assert FrameTable.lookup(1499) != wide_fragments
+        for total_seconds in range(FrameTable.MAX_SECONDS + 1):
+            assert FrameTable.lookup(total_seconds) == original_fragments(total_seconds)
+
+
+@pytest.fixture(scope='class')
+def seconds_hidden():
+    saved_show_seconds = DisplaySettings.SHOW_SECONDS
+    DisplaySettings.SHOW_SECONDS = False
+    yield
+    DisplaySettings.SHOW_SECONDS = saved_show_seconds
+
+
+@pytest.mark.usefixtures('seconds_hidden')
+class TestRefreshPlanner:
+
+    @given(
+        strategies.one_of(target_minutes, strategies.sampled_from(('0 9 * * mon', '30 */4 * * *', '0 0 1 1 *')).map(Schedule)),
+        strategies.datetimes(min_value=datetime(2000, 1, 1), max_value=datetime(2100, 1, 1)).map(
+            lambda naive_datetime: naive_datetime.replace(microsecond=0, tzinfo=timezone.utc)
+        ),
+    )
+    @settings(max_examples=300, deadline=None)
+    def test_matches_the_first_change_in_the_frame_table(self, countdown_minutes, current_datetime):
+        end_of_current_loop = Calculate.next_countdown_occurrence(countdown_minutes, current_datetime)
+        total_seconds = Calculate.remaining_seconds(end_of_current_loop, current_datetime)
+        expected_ticks = 60 - current_datetime.second
+        for ticks in range(1, expected_ticks):
+            if ticks > total_seconds or FrameTable.lookup(total_seconds - ticks) != FrameTable.lookup(total_seconds):
+                expected_ticks = ticks
+                break
+        pipeline = TickPipeline(countdown_minutes, 24, NullSink(), local_clock=zone_clocks['UTC'])
+        state = pipeline.tick(current_datetime.timestamp())
+        ticks = RefreshPlanner.ticks_until_visible_change(state)
+        # Exactly one hour left is the one case redrawn a tick early, without a visible change.
+        assert ticks == expected_ticks or (total_seconds == FrameTable.MAX_SECONDS and ticks < expected_ticks)
+
+
+class TestTickPipeline:
+
+    @given(
+        target_minutes,
+        hour_formats,
+        strategies.floats(min_value=0, max_value=4e9),
+        strategies.lists(strategies.sampled_from((0.25, 1, 1, 1, 59, 61, 3600, 86400)), max_size=100),
+    )
+    @settings(deadline=None)
+    def test_incremental_frames_match_full_rendering(self, target_minute, hour_format, start_timestamp, steps):
+        pipeline = TickPipeline(target_minute, hour_format, NullSink())
+        timestamp = start_timestamp
+        for step in (0, *steps):
+            timestamp += step
+            state = pipeline.tick(timestamp)
+            assert state.frame_text == TimerLoop.render_frame(
+                target_minute, hour_format, ZoneClock.local().now(timestamp)
+            )
+        for stage in TickPipeline.STAGES:
+            assert pipeline.stage_runs[stage] + pipeline.stage_skips[stage] == len(steps) + 1
+
+    def test_unchanged_inputs_skip_stages(self, monkeypatch):
+        calculations = []
+        next_countdown_occurrence = Calculate.next_countdown_occurrence
+        monkeypatch.setattr(Calculate, 'next_countdown_occurrence', lambda *arguments: calculations.append(arguments)
+                            or next_countdown_occurrence(*arguments))
+        pipeline = TickPipeline(25, 12, NullSink())
+        pipeline.tick(1_700_000_000.2)
+        RefreshPlanner.ticks_until_visible_change(pipeline.state)
+        assert len(calculations) == 1
+        pipeline.tick(1_700_000_000.7)
+        RefreshPlanner.ticks_until_visible_change(pipeline.state)
+        assert len(calculations) == 1
+        assert pipeline.stage_runs == {'sample': 2, 'calculate': 1, 'format': 1, 'layout': 1, 'emit': 1}
+        with pytest.raises(AttributeError):
+            pipeline.state.frame_text = ''
+
+
+class TestUserDisplay:
+
+    @given(aware_datetimes, target_minutes, hour_formats)
+    def test_display_contains_every_fragment_in_order(self, current_datetime, target_minute, hour_format):
+        next_occurrence = Calculate.next_countdown_occurrence(target_minute, current_datetime)
+        total_seconds = Calculate.remaining_seconds(next_occurrence, current_datetime)
+        fragments = [
+            Format.date(current_datetime),
+            Format.time(current_datetime, hour_format),
+            Format.time(next_occurrence, hour_format),
+            *FrameTable.lookup(total_seconds),
+        ]
+        timer_display_text = UserDisplay.show_timer_display(*fragments)
+        assert timer_display_text.startswith(UserDisplay.TITLE_BLOCK)
+        position = 0
+        for fragment in fragments:
+            position = timer_display_text.index(fragment, position) + len(fragment)
+
+
+class TestWrapText:
+
+    @given(
+        strategies.lists(
+            strategies.text(alphabet='abcdefgh ', max_size=80), max_size=8
+        ).map('\n'.join),
+        strategies.integers(min_value=10, max_value=120),
+    )
+    def test_matches_textwrap_and_fits_width(self, unformatted_text, terminal_width):
+        saved_width = DisplaySettings.TERMINAL_WINDOW_WIDTH
+        DisplaySettings.TERMINAL_WINDOW_WIDTH = terminal_width
+        try:
+            wrapped_text = SystemUtils.wrap_text(unformatted_text, extra_linebreaks_desired=False)
+        finally:
+            DisplaySettings.TERMINAL_WINDOW_WIDTH = saved_width
+
+        expected_lines = [
+            textwrap.fill(line, width=terminal_width) for line in unformatted_text.splitlines() if line.strip()
+        ]
+        expected_text = '\n'.join(expected_lines)
+        if unformatted_text.rstrip('\n').endswith(' '):
+            expected_text += ' '
+        assert wrapped_text == expected_text
+        assert all(len(line) <= terminal_width for line in wrapped_text.rstrip(' ').split('\n'))
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGWINCH'), reason='needs SIGWINCH')
+    def test_resizing_rewraps_without_touching_the_cache(self, monkeypatch):
+        line = ' '.join(['abcdefgh'] * 10)
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_WIDTH', 40)
+        monkeypatch.setattr(DisplaySettings, 'TERMINAL_WINDOW_HEIGHT', DisplaySettings.TERMINAL_WINDOW_HEIGHT)
+        SystemUtils.wrap_text(line)
+        cached_lines = len(SystemUtils._layout_cache)
+
+        previous_handler = signal.getsignal(signal.SIGWINCH)
+        monkeypatch.setenv('COLUMNS', '30')
+        TerminalUtils.initialize_resize_handler()
+        try:
+            signal.raise_signal(signal.SIGWINCH)
+        finally:
+            signal.signal(signal.SIGWINCH, previous_handler)
+
+        assert DisplaySettings.TERMINAL_WINDOW_WIDTH == 30
+        assert len(SystemUtils._layout_cache) == cached_lines
+        assert SystemUtils.wrap_text(line) == textwrap.fill(line, width=30)
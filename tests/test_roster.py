@@ -0,0 +1,85 @@
+from hypothesis import given, strategies
+from visual_countdown_timer.timer.roster_utils import Roster
+from visual_countdown_timer.timer.schedule_utils import Schedule
+from visual_countdown_timer.timer.validation_checks import InputCheck
+import pytest
+
+"""
+Tests for roster loading and the pure validation checks behind it.
+"""
+
+
+class TestInputCheck:
+
+    @given(strategies.integers())
+    def test_integers_and_their_text_are_whole_numbers(self, number):
+        assert InputCheck.integer(number) is None
+        assert InputCheck.integer(str(number)) is None
+
+    @pytest.mark.parametrize('value', ('abc', '', '2.5', None, True, 12.0, [1]))
+    def test_other_values_are_not_whole_numbers(self, value):
+        assert InputCheck.integer(value) == 'must be a whole number'
+
+    @given(strategies.integers(min_value=-100, max_value=100))
+    def test_minutes_range(self, minute):
+        assert (InputCheck.minutes_range(minute) is None) == (0 <= minute <= 59)
+
+    def test_checks_do_not_print(self, capsys):
+        InputCheck.integer('abc')
+        InputCheck.minutes_range(75)
+        InputCheck.hour_display_format(13)
+        InputCheck.schedule('not a schedule')
+        assert capsys.readouterr().out == ''
+
+
+class TestRoster:
+
+    def test_csv_rows_are_validated_in_one_pass(self, tmp_path):
+        roster_path = tmp_path / 'roster.csv'
+        roster_path.write_text(
+            'label,target,hour_format\n'
+            'standup,25,12\n'
+            'lunch,"0 12 * * mon-fri",24\n'
+            'late,75,13\n'
+            'hourly,"15 * * * *",24\n'
+            'empty,,\n'
+        )
+        roster = Roster(str(roster_path))
+        entries = list(roster.entries())
+
+        definitions = [definition for definition, errors in entries if definition is not None]
+        assert [(definition.row, definition.label, definition.hour_format) for definition in definitions] == [
+            (2, 'standup', 12), (3, 'lunch', 24), (5, 'hourly', 24),
+        ]
+        assert definitions[0].countdown_minutes == 25
+        assert isinstance(definitions[1].countdown_minutes, Schedule)
+        assert definitions[2].countdown_minutes == 15
+
+        errors = [error for definition, errors in entries for error in errors]
+        assert [(error.row, error.field, error.value, error.message) for error in errors] == [
+            (4, 'target', '75', 'must be between 0 and 59'),
+            (4, 'hour_format', '13', 'must be 12 or 24'),
+            (6, 'target', '', 'is missing'),
+            (6, 'hour_format', '', 'is missing'),
+        ]
+        assert (roster.rows_read, roster.rows_invalid) == (5, 2)
+
+    def test_json_lines_rows(self, tmp_path):
+        roster_path = tmp_path / 'roster.jsonl'
+        roster_path.write_text(
+            '{"label": "a", "target": 5, "hour_format": 24}\n'
+            '\n'
+            '[1]\n'
+            '{"target": "0 25 * * *", "hour_format": "12"}\n'
+            '{not json\n'
+            '{"target": true, "hour_format": 12}\n'
+        )
+        roster = Roster(str(roster_path))
+        assert [definition.label for definition in roster.definitions()] == ['a']
+        assert roster.rows_invalid == 4
+
+    def test_csv_without_required_column(self, tmp_path):
+        roster_path = tmp_path / 'roster.csv'
+        roster_path.write_text('label,target\nstandup,25\n')
+        with pytest.raises(ValueError):
+            list(Roster(str(roster_path)).entries())
@@ -0,0 +1,121 @@
+from visual_countdown_timer.timer.output_sinks import NullSink
+from visual_countdown_timer.timer.shared_frame import SharedFramePublisher, SharedFrameViewer
+import os
+import pytest
+import struct
+
+"""
+Tests for taking over shared frame segments, and for viewers reading them.
+"""
+
+
+class TestSharedFramePublisher:
+
+    NAME = f'vct_test_{os.getpid()}'
+
+    def test_live_publishers_are_not_replaced(self):
+        publisher = SharedFramePublisher(self.NAME)
+        try:
+            with pytest.raises(ValueError):
+                SharedFramePublisher(self.NAME)
+        finally:
+            publisher.close()
+
+    def test_segments_left_by_exited_publishers_are_replaced(self):
+        publisher = SharedFramePublisher(self.NAME)
+        SharedFramePublisher.PUBLISHER_PID.pack_into(publisher._memory.buf, SharedFramePublisher.HEADER.size, 0)
+        replacement = SharedFramePublisher(self.NAME)
+        replacement.close()
+
+
+class InterleavedHeader(struct.Struct):
+    """The segment header format, calling back after every write and every read of the header."""
+
+    def __init__(self, after_pack=None, after_unpack=None):
+        super().__init__(SharedFramePublisher.HEADER.format)
+        self.after_pack = after_pack
+        self.after_unpack = after_unpack
+
+    def pack_into(self, buffer, offset, *values):
+        super().pack_into(buffer, offset, *values)
+        if self.after_pack is not None:
+            self.after_pack()
+
+    def unpack_from(self, buffer, offset=0):
+        values = super().unpack_from(buffer, offset)
+        if self.after_unpack is not None:
+            self.after_unpack()
+        return values
+
+
+class TestSharedFrameViewer:
+
+    NAME = f'vct_viewer_test_{os.getpid()}'
+
+    @staticmethod
+    def frame(number: int) -> str:
+        """A frame whose length and every part depend on its number, so a torn read shows."""
+        return f'{number:06d}|' * (1 + number % 97)
+
+    def test_frames_written_during_a_read_are_never_torn(self, monkeypatch):
+        publisher = SharedFramePublisher(self.NAME)
+        viewer = SharedFrameViewer(self.NAME)
+        header_reads = 0
+        latest = 0
+
+        def publish():
+            nonlocal latest
+            latest += 1
+            publisher.draw(self.frame(latest))
+
+        def publish_during_first_header_read():
+            nonlocal header_reads
+            header_reads += 1
+            if header_reads == 1:
+                publish()
+
+        monkeypatch.setattr(
+            SharedFramePublisher, 'HEADER', InterleavedHeader(after_unpack=publish_during_first_header_read)
+        )
+        try:
+            for _ in range(200):
+                publish()
+                header_reads = 0
+                # The header read first is the previous frame's; the text read after it is already the next one's.
+                assert viewer.read_frame() == self.frame(latest)
+                assert viewer._last_sequence == publisher._sequence
+        finally:
+            monkeypatch.undo()
+            viewer.close()
+            publisher.close()
+
+    def test_viewers_only_see_whole_frames_while_one_is_written(self, monkeypatch):
+        publisher = SharedFramePublisher(self.NAME)
+        viewer = SharedFrameViewer(self.NAME)
+        frames_read = []
+        monkeypatch.setattr(
+            SharedFramePublisher, 'HEADER', InterleavedHeader(after_pack=lambda: frames_read.append(viewer.read_frame()))
+        )
+        try:
+            for number in range(1, 201):
+                publisher.draw(self.frame(number))
+        finally:
+            monkeypatch.undo()
+            viewer.close()
+            publisher.close()
+        # Each frame is read while half written, when there is nothing new to show, and once complete.
+        assert frames_read == [item for number in range(1, 201) for item in (None, self.frame(number))]
+
+    def test_stops_when_the_publisher_is_gone(self):
+        publisher = SharedFramePublisher(self.NAME, frame_interval_ns=10_000_000)
+        SharedFramePublisher.PUBLISHER_PID.pack_into(publisher._memory.buf, SharedFramePublisher.HEADER.size, 0)
+        publisher.draw('00:25')
+        viewer = SharedFrameViewer(self.NAME)
+        sink = NullSink()
+        try:
+            viewer.run(sink)
+        finally:
+            publisher.close()
+        assert viewer.frame_interval_ns == 10_000_000
+        assert viewer.publisher_gone and not viewer.closed
+        assert sink.frames_written == 1
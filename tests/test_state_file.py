@@ -0,0 +1,71 @@
+from visual_countdown_timer.timer.schedule_utils import Schedule
+from visual_countdown_timer.timer.state_file import StateFile
+import pytest
+import zlib
+
+"""
+Tests for opening, locking and saving the state file, and for its ring of tick records.
+"""
+
+
+class TestStateFile:
+
+    def test_other_files_are_left_alone(self, tmp_path):
+        notes_path = tmp_path / 'notes.txt'
+        notes_path.write_text('my notes\n')
+        with pytest.raises(ValueError):
+            StateFile(str(notes_path))
+        assert notes_path.read_text() == 'my notes\n'
+
+    def test_empty_file_becomes_a_state_file(self, tmp_path):
+        state_path = tmp_path / 'timer.state'
+        state_path.touch()
+        state_file = StateFile(str(state_path))
+        state_file.save_configuration(25, 12)
+        state_file.close()
+        state_file = StateFile(str(state_path))
+        assert state_file.configuration() == (25, 12)
+        state_file.close()
+
+    def test_long_schedules_are_not_saved(self, tmp_path):
+        state_file = StateFile(str(tmp_path / 'timer.state'))
+        with pytest.raises(ValueError):
+            state_file.save_configuration(Schedule(','.join(map(str, range(60))) + ' * * * *'), 24)
+        assert state_file.configuration() == (None, None)
+        state_file.close()
+
+    def test_a_file_in_use_is_refused(self, tmp_path):
+        state_path = str(tmp_path / 'timer.state')
+        state_file = StateFile(state_path)
+        try:
+            with pytest.raises(ValueError, match='in use'):
+                StateFile(state_path)
+        finally:
+            state_file.close()
+        StateFile(state_path).close()
+
+    @pytest.mark.parametrize('tick_count', [0, 1, 3, 4, 5, 11])
+    def test_ring_keeps_the_latest_ticks_across_reopening(self, tmp_path, tick_count):
+        state_path = str(tmp_path / 'timer.state')
+        ticks = [
+            (1_700_000_000_000_000_000 + tick * 1_000_000_000, tick * 1000, f'frame {tick}') for tick in range(tick_count)
+        ]
+        state_file = StateFile(state_path, capacity=4)
+        for tick in ticks:
+            state_file.record_tick(*tick)
+        state_file.save_configuration(25, 12)
+        state_file.close()
+
+        state_file = StateFile(state_path)
+        try:
+            assert state_file.capacity == 4
+            assert state_file.configuration() == (25, 12)
+            assert state_file.records() == [
+                (timestamp_ns, lateness_ns, zlib.crc32(frame_text.encode()))
+                for timestamp_ns, lateness_ns, frame_text in ticks[-4:]
+            ]
+            header = StateFile.HEADER_FORMAT.unpack_from(state_file._map)
+            ring_position = StateFile.RING_POSITION_FORMAT.unpack_from(state_file._map, StateFile.RING_POSITION_OFFSET)
+            assert ring_position == header[5:7] == (tick_count % 4, tick_count)
+        finally:
+            state_file.close()
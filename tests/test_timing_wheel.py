@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta, timezone
+from visual_countdown_timer.timer.timing_wheel import CountdownWheel
+import pytest
+
+"""
+Tests for the targets a countdown wheel accepts and fires.
+"""
+
+START = datetime(2026, 3, 14, 9, 0, 0, tzinfo=timezone.utc)
+
+
+class TestCountdownWheel:
+
+    @pytest.mark.parametrize('target_minute', [-1, 60, 3600, 25.0, 'twenty', True, None])
+    def test_targets_outside_the_hour_are_refused(self, target_minute):
+        wheel = CountdownWheel(START)
+        with pytest.raises(ValueError):
+            wheel.add(target_minute, lambda target, occurrence: None)
+        assert len(wheel) == 0
+
+    @pytest.mark.parametrize('target_minute', [0, 59])
+    def test_first_and_last_minutes_fire(self, target_minute):
+        fired = []
+        wheel = CountdownWheel(START - timedelta(seconds=1))
+        wheel.add(target_minute, lambda target, occurrence: fired.append(occurrence))
+        wheel.advance(START + timedelta(minutes=30))
+        wheel.advance(START + timedelta(minutes=60))
+        expected = [START + timedelta(minutes=target_minute)]
+        if target_minute == 0:
+            expected.append(START + timedelta(hours=1))
+        assert fired == expected